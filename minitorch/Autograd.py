@@ -1,8 +1,65 @@
 import math
-from typing import Tuple
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
 
 from graphviz import Digraph
 
+class _GradState(threading.local):
+    """
+        Whether the computation graph is recorded. Every thread has its own state, so that a thread that evaluates a model under :func:`no_grad`
+        never disables the gradients of another thread that is training one.
+    """
+
+    def __init__(self):
+        # If False, operations do not record the computation graph (see no_grad)
+        self.grad_enabled : bool = True
+
+        # If True, no computation graph is recorded at all until it is disabled again (see set_inference_mode)
+        self.inference_mode : bool = False
+
+
+_state = _GradState()
+
+
+def is_grad_enabled() -> bool:
+
+    """
+        Returns ``True`` if operations between :class:`Value` and :class:`minitorch.Tensor` objects currently record the computation graph.
+    """
+
+    return _state.grad_enabled and not _state.inference_mode
+
+
+@contextmanager
+def no_grad():
+
+    """
+        Context manager under which operations only compute numbers: no children, operations or backward nodes are recorded, so nothing can be differentiated.
+        It's meant for forward passes whose result is never differentiated (e.g: evaluating a model). It only applies to the thread that enters it.
+
+        >>> with no_grad():
+        ...     output = model(x)
+    """
+
+    previous = _state.grad_enabled
+    _state.grad_enabled = False
+    try:
+        yield
+    finally:
+        _state.grad_enabled = previous
+
+
+def set_inference_mode(enabled : bool = True) -> None:
+
+    """
+        Enables (or disables) the inference mode. While it's enabled, no computation graph is recorded anywhere, as if the whole program ran under :func:`no_grad`.
+        It's meant for processes that only serve predictions. It only applies to the calling thread, so every serving thread must enable it.
+    """
+
+    _state.inference_mode = enabled
+
+
 class Value:
 
     """
@@ -27,13 +84,14 @@ class Value:
 
         * **grad:** (*float*) Numerical value of the partial derivative of the function with respect to the current object evaluated in an initial value.
 
-        * **label:** (*str*) Symbolic name of the variable.
-
-        * **__backward:** (*callable*) Function that explicits how the function that this object is part of must be differentiated with respect to this object.
+        * **label:** (*str*) Symbolic name of the variable. If it's ``None``, it is built from the labels of __children and __op only when it is asked for.
 
         * **__children:** (*Set*) Tuple of objects of this class that are combined together with an operation to form the current object.
 
         * **__op:** (*str*) Symbolic representation of the operation applied to __children in order to form the current object.
+          It also works as the op-code that tells the backward pass how the current object must be differentiated.
+
+        * **__topo:** (*List*) Topological order of the tree whose root is the current object. It's only cached by :meth:`backward` when ``retain_graph = True``.
 
     ======================
     **Instance Variables**
@@ -57,8 +115,10 @@ class Value:
 
     """
 
+    # Objects of this class are created by the millions, so a fixed layout (without a __dict__ per object) is used
+    __slots__ = ("data", "grad", "__label", "__children", "__op", "__topo")
 
-    def __init__(self, data : float, children=(), op='', label="") -> None:
+    def __init__(self, data : float, children=(), op='', label : str = "") -> None:
         
         # **** Public attributes **** #
 
@@ -66,16 +126,20 @@ class Value:
         
         self.grad : float = 0
         
-        self.label : str = label
-        
         # **** Private attributes **** #
         
-        self.__backward : callable = lambda: None  
-        
+        self.__label : str = label
+
+        # The tree is only recorded if gradients are enabled
+        if not is_grad_enabled():
+            children, op = (), ''
+
         self.__children : Tuple['Value'] = tuple(children) 
         
         self.__op : str = op
 
+        self.__topo : List['Value'] = None
+
 
     def __wrapValue(self, other : int | float) -> 'Value':
 
@@ -89,7 +153,7 @@ class Value:
             # Check if its a numeric type
             if isinstance(other, (int, float)) and not isinstance(other, bool):
                 # Wrap into a value class
-                return Value(float(other), label=str(other))
+                return Value(float(other), label=None)
             
             # other can only by 'Value' or numeric type
             else:
@@ -98,47 +162,36 @@ class Value:
         else: 
             return other
 
+    @property
+    def label(self) -> str:
+        """
+            Symbolic name of the object. Labels of the objects formed by an operation are only built when they are asked for.
+        """
+        if self.__label is None:
+            return self.__build_labels()[self]
+        return self.__label
+
+    @label.setter
+    def label(self, label : str) -> None:
+        self.__label = label
+
     def __add__(self, other : 'Value') -> 'Value':
         
         other = self.__wrapValue(other)
         
-        out =  Value(self.data + other.data, children=(self, other), op = "+", label=f"{self.label}+{other.label}")
-
-        def __backward():
-            self.grad  += 1*out.grad
-            other.grad += 1*out.grad
-        
-        out.__backward = __backward 
-
-        return out
+        return Value(self.data + other.data, children=(self, other), op = "+", label=None)
 
     def __mul__(self, other : 'Value') -> 'Value':
 
         other = self.__wrapValue(other)
         
-        out =  Value(self.data*other.data, children=(self, other), op = "*", label=f"{self.label}*{other.label}")
-
-        def __backward():
-            self.grad  += other.data*out.grad
-            other.grad += self.data*out.grad
-        out.__backward = __backward 
-
-        return out
+        return Value(self.data*other.data, children=(self, other), op = "*", label=None)
     
     def __pow__(self, other : 'Value') -> 'Value':
         
         other = self.__wrapValue(other)
         
-        out =  Value(self.data**(other.data), children=(self, other), op = "^", label=f"{self.label}^{other.label}")
-
-        def __backward():
-            self.grad  += other.data*(self.data**(other.data - 1))*out.grad
-            
-            #NOTE: Commented because line above gives problems with logarithms (e.g: negative arguments)
-            #other.grad += (self.data**(other.data))*math.log(self.data)*out.grad
-        out.__backward = __backward 
-
-        return out        
+        return Value(self.data**(other.data), children=(self, other), op = "^", label=None)
 
     def sigmoid(self) -> 'Value':
 
@@ -152,13 +205,7 @@ class Value:
         """
 
         s = 1/(1+math.exp(-self.data))
-        out =  Value(s, children=(self,), op = "sig", label=f"sig({self.label})")
-
-        def __backward():
-            self.grad  += (s*(1-s))*out.grad
-        out.__backward = __backward 
-
-        return out       
+        return Value(s, children=(self,), op = "sig", label=None)
 
     def relu(self) -> 'Value':
 
@@ -172,13 +219,7 @@ class Value:
         """
 
         r = self.data if self.data > 0 else 0
-        out =  Value(r, children=(self,), op = "ReLU", label=f"ReLU({self.label})")
-
-        def __backward():
-            self.grad  += 1*out.grad if self.data > 0 else 0
-        out.__backward = __backward 
-
-        return out
+        return Value(r, children=(self,), op = "ReLU", label=None)
 
     def log(self) -> 'Value':
 
@@ -190,13 +231,44 @@ class Value:
         if self.data <= 0:
             raise Exception("Errro! Natural logarithm is not defined in the real numbers for values lesser than or equal to zero")
 
-        out = Value(math.log(self.data), children=(self,), op="log", label=f"log({self.label})")
+        return Value(math.log(self.data), children=(self,), op="log", label=None)
 
-        def __backward():
-            self.grad += (1/self.data)*out.grad
-        out.__backward = __backward
-        
-        return out
+    def __backward(self) -> None:
+
+        """
+            Propagates the gradient of the current object to its children, according to the operation (op-code) that formed it.
+        """
+
+        op = self.__op
+
+        if op == "+":
+            a, b = self.__children
+            a.grad += 1*self.grad
+            b.grad += 1*self.grad
+
+        elif op == "*":
+            a, b = self.__children
+            a.grad += b.data*self.grad
+            b.grad += a.data*self.grad
+
+        elif op == "^":
+            a, b = self.__children
+            a.grad += b.data*(a.data**(b.data - 1))*self.grad
+
+            #NOTE: Commented because line above gives problems with logarithms (e.g: negative arguments)
+            #b.grad += (a.data**(b.data))*math.log(a.data)*self.grad
+
+        elif op == "sig":
+            a, = self.__children
+            a.grad += (self.data*(1-self.data))*self.grad
+
+        elif op == "ReLU":
+            a, = self.__children
+            a.grad += 1*self.grad if a.data > 0 else 0
+
+        elif op == "log":
+            a, = self.__children
+            a.grad += (1/a.data)*self.grad
 
     def __truediv__(self, other : 'Value') -> 'Value':
         return self*(other**(-1))
@@ -220,34 +292,85 @@ class Value:
         return (self**(-1))*other
 
     def __rpow__(self, other) -> 'Value':
-        other = self._wrapValue(other)
+        other = self.__wrapValue(other)
         return other**self
 
     def __repr__(self) -> str:
         return f"Value(data={self.data}, grad={self.grad})"
 
-    def backward(self):
+    def __topological_sort(self) -> List['Value']:
+
+        """
+            Returns all the nodes of the tree whose root is the current object, sorted so that every node comes after all of its children.
+            The tree is traversed with an explicit stack, so its depth is not bounded by Python's recursion limit.
+        """
+
+        topo : List[Value] = []
+        visited = set()
+
+        # Each entry of the stack is a node and whether its children have already been pushed
+        stack : List[Tuple[Value, bool]] = [(self, False)]
+
+        while stack:
+            v, expanded = stack.pop()
+
+            # All the children of the node are already in the list, so the node can be added too
+            if expanded:
+                topo.append(v)
+
+            elif v not in visited:
+                visited.add(v)
+                stack.append((v, True))
+                for child in v.__children:
+                    if child not in visited:
+                        stack.append((child, False))
+
+        return topo
+
+    def __build_labels(self) -> Dict['Value', str]:
+
+        """
+            Builds the labels of all the nodes of the tree whose root is the current object.
+            Each label is built from the labels of the children of the node, so every node is visited only once.
+        """
+
+        labels : Dict[Value, str] = {}
+
+        for v in self.__topological_sort():
+            if v.__label is not None:
+                labels[v] = v.__label
+            elif len(v.__children) == 0:
+                labels[v] = str(v.data)
+            elif len(v.__children) == 1:
+                labels[v] = f"{v.__op}({labels[v.__children[0]]})"
+            else:
+                labels[v] = f"{labels[v.__children[0]]}{v.__op}{labels[v.__children[1]]}"
+
+        return labels
+
+    def backward(self, retain_graph : bool = False):
 
         """
             Differentiates the **function whose value is the current object** with respect to all of the nodes in the tree whose root is the current object.
             Differentiation is performed using **reverse automatic differentiation**.
+
+            If ``retain_graph = True``, the topological order of the tree is cached in the current object, so that the next calls to this method reuse it instead of traversing the tree again.
+
+            Gradients of the leaves are **accumulated** (added) across calls, while the gradients of the intermediate nodes are computed again on every call.
         """
-        
+
         # Topological sort of the tree is performed in order to iterate non-recursively through all the nodes.
         # Topological sort is prefered for this task for the order of the returned list
-        topo = []
-        visited = set()
+        topo : List[Value] = self.__topo if self.__topo is not None else self.__topological_sort()
 
-        def build_topo(v : Value) -> None:
-            # This method fills the 'visited' list using topological sort. Takes as root the argument 'v'
-            if v not in visited:
-                visited.add(v)
-                for child in v.__children:
-                    build_topo(child)
-                topo.append(v)
+        self.__topo = topo if retain_graph else None
+
+        # Intermediate nodes are differentiated from scratch on every call, so that a retained tree (or a subtree shared with another function) does not
+        # carry the gradients of a previous call over. Only the leaves accumulate their gradients across calls
+        for v in topo:
+            if v.__children:
+                v.grad = 0
 
-        build_topo(self)
-        
         # We set the gradient of the root node to 1 (partial derivate of the function w.r.t itself is 1)
         self.grad = 1
         
@@ -289,16 +412,8 @@ class Value:
 
         def trace(root):
             # builds a set of all nodes and edges in a graph
-            nodes, edges = set(), set()
-            
-            def build(v):
-                if v not in nodes:
-                    nodes.add(v)
-                    
-                    for child in v.getChildren():
-                        edges.add((child, v))
-                        build(child)
-            build(root)
+            nodes = set(root.__topological_sort())
+            edges = {(child, v) for v in nodes for child in v.getChildren()}
             return nodes, edges
 
         def draw_dot(root):
@@ -306,10 +421,13 @@ class Value:
 
             nodes, edges = trace(root)
 
+            # labels are built here, all at once, because they are not stored while the tree is being built
+            labels = root.__build_labels()
+
             for n in nodes:
                 uid = str(id(n))
                 # for any value in the graph, create a rectangular ('record') node for it
-                dot.node(name = uid, label = "{ %s | data %.4f | grad %.4f }" % (n.label, n.data, n.grad), shape='record')
+                dot.node(name = uid, label = "{ %s | data %.4f | grad %.4f }" % (labels[n], n.data, n.grad), shape='record')
 
                 if n.getOperation():
                     # if this value is a result of some operation, create an op node for it
@@ -0,0 +1,719 @@
+from __future__ import annotations
+from contextlib import contextmanager
+import threading
+from typing import List, Tuple
+
+import numpy as np
+
+from minitorch import Kernels
+from minitorch.SparseGrad import SparseGrad
+from minitorch.Autograd import is_grad_enabled, no_grad
+
+class _TapeState(threading.local):
+    """
+        Operations applied while a model is being traced (see minitorch.jit). Every thread has its own tape, so that only the operations
+        of the thread that traces the model are recorded.
+    """
+
+    def __init__(self):
+        # It's None when nothing is being traced
+        self.tape : List[Tuple] = None
+
+
+_state = _TapeState()
+
+
+@contextmanager
+def recording():
+
+    """
+        Context manager that records every operation applied inside it, in the current thread. It yields a list that is filled with
+        a (Function subclass, input tensors, keyword arguments, output tensor) tuple for each operation, in the order they were applied.
+    """
+
+    previous = _state.tape
+    _state.tape = []
+    try:
+        yield _state.tape
+    finally:
+        _state.tape = previous
+
+
+class Function:
+
+    """
+    ===========
+    **Summary**
+    ===========
+
+        Base class for every differentiable operation between :class:`Tensor.Tensor` objects.
+
+        Each time an operation is applied, an object of this class is created and becomes a **node** of the computation graph.
+        The node remembers the tensors it was applied to and whatever it needs to differentiate the operation.
+        Its backward pass receives the gradient of the **whole** output tensor and returns the gradient of every input tensor in one single vectorized call.
+
+        Subclasses must override :meth:`forward` and :meth:`backward`. Operations are applied with :meth:`apply`.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **inputs:** (*Tuple[Tensor]*) Tensors the operation is applied to.
+
+    ======================
+    **Instance Variables**
+    ======================
+
+        * **inputs:** (*Tuple[Tensor]*) Tensors the operation is applied to. These are the children of the node in the computation graph.
+
+        * **saved_arrays:** (*Tuple[np.ndarray]*) Arrays saved during the forward pass in order to compute the backward pass.
+
+        * **released:** (*bool*) ``True`` once the node was freed by :meth:`release`. A released node can not be differentiated again.
+
+    ===========
+    **Example**
+    ===========
+
+        .. code-block:: python
+
+            class Exp(Function):
+                def forward(self, a):
+                    out = np.exp(a)
+                    self.save_for_backward(out)
+                    return out
+
+                def backward(self, grad):
+                    out, = self.saved_arrays
+                    return (grad * out,)
+
+            y = Exp.apply(x)
+
+    """
+
+    def __init__(self, *inputs):
+        self.inputs : Tuple = inputs
+        self.saved_arrays : Tuple[np.ndarray] = ()
+        self.released : bool = False
+
+    def save_for_backward(self, *arrays : np.ndarray) -> None:
+        """
+            Saves the arrays needed by the backward pass.
+        """
+        self.saved_arrays = arrays
+
+    def needs_backward(self) -> bool:
+        """
+            Returns ``True`` if the node is recorded in the computation graph (see :meth:`apply`). Otherwise, the forward pass does not need to save
+            anything for the backward pass, which is worth skipping when it costs some work (e.g: packing a mask).
+        """
+        return is_grad_enabled() and any(t.requires_grad for t in self.inputs)
+
+    def forward(self, *arrays : np.ndarray, **kwargs) -> np.ndarray:
+        """
+            Computes the output of the operation from the raw data of the input tensors.
+        """
+        raise NotImplementedError
+
+    def backward(self, grad : np.ndarray) -> Tuple[np.ndarray]:
+        """
+            Receives the gradient with respect to the output of the operation and returns the gradient with respect to every input (one per input, in the same order).
+        """
+        raise NotImplementedError
+
+    def release(self) -> None:
+        """
+            Frees the references of the node to its input tensors and to the saved arrays, so that the graph behind it can be garbage collected.
+            It's called by the backward pass once the node is not needed anymore (see :meth:`Tensor.Tensor.backward`).
+        """
+        self.inputs = ()
+        self.saved_arrays = ()
+        self.released = True
+
+    @classmethod
+    def apply(cls, *inputs, **kwargs):
+        """
+            Applies the operation to the input tensors, and returns the resulting tensor.
+            The node is only recorded in the computation graph if any of the inputs requires its gradient and gradients are enabled (see :func:`Autograd.no_grad`).
+        """
+        # NOTE: Imported here because the Tensor class is built on top of this one
+        from minitorch.Tensor import Tensor
+
+        function = cls(*inputs)
+        out = Tensor(function.forward(*(t.data for t in inputs), **kwargs))
+
+        if function.needs_backward():
+            out.requires_grad = True
+            out.grad_fn = function
+
+        tape = _state.tape
+        if tape is not None:
+            tape.append((cls, inputs, kwargs, out))
+
+        return out
+
+
+def unbroadcast(grad : np.ndarray, shape : Tuple[int]) -> np.ndarray:
+    """
+        Reduces the gradient of a broadcast operation to the shape of the input that was broadcast, adding up the elements along the broadcast dimensions.
+    """
+    # Dimensions added in front of the input
+    if grad.ndim > len(shape):
+        grad = grad.sum(axis=tuple(range(grad.ndim - len(shape))))
+
+    # Dimensions of size one (1) that were stretched
+    axis = tuple(i for i, size in enumerate(shape) if size == 1 and grad.shape[i] != 1)
+    if axis:
+        grad = grad.sum(axis=axis, keepdims=True)
+
+    return grad
+
+
+def pack_mask(mask : np.ndarray) -> np.ndarray:
+    """
+        Packs a boolean mask into a bitmap (one bit per element), so that it takes eight (8) times less memory while it is saved for the backward pass.
+    """
+    return np.packbits(mask, axis=None)
+
+
+def unpack_mask(bitmap : np.ndarray, shape : Tuple[int]) -> np.ndarray:
+    """
+        Unpacks a bitmap built by :func:`pack_mask` into a boolean mask of the given shape.
+    """
+    return np.unpackbits(bitmap, count=int(np.prod(shape))).reshape(shape).view(bool)
+
+
+class Add(Function):
+    """
+        Element-wise addition of two tensors, with NumPy-style broadcasting.
+    """
+
+    def forward(self, a, b):
+        self.shapes = (a.shape, b.shape)
+        return a + b
+
+    def backward(self, grad):
+        return unbroadcast(grad, self.shapes[0]), unbroadcast(grad, self.shapes[1])
+
+
+class Sub(Function):
+    """
+        Element-wise substraction of two tensors, with NumPy-style broadcasting.
+    """
+
+    def forward(self, a, b):
+        self.shapes = (a.shape, b.shape)
+        return a - b
+
+    def backward(self, grad):
+        return unbroadcast(grad, self.shapes[0]), unbroadcast(-grad, self.shapes[1])
+
+
+class Mul(Function):
+    """
+        Element-wise (Hadamard) multiplication of two tensors, with NumPy-style broadcasting.
+    """
+
+    def forward(self, a, b):
+        self.save_for_backward(a, b)
+        return a * b
+
+    def backward(self, grad):
+        a, b = self.saved_arrays
+
+        grad_a = unbroadcast(grad * b, a.shape) if self.inputs[0].requires_grad else None
+        grad_b = unbroadcast(grad * a, b.shape) if self.inputs[1].requires_grad else None
+
+        return grad_a, grad_b
+
+
+class Div(Function):
+    """
+        Element-wise division of two tensors, with NumPy-style broadcasting.
+    """
+
+    def forward(self, a, b):
+        self.save_for_backward(a, b)
+        return a / b
+
+    def backward(self, grad):
+        a, b = self.saved_arrays
+
+        grad_a = unbroadcast(grad / b, a.shape) if self.inputs[0].requires_grad else None
+        grad_b = unbroadcast(-grad * a / (b*b), b.shape) if self.inputs[1].requires_grad else None
+
+        return grad_a, grad_b
+
+
+class Pow(Function):
+    """
+        Element-wise exponentiation of two tensors, with NumPy-style broadcasting.
+
+        .. note::
+            The derivative with respect to the exponent, :math:`a^{b} \\cdot log(a)`, is only defined for positive bases. It's taken as zero for the rest.
+    """
+
+    def forward(self, a, b):
+        out = a ** b
+        self.save_for_backward(a, b, out)
+        return out
+
+    def backward(self, grad):
+        a, b, out = self.saved_arrays
+
+        grad_a = unbroadcast(grad * b * (a ** (b - 1)), a.shape) if self.inputs[0].requires_grad else None
+
+        grad_b = None
+        if self.inputs[1].requires_grad:
+            log_a = np.log(np.where(a > 0, a, 1))
+            grad_b = unbroadcast(grad * out * log_a, b.shape)
+
+        return grad_a, grad_b
+
+
+class Neg(Function):
+    """
+        Element-wise negation of a tensor.
+    """
+
+    def forward(self, a):
+        return -a
+
+    def backward(self, grad):
+        return (-grad,)
+
+
+class Sum(Function):
+    """
+        Sum of the elements of a tensor along the given axis (or all of them, if ``axis = None``).
+    """
+
+    def forward(self, a, axis, keepdims):
+        self.shape = a.shape
+        self.reduced_shape = np.sum(a, axis=axis, keepdims=True).shape
+
+        res = np.sum(a, axis=axis, keepdims=keepdims)
+        return res.reshape(1) if res.ndim == 0 else res
+
+    def backward(self, grad):
+        return (np.broadcast_to(grad.reshape(self.reduced_shape), self.shape),)
+
+
+class Mean(Function):
+    """
+        Mean of the elements of a tensor along the given axis (or all of them, if ``axis = None``).
+    """
+
+    def forward(self, a, axis, keepdims):
+        self.shape = a.shape
+        self.reduced_shape = np.sum(a, axis=axis, keepdims=True).shape
+
+        res = np.mean(a, axis=axis, keepdims=keepdims)
+        return res.reshape(1) if res.ndim == 0 else res
+
+    def backward(self, grad):
+        count = np.prod(self.shape) // np.prod(self.reduced_shape)
+        return (np.broadcast_to(grad.reshape(self.reduced_shape) / count, self.shape),)
+
+
+class Max(Function):
+    """
+        Maximum of the elements of a tensor along the given axis (or all of them, if ``axis = None``).
+        If the maximum is repeated, its gradient is divided equally among all of its occurrences.
+    """
+
+    def forward(self, a, axis, keepdims):
+        res = np.max(a, axis=axis, keepdims=True)
+
+        if self.needs_backward():
+            mask = (a == res)
+            self.save_for_backward(mask / np.sum(mask, axis=axis, keepdims=True))
+        self.reduced_shape = res.shape
+
+        if not keepdims:
+            res = np.squeeze(res, axis=axis)
+        return res.reshape(1) if res.ndim == 0 else res
+
+    def backward(self, grad):
+        weights, = self.saved_arrays
+        return (grad.reshape(self.reduced_shape) * weights,)
+
+
+class MatMul(Function):
+    """
+        Dot product, Vector - Matrix multiplication or Matrix - Matrix multiplication in a strict mathematical sense.
+        The vector on the left side of the product is a "row vector", and the vector on the right side is a "column vector".
+
+        Its backward pass is expressed as two matrix multiplications:
+
+        .. math::
+            \\frac{\\partial L}{\\partial A} = \\frac{\\partial L}{\\partial C} \\cdot B^{T} \\text{ ; } \\frac{\\partial L}{\\partial B} = A^{T} \\cdot \\frac{\\partial L}{\\partial C}
+    """
+
+    def forward(self, a, b):
+        a = a.reshape(1, -1) if a.ndim == 1 else a
+        b = b.reshape(-1, 1) if b.ndim == 1 else b
+        self.save_for_backward(a, b)
+
+        res = Kernels.matmul(a, b)
+
+        # NOTE: This is done for dropping dimensions (flattening), e.g: [[1]] -> [1]
+        while res.ndim != 1 and res.shape[0] == 1:
+            res = res[0]
+
+        return res
+
+    def backward(self, grad):
+        a, b = self.saved_arrays
+        grad = grad.reshape(a.shape[0], b.shape[1])
+
+        grad_a = Kernels.matmul(grad, b.T) if self.inputs[0].requires_grad else None
+        grad_b = Kernels.matmul(a.T, grad) if self.inputs[1].requires_grad else None
+
+        return grad_a, grad_b
+
+
+class Transpose(Function):
+    """
+        Transposition of a vector or a matrix. The result is a view that shares the data of the input.
+    """
+
+    def forward(self, a):
+        return a.T
+
+    def backward(self, grad):
+        return (grad.T,)
+
+
+class Index(Function):
+    """
+        Indexing (or slicing) of a tensor. Indexing a vector returns a one (1) element vector.
+        Unless the index is a list or an array of indices, the result is a view that shares the data of the input.
+    """
+
+    def forward(self, a, index):
+        self.index = index
+        self.shape = a.shape
+        self.dtype = a.dtype
+
+        res = a[index]
+
+        # A new axis is added to single elements, so that they are still a view of the input
+        if res.ndim == 0:
+            res = a[(index if isinstance(index, tuple) else (index,)) + (None,)]
+
+        return res
+
+    def backward(self, grad):
+        res = np.zeros(self.shape, dtype=self.dtype)
+        np.add.at(res, self.index, grad.reshape(np.shape(res[self.index])))
+        return (res,)
+
+
+class Reshape(Function):
+    """
+        Change of the shape of a tensor, keeping its elements and their order.
+        The result is a view that shares the data of the input, unless the layout of the input in memory does not allow it (e.g: a transposed matrix).
+    """
+
+    def forward(self, a, shape):
+        self.shape = a.shape
+        return a.reshape(shape)
+
+    def backward(self, grad):
+        return (grad.reshape(self.shape),)
+
+
+class ReLU(Function):
+    """
+        Element-wise ReLU (Rectified Linear Unit) function.
+    """
+
+    def forward(self, a):
+        # Only the positions of the positive elements are needed by the backward pass, one bit each
+        if self.needs_backward():
+            self.save_for_backward(pack_mask(a > 0))
+        self.shape = a.shape
+        return Kernels.elementwise(Kernels.relu, a)
+
+    def backward(self, grad):
+        bitmap, = self.saved_arrays
+        return (grad * unpack_mask(bitmap, self.shape),)
+
+
+class Sigmoid(Function):
+    """
+        Element-wise sigmoid function.
+    """
+
+    def forward(self, a):
+        s = Kernels.elementwise(Kernels.sigmoid, a)
+        if self.needs_backward():
+            self.save_for_backward(s)
+        return s
+
+    def backward(self, grad):
+        s, = self.saved_arrays
+        return ((s*(1-s))*grad,)
+
+
+class Log(Function):
+    """
+        Element-wise natural logarithm.
+    """
+
+    def forward(self, a):
+        # Error handling
+        if np.any(a <= 0):
+            raise Exception("Errro! Natural logarithm is not defined in the real numbers for values lesser than or equal to zero")
+
+        self.save_for_backward(a)
+        return np.log(a)
+
+    def backward(self, grad):
+        a, = self.saved_arrays
+        return (grad / a,)
+
+
+class Cast(Function):
+    """
+        Conversion of a tensor to another floating point type. The gradient is converted back to the type of the input.
+    """
+
+    def forward(self, a, dtype):
+        self.dtype = a.dtype
+        return a.astype(dtype)
+
+    def backward(self, grad):
+        return (grad.astype(self.dtype),)
+
+
+class Affine(Function):
+    """
+        Affine map of a row vector, or of a batch of row vectors (one per row of a matrix), computed with a single matrix multiplication:
+
+        .. math::
+            f(X, W, \\bar{b}) = X \\cdot W^{T} + \\bar{b}
+    """
+
+    def forward(self, x, weights, bias):
+        if self.needs_backward():
+            self.save_for_backward(x, weights)
+
+        res = Kernels.matmul(x.reshape(-1, x.shape[-1]), weights.T) + bias
+        return res.reshape(x.shape[:-1] + (weights.shape[0],))
+
+    def backward(self, grad):
+        x, weights = self.saved_arrays[:2]
+        x = x.reshape(-1, weights.shape[1])
+        grad = grad.reshape(-1, weights.shape[0])
+
+        grad_x = Kernels.matmul(grad, weights) if self.inputs[0].requires_grad else None
+        grad_weights = Kernels.matmul(grad.T, x) if self.inputs[1].requires_grad else None
+        grad_bias = grad.sum(axis=0) if self.inputs[2].requires_grad else None
+
+        return grad_x, grad_weights, grad_bias
+
+
+class AffineReLU(Affine):
+    """
+        Affine map followed by the ReLU function, fused in a single operation.
+        The activation is computed in place over the output of the matrix multiplication, so no intermediate tensor is allocated,
+        and only a bitmap of the positive elements is kept for the backward pass.
+    """
+
+    def forward(self, x, weights, bias):
+        res = super().forward(x, weights, bias)
+
+        if self.needs_backward():
+            self.save_for_backward(x, weights, pack_mask(res > 0))
+        Kernels.elementwise(Kernels.relu, res, out=res)
+
+        return res
+
+    def backward(self, grad):
+        bitmap = self.saved_arrays[2]
+        return super().backward(grad * unpack_mask(bitmap, grad.shape))
+
+
+class AffineSigmoid(Affine):
+    """
+        Affine map followed by the sigmoid function, fused in a single operation.
+        The activation is computed in place over the output of the matrix multiplication, so no intermediate tensor is allocated.
+    """
+
+    def forward(self, x, weights, bias):
+        res = super().forward(x, weights, bias)
+
+        Kernels.elementwise(Kernels.sigmoid, res, out=res)
+
+        if self.needs_backward():
+            self.save_for_backward(x, weights, res)
+        return res
+
+    def backward(self, grad):
+        s = self.saved_arrays[2]
+        return super().backward((s*(1-s))*grad)
+
+
+class SparseAffine(Function):
+    """
+        Affine map of a sparse row vector, or of a sparse batch of row vectors (see :class:`SparseTensor.SparseTensor`), with weights of shape ``(in_features, out_features)``:
+
+        .. math::
+            f(X, W, \\bar{b}) = X \\cdot W + \\bar{b}
+
+        Only the rows of the weights that match a stored element of the input are read, and only those rows get a gradient (see :class:`SparseGrad.SparseGrad`),
+        so both passes cost as much as the number of stored elements, and not as the number of input features. The input is not differentiated.
+    """
+
+    def forward(self, weights, bias, x):
+        self.x = x
+        self.shape = weights.shape
+
+        n_rows = len(x.indptr) - 1
+        values = x.values.astype(weights.dtype, copy=False)
+
+        # Every stored element scales the row of the weights that matches its column, and the scaled rows of each sample are added up
+        res = np.zeros((n_rows, weights.shape[1]), dtype=weights.dtype)
+        nonempty = np.diff(x.indptr) > 0
+        if x.nnz() > 0:
+            res[nonempty] = np.add.reduceat(weights[x.indices] * values[:, None], x.indptr[:-1][nonempty], axis=0)
+        res += bias
+
+        return res.reshape(x.shape()[:-1] + (weights.shape[1],))
+
+    def backward(self, grad):
+        x = self.x
+        grad = grad.reshape(-1, self.shape[1])
+
+        grad_weights = None
+        if self.inputs[0].requires_grad:
+            rows = x.values.astype(grad.dtype, copy=False)[:, None] * grad[x.row_ids()]
+            grad_weights = SparseGrad(x.indices, rows, self.shape).coalesce()
+
+        grad_bias = grad.sum(axis=0) if self.inputs[1].requires_grad else None
+
+        return grad_weights, grad_bias
+
+    def release(self) -> None:
+        super().release()
+        self.x = None
+
+
+class Gather(Function):
+    """
+        Lookup of the rows of a matrix by index: the result has one row of the matrix for every index, with the shape of the indices plus the length of a row.
+        The gradient of the matrix is row-sparse (see :class:`SparseGrad.SparseGrad`): only the rows that were looked up get a gradient.
+
+        The indices are a tensor too (stored as floats, which must be whole numbers), so that a traced model reads them as an input instead of freezing them (see :mod:`minitorch.jit`).
+        They are not differentiated. Their type must represent every row exactly (e.g: ``float16`` only up to 2048), otherwise large indices would have been rounded silently.
+    """
+
+    def forward(self, weights, indices):
+        # Whole numbers above 2^(mantissa bits + 1) are not all representable, so they may have been rounded to a neighbouring row when the indices were stored
+        if indices.dtype.kind == "f" and weights.shape[0] - 1 > 2 ** (np.finfo(indices.dtype).nmant + 1):
+            raise Exception(f"Error! Indices stored as {indices.dtype} can not represent every row of a matrix with {weights.shape[0]} rows exactly. Please store them as a more precise type (e.g: float64)")
+
+        self.indices = indices.astype(np.int64)
+        self.shape = weights.shape
+
+        if not np.array_equal(self.indices, indices):
+            raise Exception("Error! Rows can only be looked up by integer indices")
+
+        if self.indices.size > 0 and (self.indices.min() < 0 or self.indices.max() >= weights.shape[0]):
+            raise Exception(f"Error! Indices must be in the range [0, {weights.shape[0]})")
+
+        return weights[self.indices]
+
+    def backward(self, grad):
+        rows = grad.reshape(-1, self.shape[1])
+        return SparseGrad(self.indices.ravel(), rows, self.shape).coalesce(), None
+
+    def release(self) -> None:
+        super().release()
+        self.indices = None
+
+
+class BinaryCrossEntropy(Function):
+    """
+        Binary Cross Entropy between the predicted probabilities and the labels, averaged over all the elements.
+        The labels are not differentiated.
+
+        .. math::
+            \\frac{\\partial BCE}{\\partial \\hat{y}} = \\frac{\\hat{y} - y}{\\hat{y} \\cdot (1 - \\hat{y})}
+    """
+
+    def forward(self, pred, label):
+        # Error handling
+        if np.any(pred <= 0) or np.any(pred >= 1):
+            raise Exception("Errro! Natural logarithm is not defined in the real numbers for values lesser than or equal to zero")
+
+        self.save_for_backward(pred, label)
+        return np.array([np.mean(-(label*np.log(pred) + (1-label)*np.log(1-pred)))])
+
+    def backward(self, grad):
+        pred, label = self.saved_arrays
+        return grad[0] * (pred - label) / (pred*(1-pred)) / pred.size, None
+
+
+class BinaryCrossEntropyWithLogits(Function):
+    """
+        Binary Cross Entropy between the sigmoid of the logits and the labels, averaged over all the elements, fused in a single operation.
+        It is computed with the log-sum-exp trick, so it never overflows nor takes the logarithm of zero:
+
+        .. math::
+            BCE(y, x) = max(x, 0) - x \\cdot y + log(1 + e^{-|x|})
+
+        Its gradient with respect to the logits is :math:`\\sigma(x) - y`. The labels are not differentiated.
+    """
+
+    def forward(self, logits, label):
+        self.save_for_backward(logits, label)
+        return np.array([np.mean(np.maximum(logits, 0) - logits*label + np.logaddexp(0, -np.abs(logits)))])
+
+    def backward(self, grad):
+        logits, label = self.saved_arrays
+
+        # Equivalent to 1/(1+e^{-x}), but it does not overflow for large negative values
+        s = np.exp(-np.logaddexp(0, -logits))
+
+        return grad[0] * (s - label) / logits.size, None
+
+
+class Recompute(Function):
+    """
+        Runs a segment of a model (any callable that takes a tensor) without recording its graph, and recomputes it, recording the graph this time,
+        when the backward pass reaches it. Only the input of the segment is saved in the meantime.
+
+        The parameters of the segment are inputs of the node, so that it's differentiated when they require gradient, but their gradients
+        are accumulated directly by the backward pass of the recomputed segment.
+    """
+
+    def forward(self, x, *params, segment):
+        # NOTE: Imported here because the Tensor class is built on top of this one
+        from minitorch.Tensor import Tensor
+
+        self.segment = segment
+        self.save_for_backward(x)
+
+        # The operations of the segment are neither recorded in the graph nor in the tape of a traced model
+        with no_grad(), recording():
+            return segment(Tensor(x)).data
+
+    def backward(self, grad):
+        from minitorch.Tensor import Tensor
+
+        x, = self.saved_arrays
+        n_params = len(self.inputs) - 1
+
+        leaf = Tensor(x, requires_grad=self.inputs[0].requires_grad)
+        out = self.segment(leaf)
+
+        if out.requires_grad:
+            out.backward(gradient=grad)
+
+        return (leaf.grad,) + (None,)*n_params
+
+    def release(self) -> None:
+        super().release()
+        self.segment = None
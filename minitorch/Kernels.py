@@ -0,0 +1,189 @@
+"""
+    Numerical kernels that perform the heavy work of the :class:`Function.Function` operations over the raw data of the tensors.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+# Side (in elements) of the square tiles used by the cache-blocked matrix multiplication.
+# Three tiles of 64x64 floats (96 KiB) fit comfortably in the L2 cache of any modern CPU
+BLOCK_SIZE : int = 64
+
+
+def _blas_available() -> bool:
+    """
+        Checks if NumPy was built against a BLAS library. If it can not be known, BLAS is assumed to be available.
+    """
+    try:
+        config = np.show_config(mode="dicts")
+        return bool(config["Build Dependencies"]["blas"]["found"])
+    except Exception:
+        return True
+
+
+# If ``True``, matrix multiplications are dispatched to BLAS through NumPy
+HAS_BLAS : bool = _blas_available()
+
+# Operations smaller than these are always run in the calling thread, because splitting them costs more than it saves
+PARALLEL_MIN_ELEMENTS : int = 1 << 16
+PARALLEL_MIN_FLOPS : int = 1 << 20
+
+# Number of threads the kernels split their work into (see set_num_threads)
+_num_threads : int = 1
+
+_pool : ThreadPoolExecutor = None
+
+
+def set_num_threads(n : int) -> None:
+    """
+        Sets the number of threads used by the kernels. Large matrix multiplications are split by row blocks and large element-wise functions by chunks,
+        and every part is computed by NumPy in a different thread of a pool (NumPy releases the GIL while it works on the raw buffers).
+        Default is one (1): every kernel runs in the calling thread.
+
+        .. note::
+            If NumPy's BLAS library is multithreaded itself, it's advisable to limit its threads (e.g: ``OMP_NUM_THREADS=1``) when using this setting.
+    """
+    global _num_threads, _pool
+
+    if n < 1:
+        raise Exception("Error! The number of threads must be at least one (1)")
+
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+    _num_threads = n
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """
+        Returns the thread pool of the kernels, creating it the first time it is needed.
+    """
+    global _pool
+
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=_num_threads, thread_name_prefix="minitorch")
+    return _pool
+
+
+def _forget_pool() -> None:
+    """
+        The threads of the pool do not survive a fork, so child processes (e.g: the workers of DataParallel) create their own pool.
+    """
+    global _pool
+    _pool = None
+
+
+# Platforms without fork (e.g: Windows) do not have it
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_pool)
+
+
+def get_num_threads() -> int:
+    """
+        Returns the number of threads used by the kernels (see :func:`set_num_threads`).
+    """
+    return _num_threads
+
+
+def _split(length : int, parts : int) -> List[Tuple[int, int]]:
+    """
+        Splits the range [0, length) into (at most) the given number of contiguous blocks of similar size.
+    """
+    bounds = np.linspace(0, length, min(parts, length) + 1).astype(int)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def tiled_matmul(a : np.ndarray, b : np.ndarray, block_size : int = BLOCK_SIZE) -> np.ndarray:
+    """
+        Matrix - Matrix multiplication computed tile by tile, so that the tiles being multiplied stay in cache while they are reused.
+    """
+    rows, inner = a.shape
+    cols = b.shape[1]
+
+    res = np.zeros((rows, cols), dtype=np.result_type(a, b))
+
+    for i in range(0, rows, block_size):
+        for k in range(0, inner, block_size):
+            a_tile = a[i:i+block_size, k:k+block_size]
+            for j in range(0, cols, block_size):
+                res[i:i+block_size, j:j+block_size] += a_tile @ b[k:k+block_size, j:j+block_size]
+
+    return res
+
+
+def _serial_matmul(a : np.ndarray, b : np.ndarray) -> np.ndarray:
+    """
+        Matrix - Matrix multiplication in the calling thread. It's dispatched to BLAS when available, and to a cache-blocked kernel otherwise.
+    """
+    # Small matrices fit in cache as a whole, so there is no point in splitting them into tiles
+    if HAS_BLAS or max(a.shape[0], a.shape[1], b.shape[1]) <= BLOCK_SIZE:
+        return a @ b
+
+    return tiled_matmul(a, b)
+
+
+def matmul(a : np.ndarray, b : np.ndarray) -> np.ndarray:
+    """
+        Matrix - Matrix multiplication. If more than one thread is set (see :func:`set_num_threads`), large products are split by blocks of rows of ``a``,
+        and every block of the result is computed in a different thread.
+    """
+    rows = a.shape[0]
+
+    if _num_threads == 1 or rows < 2 or rows*a.shape[1]*b.shape[1] < PARALLEL_MIN_FLOPS:
+        return _serial_matmul(a, b)
+
+    res = np.empty((rows, b.shape[1]), dtype=np.result_type(a, b))
+
+    def block(bounds : Tuple[int, int]) -> None:
+        start, end = bounds
+        res[start:end] = _serial_matmul(a[start:end], b)
+
+    list(_get_pool().map(block, _split(rows, _num_threads)))
+    return res
+
+
+def elementwise(function : Callable[[np.ndarray, np.ndarray], None], a : np.ndarray, out : np.ndarray = None) -> np.ndarray:
+    """
+        Applies an element-wise function to an array. The function receives a chunk of the input and the chunk of the output it must fill
+        (e.g: ``lambda x, o: np.maximum(x, 0, out=o)``). The output can be the input itself, for in-place functions.
+
+        If more than one thread is set (see :func:`set_num_threads`), large arrays are split into chunks that are computed in different threads.
+    """
+    if out is None:
+        out = np.empty_like(a)
+
+    if _num_threads == 1 or a.size < PARALLEL_MIN_ELEMENTS or not (a.flags.c_contiguous and out.flags.c_contiguous):
+        function(a, out)
+        return out
+
+    flat_a = a.reshape(-1)
+    flat_out = out.reshape(-1)
+
+    def chunk(bounds : Tuple[int, int]) -> None:
+        start, end = bounds
+        function(flat_a[start:end], flat_out[start:end])
+
+    list(_get_pool().map(chunk, _split(a.size, _num_threads)))
+    return out
+
+
+def relu(x : np.ndarray, out : np.ndarray) -> None:
+    """
+        ReLU function, computed into ``out``. It's meant to be used with :func:`elementwise`.
+    """
+    np.maximum(x, 0, out=out)
+
+
+def sigmoid(x : np.ndarray, out : np.ndarray) -> None:
+    """
+        Sigmoid function, computed into ``out``. It's meant to be used with :func:`elementwise`.
+        It's equivalent to 1/(1+e^{-x}), but it does not overflow for large negative values.
+    """
+    np.negative(x, out=out)
+    np.logaddexp(0, out, out=out)
+    np.negative(out, out=out)
+    np.exp(out, out=out)
@@ -0,0 +1,150 @@
+"""
+    Saving and loading of the parameters of a model in a compact binary format.
+
+    A file is laid out as:
+
+    * **Magic number:** the four (4) bytes ``MTCH``.
+    * **Version:** little-endian unsigned 32-bit integer.
+    * **Header length:** little-endian unsigned 64-bit integer.
+    * **Header:** UTF-8 JSON manifest with the name, dtype, shape and offset (from the start of the data section) of every parameter.
+    * **Data section:** the raw little-endian buffers of the parameters, one after another. The data section and every buffer start at a multiple of
+      :data:`ALIGNMENT` bytes, so that the buffers can be used in place when the file is memory-mapped.
+"""
+
+from minitorch.Tensor import Tensor
+from typing import Dict, List, Tuple
+import json
+import struct
+
+import numpy as np
+
+MAGIC : bytes = b"MTCH"
+
+VERSION : int = 1
+
+# Alignment (in bytes) of the data section and of every buffer
+ALIGNMENT : int = 64
+
+# Magic number, version and header length
+_PREAMBLE = struct.Struct("<4sIQ")
+
+
+def _align(n : int) -> int:
+    return -(-n // ALIGNMENT) * ALIGNMENT
+
+
+def _named_arrays(model) -> List[Tuple[str, np.ndarray]]:
+    """
+        Returns the (name, raw data) pairs of the parameters of a model, or of a dictionary of tensors (or arrays).
+    """
+    items = model.items() if isinstance(model, dict) else model.state_dict().items()
+    return [(name, t.data if isinstance(t, Tensor) else np.asarray(t)) for name, t in items]
+
+
+def save(model, path : str) -> None:
+
+    """
+        Saves the parameters of a model (a :class:`minitorch.nn.Module`, see :meth:`minitorch.nn.Module.state_dict`),
+        or a dictionary of named tensors, to a binary file. Only the raw data of the parameters is saved, never their computation graph.
+
+        >>> save(model, "model.mt")
+    """
+
+    arrays = _named_arrays(model)
+
+    manifest : List[Dict] = []
+    offset = 0
+    for name, array in arrays:
+        dtype = array.dtype.newbyteorder("<")
+        manifest.append({"name": name, "dtype": dtype.str, "shape": list(array.shape), "offset": offset})
+        offset = _align(offset + array.size*dtype.itemsize)
+
+    if len({entry["name"] for entry in manifest}) != len(manifest):
+        raise Exception("Error! Parameters must have unique names in order to be saved")
+
+    header = json.dumps({"params": manifest}).encode("utf-8")
+    data_start = _align(_PREAMBLE.size + len(header))
+
+    with open(path, "wb") as file:
+        file.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        file.write(header)
+
+        for (_, array), entry in zip(arrays, manifest):
+            file.write(b"\0" * (data_start + entry["offset"] - file.tell()))
+            file.write(np.ascontiguousarray(array, dtype=entry["dtype"]).data)
+
+
+def load(path : str, model = None, mmap : bool = True) -> Dict[str, Tensor]:
+
+    """
+        Loads the parameters saved by :func:`save`, and returns them as a dictionary of named tensors.
+
+        If ``mmap = True``, the file is **memory-mapped**: tensors are views of the file, so nothing is read nor copied until their elements are used.
+        The mapping is copy-on-write, so the tensors can still be modified (changes are never written back to the file).
+        Otherwise, the whole file is read into memory at once.
+
+        If a model is given, its parameters are loaded too (names and shapes must match). With ``mmap = True``, the parameters of the model take the
+        mapped buffers as storage (see :meth:`minitorch.Tensor.set_storage`). Otherwise, the loaded values are copied into their current storage.
+
+        >>> model = Sequential(Linear(2,3), ReLU(), Linear(3,1), Sigmoid())
+        >>> load("model.mt", model)
+    """
+
+    buffer : np.ndarray
+    if mmap:
+        buffer = np.memmap(path, dtype=np.uint8, mode="c")
+    else:
+        with open(path, "rb") as file:
+            buffer = np.frombuffer(bytearray(file.read()), dtype=np.uint8)
+
+    if buffer.size < _PREAMBLE.size:
+        raise Exception(f"Error! {path} is not a minitorch file")
+
+    magic, version, header_length = _PREAMBLE.unpack(buffer[:_PREAMBLE.size].tobytes())
+    if magic != MAGIC:
+        raise Exception(f"Error! {path} is not a minitorch file")
+    if version > VERSION:
+        raise Exception(f"Error! {path} was saved with a newer version of the format ({version})")
+
+    header = json.loads(buffer[_PREAMBLE.size:_PREAMBLE.size + header_length].tobytes().decode("utf-8"))
+    data_start = _align(_PREAMBLE.size + header_length)
+
+    tensors : Dict[str, Tensor] = {}
+    for entry in header["params"]:
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        start = data_start + entry["offset"]
+        end = start + int(np.prod(shape, dtype=np.int64))*dtype.itemsize
+
+        # Views of the buffer: no element is copied (or read from disk, if the file is mapped)
+        array = np.asarray(buffer[start:end]).view(dtype).reshape(shape)
+        tensors[entry["name"]] = Tensor(array, requires_grad=True)
+
+    if model is None:
+        return tensors
+
+    if not mmap:
+        model.load_state_dict(tensors)
+        return tensors
+
+    # The parameters take the mapped buffers as storage, so their values are never copied
+    params : Dict[str, Tensor] = dict(model.named_parameters())
+
+    missing = params.keys() - tensors.keys()
+    unexpected = tensors.keys() - params.keys()
+    if missing or unexpected:
+        raise Exception(f"Error! The parameters of the file do not match the ones of the model. Missing: {sorted(missing)}. Unexpected: {sorted(unexpected)}")
+
+    for name, param in params.items():
+        if tensors[name].shape() != param.shape():
+            raise Exception(f"Error! Parameter {name} has shape {tensors[name].shape()} in the file, but {param.shape()} in the model")
+
+    for name, param in params.items():
+        param.set_storage(tensors[name].data, copy=False)
+
+    # Tensors that are not parameters (e.g: a fixed zero bias) take the type of the loaded parameters too
+    dtypes = {param.dtype() for param in params.values()}
+    if len(dtypes) == 1:
+        model.to(dtypes.pop())
+
+    return tensors
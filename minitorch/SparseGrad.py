@@ -0,0 +1,112 @@
+from __future__ import annotations
+from typing import Tuple
+
+import numpy as np
+
+
+class SparseGrad:
+
+    """
+    ===========
+    **Summary**
+    ===========
+
+        **Row-sparse** gradient of a matrix parameter: only the rows that received some gradient are stored, as a list of row indices and a dense block
+        with one row per index. It's the gradient of layers that only use a few rows of their weights on every call (e.g: :class:`minitorch.nn.SparseLinear`),
+        so that the memory and time spent on the gradient do not depend on the number of rows of the parameter.
+
+        Indices can be repeated (their rows are added up) until :meth:`coalesce` is called.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **indices:** (*np.ndarray*) Index of every stored row in the parameter.
+        * **rows:** (*np.ndarray*) Gradient of every stored row. Its first dimension matches ``indices``.
+        * **shape:** (*Tuple[int]*) Shape of the dense gradient.
+
+    ======================
+    **Instance Variables**
+    ======================
+
+        * **indices:** (*np.ndarray*) Index of every stored row in the parameter.
+        * **rows:** (*np.ndarray*) Gradient of every stored row.
+        * **shape:** (*Tuple[int]*) Shape of the dense gradient.
+
+    ===========
+    **Example**
+    ===========
+
+        >>> grad = SparseGrad(np.array([3, 0, 3]), np.ones((3, 2)), (5, 2))
+        >>> grad.coalesce().indices # >>> array([0, 3])
+        >>> grad.to_dense()         # Rows 1, 2 and 4 are zeros
+
+    """
+
+    def __init__(self, indices : np.ndarray, rows : np.ndarray, shape : Tuple[int]):
+
+        self.indices : np.ndarray = np.asarray(indices, dtype=np.int64)
+        self.rows : np.ndarray = np.asarray(rows)
+        self.shape : Tuple[int] = tuple(shape)
+
+        if self.indices.ndim != 1 or self.rows.shape != self.indices.shape + self.shape[1:]:
+            raise Exception(f"Error! {len(self.indices)} rows of shape {self.shape[1:]} were expected, but an array of shape {self.rows.shape} was given")
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.rows.dtype
+
+    def astype(self, dtype : np.dtype) -> SparseGrad:
+        """
+            Returns the same gradient with its rows stored as the given type (or the current object itself, if they already are).
+        """
+        if self.rows.dtype == dtype:
+            return self
+        return SparseGrad(self.indices, self.rows.astype(dtype), self.shape)
+
+    def coalesce(self) -> SparseGrad:
+        """
+            Returns the same gradient with unique and sorted indices, adding up the rows of repeated indices.
+        """
+        if len(self.indices) == 0:
+            return self
+
+        order = np.argsort(self.indices, kind="stable")
+        indices = self.indices[order]
+
+        # First position of every distinct index in the sorted list
+        starts = np.flatnonzero(np.concatenate(([True], indices[1:] != indices[:-1])))
+        if len(starts) == len(indices):
+            return SparseGrad(indices, self.rows[order], self.shape)
+
+        return SparseGrad(indices[starts], np.add.reduceat(self.rows[order], starts, axis=0), self.shape)
+
+    def concatenate(self, other : SparseGrad) -> SparseGrad:
+        """
+            Returns the sum of both gradients, keeping the rows of both (indices may be repeated).
+        """
+        if other.shape != self.shape:
+            raise Exception(f"Error! Gradients of shapes {self.shape} and {other.shape} can not be added up")
+
+        return SparseGrad(np.concatenate((self.indices, other.indices)), np.concatenate((self.rows, other.rows.astype(self.rows.dtype, copy=False))), self.shape)
+
+    def add_to(self, array : np.ndarray) -> None:
+        """
+            Adds the stored rows to a dense array (of the same shape), in place.
+        """
+        np.add.at(array, self.indices, self.rows)
+
+    def to_dense(self, out : np.ndarray = None) -> np.ndarray:
+        """
+            Returns the dense gradient. If ``out`` is given, the gradient is written into it.
+        """
+        if out is None:
+            out = np.zeros(self.shape, dtype=self.rows.dtype)
+        else:
+            out.fill(0)
+
+        self.add_to(out)
+        return out
+
+    def __repr__(self):
+        return f"SparseGrad(indices={self.indices.tolist()}, shape={self.shape})"
@@ -0,0 +1,180 @@
+from __future__ import annotations
+from typing import List, Tuple
+
+import numpy as np
+
+from minitorch.Tensor import Tensor, DTYPES
+
+
+class SparseTensor:
+
+    """
+    ===========
+    **Summary**
+    ===========
+
+        A vector or a matrix where most of the elements are zero, stored in **CSR** (Compressed Sparse Row) format: only the nonzero elements are kept,
+        row after row, together with their column index. Row ``i`` owns the elements between positions ``indptr[i]`` and ``indptr[i+1]``.
+
+        It's meant for inputs that are mostly zeros, like one-hot or bag-of-words features, which are fed to :class:`minitorch.nn.SparseLinear`.
+        A vector is stored as a matrix with a single row. Sparse tensors are data: they are not differentiated.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **indptr:** (*np.ndarray*) Position of the first element of every row in ``indices`` and ``values``, plus the total number of elements. Its length is the number of rows plus one (1).
+        * **indices:** (*np.ndarray*) Column of every stored element.
+        * **values:** (*np.ndarray*) Value of every stored element.
+        * **shape:** (*Tuple[int]*) Dimensions of the dense tensor: (columns,) for a vector, (rows, columns) for a matrix.
+        * **__shape:** (*Tuple[int]*) Dimensions of the dense tensor.
+
+    ======================
+    **Instance Variables**
+    ======================
+
+        * **indptr:** (*np.ndarray*) Position of the first element of every row.
+        * **indices:** (*np.ndarray*) Column of every stored element.
+        * **values:** (*np.ndarray*) Value of every stored element, stored as ``float64``, ``float32`` or ``float16``.
+
+    ===========
+    **Example**
+    ===========
+
+        >>> x = SparseTensor.from_coo(rows=[0, 0, 2], cols=[1, 7, 3], values=[1, 1, 2], shape=(3, 10))
+        >>> x = SparseTensor.from_dense(Tensor([[0, 1, 0], [0, 0, 0], [2, 0, 0]]))
+        >>> x.nnz() # >>> 2
+
+    """
+
+    def __init__(self, indptr : np.ndarray, indices : np.ndarray, values : np.ndarray, shape : Tuple[int]):
+
+        self.__shape : Tuple[int] = tuple(shape)
+
+        if len(self.__shape) not in (1, 2):
+            raise Exception("Error! Sparse tensors can only be vectors or matrices")
+
+        n_rows = 1 if len(self.__shape) == 1 else self.__shape[0]
+
+        self.indptr : np.ndarray = np.asarray(indptr, dtype=np.int64)
+        self.indices : np.ndarray = np.asarray(indices, dtype=np.int64)
+
+        # Values that are not stored as a supported floating point type (e.g: integers) are converted to float64
+        values = np.asarray(values)
+        self.values : np.ndarray = values if values.dtype in DTYPES else values.astype(np.float64)
+
+        if len(self.indptr) != n_rows + 1 or self.indptr[0] != 0 or np.any(np.diff(self.indptr) < 0):
+            raise Exception(f"Error! The row pointers of a sparse tensor with {n_rows} rows must be {n_rows + 1} non-decreasing positions that start at zero (0)")
+
+        if len(self.indices) != self.indptr[-1] or len(self.values) != self.indptr[-1]:
+            raise Exception(f"Error! The row pointers describe {self.indptr[-1]} elements, but {len(self.indices)} indices and {len(self.values)} values were given")
+
+        if len(self.indices) > 0 and (self.indices.min() < 0 or self.indices.max() >= self.__shape[-1]):
+            raise Exception(f"Error! Column indices must be in the range [0, {self.__shape[-1]})")
+
+    @staticmethod
+    def from_dense(data : Tensor | np.ndarray | List) -> SparseTensor:
+
+        """
+            Builds a sparse tensor with the nonzero elements of a dense vector or matrix.
+        """
+
+        array = data.data if isinstance(data, Tensor) else np.asarray(data, dtype=np.float64)
+        matrix = array.reshape(1, -1) if array.ndim == 1 else array
+
+        rows, cols = np.nonzero(matrix)
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=matrix.shape[0]))))
+
+        return SparseTensor(indptr, cols, matrix[rows, cols], array.shape)
+
+    @staticmethod
+    def from_coo(rows : np.ndarray | List[int], cols : np.ndarray | List[int], values : np.ndarray | List[float], shape : Tuple[int]) -> SparseTensor:
+
+        """
+            Builds a sparse matrix from the coordinates (COO format) of its nonzero elements: the row, column and value of every element, in any order.
+            Repeated coordinates are kept, and they stand for the sum of their values.
+        """
+
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values)
+
+        if not (len(rows) == len(cols) == len(values)):
+            raise Exception("Error! Every element needs a row, a column and a value")
+
+        if len(shape) != 2:
+            raise Exception("Error! Coordinates can only describe a matrix. Use from_dense for vectors")
+
+        if len(rows) > 0 and (rows.min() < 0 or rows.max() >= shape[0]):
+            raise Exception(f"Error! Row indices must be in the range [0, {shape[0]})")
+
+        # Elements are sorted by row (and by column inside a row)
+        order = np.lexsort((cols, rows))
+        rows, cols, values = rows[order], cols[order], values[order]
+
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=shape[0]))))
+
+        return SparseTensor(indptr, cols, values, shape)
+
+    def shape(self) -> Tuple[int]:
+        """
+            Returns the shape of the dense tensor.
+        """
+        return self.__shape
+
+    def dtype(self) -> np.dtype:
+        """
+            Returns the type the values are stored as.
+        """
+        return self.values.dtype
+
+    def nnz(self) -> int:
+        """
+            Returns the number of stored (nonzero) elements.
+        """
+        return len(self.values)
+
+    def density(self) -> float:
+        """
+            Returns the fraction of the elements of the dense tensor that are stored.
+        """
+        return self.nnz() / max(int(np.prod(self.__shape)), 1)
+
+    def row_ids(self) -> np.ndarray:
+        """
+            Returns the row of every stored element.
+        """
+        return np.repeat(np.arange(len(self.indptr) - 1), np.diff(self.indptr))
+
+    def rows(self, indices : np.ndarray | List[int]) -> SparseTensor:
+
+        """
+            Returns a sparse matrix with the given rows of this one (e.g: a mini-batch of samples), in the given order.
+        """
+
+        if len(self.__shape) == 1:
+            raise Exception("Error! Rows can only be taken from a sparse matrix")
+
+        indices = np.asarray(indices, dtype=np.int64)
+        starts, ends = self.indptr[indices], self.indptr[indices + 1]
+        lengths = ends - starts
+
+        # Position of every selected element in the stored arrays
+        positions = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths) + np.arange(lengths.sum())
+
+        return SparseTensor(np.concatenate(([0], np.cumsum(lengths))), self.indices[positions], self.values[positions], (len(indices), self.__shape[1]))
+
+    def to_dense(self) -> Tensor:
+
+        """
+            Returns the dense tensor.
+        """
+
+        n_rows = len(self.indptr) - 1
+        dense = np.zeros((n_rows, self.__shape[-1]), dtype=self.values.dtype)
+        np.add.at(dense, (self.row_ids(), self.indices), self.values)
+
+        return Tensor(dense.reshape(self.__shape))
+
+    def __repr__(self):
+        return f"SparseTensor(shape={self.__shape}, nnz={self.nnz()})"
@@ -1,7 +1,39 @@
 from __future__ import annotations
-from minitorch.Autograd import Value
-from typing import List, Tuple, Any
-from copy import deepcopy
+from typing import Dict, List, Tuple
+import itertools
+
+import numpy as np
+
+from minitorch.SparseGrad import SparseGrad
+from minitorch.Function import Function, Add, Sub, Mul, Div, Pow, Neg, Sum, Mean, Max, MatMul, Transpose, Index, Reshape, ReLU, Sigmoid, Log, Cast
+
+# Floating point types the elements of a tensor can be stored as
+DTYPES : Tuple[np.dtype] = (np.dtype(np.float64), np.dtype(np.float32), np.dtype(np.float16))
+
+# Serial numbers given to the tensors in the order they are created (see Tensor.serial)
+_serials = itertools.count()
+
+
+def next_serial() -> int:
+    """
+        Takes a serial number that is greater than the one of every tensor created so far, and smaller than the one of every tensor created afterwards.
+    """
+    return next(_serials)
+
+
+def check_dtype(dtype) -> np.dtype:
+    """
+        Returns the NumPy dtype that stands for the given type (a NumPy type or its name, e.g: ``"float32"``), checking that tensors can be stored as it.
+    """
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        raise Exception(f"Error! {dtype} is not a valid data type")
+
+    if dtype not in DTYPES:
+        raise Exception(f"Error! Tensors can only be stored as {', '.join(str(d) for d in DTYPES)}, not as {dtype}")
+
+    return dtype
 
 class Tensor:
 
@@ -12,161 +44,213 @@ class Tensor:
 
         A :class:`Tensor` is a multi-dimensional arrange of numbers containing real-valued elements.
 
-        This class only allows a maximum of four (3) dimensions. These can be seen as:
-            
+        This class only allows a maximum of four (4) dimensions. These can be seen as:
+
         * **1 dimensional tensor**:
             Is a **vector**. It's initialized with a list. **Scalar values can be initialized with one (1) element lists**
 
         * **2 dimensional tensor**:
             Is a **matrix**. It's initialized with a list of lists.
-        
+
         * **3 dimensional tensor** & **4 dimensional tensor**:
             Is called a **multi-index object** in mathematics (**tensor** word is reserved for multilinear applications in mathematics). It's initialized with a 3-dimensional or 4-dimensional list.
             The 3-dimensional tensor is useful for images that contains various channels (e.g a color image), while the 4-dimensional tensor is useful for representing **batches of data**, being the fourth dimension the batch size.
-         
+
+        The elements of the tensor are stored in **one contiguous buffer of floats** (a NumPy array), described by its shape and strides.
+        The buffer is double precision (``float64``) by default, but it can be single (``float32``) or half (``float16``) precision too (see :data:`DTYPES`),
+        which takes two (2) or four (4) times less memory and bandwidth. The results of an operation are stored as the most precise type of its inputs,
+        and gradients are stored as the type of their tensor.
+        Differentiation is tracked **per tensor operation** (and not per element): every operation between tensors creates a single
+        :class:`Function.Function` node in the computation graph, whose backward pass computes the gradient of the whole tensor at once.
+
+        Element-wise operations (``+``, ``-``, ``/``, ``**`` and :meth:`mul`) follow NumPy's broadcasting rules, and tensors can be reduced
+        with :meth:`sum`, :meth:`mean` and :meth:`max` along any axis. The ``*`` (and ``@``) operator keeps its mathematical meaning (see :meth:`__mul__`).
+
         .. warning::
 
             Uniformity along all dimensions is assumed. This means that, for example, the matrix [[1,2], [3]] is **not** supported as a tensor.
-            Not mantaining uniformity may lead to undefined behaviour. 
-            
+
     ==============
     **Parameters**
     ==============
-    
+
         * **__shape:** (*Tuple[int]*) Dimensions of the tensor. Its read as (Batch Size, Number of Channels, Rows, Columns)
 
-        * **__data:** (:class:`Autograd.Value` | *List*) List that contains the raw data of the tensor as Value objects.
+        * **__data:** (*np.ndarray*) Buffer that contains the raw data of the tensor as floats.
+
+        * **__dim:** (*int*) Number of dimensions of the tensor. Is used for convenience inside the class
+
+        * **__topo:** (*List[Tensor]*) Topological order of the graph whose root is the current object. It's only cached by :meth:`backward` when ``retain_graph = True``.
 
-        * **__dim:** (*int*) Length of self.__data. Is used for convenience inside the class
+        * **__serial:** (*int*) Creation order of the tensor (see :meth:`serial`).
 
     ======================
     **Instance Variables**
     ======================
 
-        * **data:** (*int | float | Value | List | List[List] | List[List[List] | List[List[List[List]]]*) List containing the raw data of the tensor.
+        * **data:** (*int | float | np.ndarray | List | List[List] | List[List[List] | List[List[List[List]]]*) Raw data of the tensor.
+
+        * **requires_grad:** (*bool*) If ``True``, the gradient of this object is computed during the backward pass. Default is ``False``.
+
+        * **dtype:** (*np.dtype | str*) Type the elements are stored as: ``float64``, ``float32`` or ``float16``. Default is the type of the given NumPy array
+          (if it's one of those), or ``float64`` otherwise.
+
+        * **grad:** (*np.ndarray | SparseGrad*) Gradient of the function with respect to this object. It's ``None`` until a backward pass reaches it.
+          Only leaves (tensors that are not computed by an operation) keep it: the gradients of intermediate tensors are dropped at the end of the backward pass.
+          Operations that only use a few rows of a matrix (e.g: :class:`Function.SparseAffine`) give it a row-sparse gradient (see :class:`SparseGrad.SparseGrad`),
+          which stays sparse while only row-sparse gradients are accumulated into it.
+
+        * **sparse_grad:** (*bool*) If ``True``, the gradient of this object is expected to be row-sparse, so the optimizers keep it out of their flat buffers
+          and only update the rows that received some gradient (see :class:`minitorch.optim.Optimizer`). It's set by layers like :class:`minitorch.nn.Embedding`. Default is ``False``.
+
+        * **grad_fn:** (:class:`Function.Function`) Node of the computation graph of the operation that formed this object. It's ``None`` for tensors created by the user.
 
     ===========
     **Example**
     ===========
 
-        >>> three_dim_tens = Tensor([ [[1,2], [3,4], [4,5]], [[5,6], [7,8]] ])
+        >>> matrix = Tensor([[1,2], [3,4], [4,5]], requires_grad=True)
         >>> scalar = Tensor([3.14])
+        >>> half = Tensor([[1,2], [3,4]], dtype="float16")
 
     """
-        
-    def __init__(self, 
-                 data : int | float | Value | List | List[List] | List[List[List]] | List[List[List[List]]]):
+
+    def __init__(self,
+                 data : int | float | np.ndarray | List | List[List] | List[List[List]] | List[List[List[List]]],
+                 requires_grad : bool = False,
+                 dtype : np.dtype | str = None):
 
         # Empty lists are not allowed as instance variables
         if isinstance(data, list) and len(data) == 0:
             raise Exception("Error! Empty lists are invalid instance variables for this class")
 
-        self.__shape : Tuple[int]
-        
-        def get_dims(data : List):
-            if type(data) != list:
-                return []
+        self.__data : np.ndarray
+
+        if dtype is not None:
+            dtype = check_dtype(dtype)
+        elif isinstance(data, np.ndarray) and data.dtype in DTYPES:
+            dtype = data.dtype
+        else:
+            dtype = DTYPES[0]
+
+        # Converts the list (or list of lists or ...) of integers or floats to a single buffer of floats.
+        # NumPy arrays of the same type are wrapped without copying them
+        try:
+            if isinstance(data, np.ndarray):
+                self.__data = np.asarray(data, dtype=dtype)
             else:
-                return [len(data)] + get_dims(data[0]) 
-        
-        self.__shape = tuple(get_dims(data))
+                self.__data = np.array(data, dtype=dtype)
+        except (TypeError, ValueError):
+            raise Exception("Error! Unable to store the raw data inside the tensor. Elements of the tensor MUST be real-valued numbers and uniform along all dimensions")
+
+        self.__shape : Tuple[int] = self.__data.shape
+
+        self.__dim : int = len(self.__shape)
 
-        self.__dim = len(self.__shape)
-        
         if self.__dim > 4 or self.__dim < 1:
             raise Exception("Error! Tensors with more than four (4) dimensions or less than one (1) are not supported")
 
-        self.__data : Value | List
+        # **** Public attributes **** #
 
-        # Converts the list (or list of lists or ...) of integers or floats to a list of Value objects
-        def get_value_list(data : List) -> Value | List:
-            if isinstance(data, list):
-                return [get_value_list(item) for item in data]
-            elif isinstance(data, (float,int)): 
-                return Value(data)
-            elif isinstance(data, Value):
-                return data
-            else:
-                raise Exception("Error! Unable to wrap the raw data values inside Value objects. Elements of the tensor MUST be real-valued numbers")
-        
-        self.__data = get_value_list(data)
+        self.requires_grad : bool = requires_grad
 
-        
-    def __iter__(self):
-        return iter(self.__data)
-    
-    def __scalar_vect_mul(self, other : int | float | Value) -> Tensor:
-        """
-            Perform Scalar - Vector multiplication
-        """
-        return Tensor([other * elem for elem in self.__data])
-        
-    def __scalar_matrix_mul(self, other : int | float | Value) -> Tensor:
+        self.grad : np.ndarray = None
+
+        self.grad_fn : Function = None
+
+        self.sparse_grad : bool = False
+
+        # **** Private attributes **** #
+
+        self.__topo : List[Tensor] = None
+
+        self.__serial : int = next_serial()
+
+    @property
+    def data(self) -> np.ndarray:
         """
-            Perform Scalar - Matrix multiplication
+            Buffer with the raw data of the tensor. Assigning to it overwrites the elements of the tensor **in place**.
         """
-        new_col : List = []
-        res_aux : List = []
-        for row in self.__data:
-            res_aux.append([other * col for col in row])
+        return self.__data
 
-        return Tensor(res_aux)
-    
-    def __dot_product(self, other : Tensor) -> Tensor:
+    @data.setter
+    def data(self, value : np.ndarray | float) -> None:
+        self.__data[...] = value
+
+    def __accumulate_grad(self, grad : np.ndarray | SparseGrad) -> None:
         """
-            Perform the dot product between this object and other Tensor object. Both being 1-dimensional Tensor objects
+            Adds the gradient of an operation to the gradient of this object.
         """
-        # Firstly, check length matching
-        if len(self) != len(other):
-            raise Exception("Error! Dot product can only be performed between vectors (1-dimensional Tensor objects) of the same lenghth")
-        
-        else:
-            return Tensor([sum(self.__data[i] * other.__data[i] for i in range(len(self.__data))), ])
+        if not self.requires_grad:
+            return
 
-    def __vector_matrix_mul(self, other : Tensor) -> Tensor:
+        self.grad = self.__sum_grads(self.grad, grad)
+
+    def __sum_grads(self, total : np.ndarray | SparseGrad, grad : np.ndarray | SparseGrad) -> np.ndarray | SparseGrad:
         """
-            Perform Vector - Matrix multiplication. Vector must be a "row vector"
+            Returns the sum of a gradient accumulated so far for this object (or ``None``) and the gradient of an operation.
+            The accumulated gradient is updated in place when possible. The gradient of the operation is copied, so it's never modified afterwards.
         """
-        # Number of elements in the resulting vector (1-dimensional Tensor object). It has as many elements as columns the 'other' object has
-        elems : int = other.__shape[-1]
+        if isinstance(grad, SparseGrad):
+            grad = grad.astype(self.__data.dtype)
+            if total is None:
+                return grad
+            elif isinstance(total, SparseGrad):
+                return total.concatenate(grad)
+            else:
+                grad.add_to(total)
+                return total
+
+        # A dense gradient makes the accumulated gradient dense too
+        if isinstance(total, SparseGrad):
+            total = total.to_dense()
 
-        # Number of rows and columns in the 'other' object
-        cols_other : int = other.__shape[-1]
-        rows_other : int = other.__shape[-2]
+        if total is None:
+            return np.array(grad, dtype=self.__data.dtype).reshape(self.__shape)
 
-        res_aux : List = [0]*elems
+        total += grad.reshape(self.__shape)
+        return total
 
-        for i in range(cols_other):
-            res_aux[i] = sum([self.__data[j] * other.__data[j][i] for j in range(rows_other)])
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
 
-        return Tensor(res_aux)
+    def __wrapTensor(self, other : int | float | Tensor) -> Tensor:
 
-    def __matrix_matrix_mul(self, other: Tensor) -> Tensor:
         """
-            Perform Matrix - Matrix multiplication in a strict mathematical sense
+            Wraps a numerical value (integer or float) as a one (1) element object of this class, so that it can be broadcast against any other tensor.
+            It's stored as the type of this object, so that it does not promote the result of the operation to a more precise type.
         """
-        # Extract rows and columns of the current object
-        self_rows : int = self.__shape[-2]
-        self_cols : int = self.__shape[-1]
 
-        # Extract rows and columns of the 'other' object
-        other_rows : int = other.__shape[-2]
-        other_cols : int = other.__shape[-1]
+        if isinstance(other, Tensor):
+            return other
+
+        # Check if its a numeric type
+        elif isinstance(other, (int, float)) and not isinstance(other, bool):
+            wrapped = Tensor([other], dtype=self.__data.dtype)
+            # Numbers are written in the code, so they are constants of any model the operation belongs to (see minitorch.jit.trace)
+            wrapped.__serial = -1
+            return wrapped
+
+        # other can only by 'Tensor' or numeric type
+        else:
+            raise Exception("Type error: trying to operate a non numeric value!")
+
+    def __broadcast(self, other : int | float | Tensor, operation : str) -> Tensor:
 
-        res_aux : Tensor = Tensor([[Value(0) for _ in range(other_cols)]for _ in range(self_rows)])
+        """
+            Wraps other (if needed) and checks that its shape can be broadcast against the shape of this object, following NumPy's broadcasting rules.
+        """
 
-        for self_row in range(self_rows):
-            for other_col in range(other_cols):
-                for other_row in range(other_rows):
-                    res_aux.__data[self_row][other_col] += self.__data[self_row][other_row] * other.__data[other_row][other_col]
+        other = self.__wrapTensor(other)
 
-        # NOTE: This is done for dropping dimensions (flattening), e.g: [[1]] -> [1]
-        while res_aux.__dim != 1 and res_aux.shape()[0] == 1:
-            res_aux = res_aux[0]
+        try:
+            np.broadcast_shapes(self.__shape, other.__shape)
+        except ValueError:
+            raise Exception(f"Error! {operation} is not defined between tensors of shapes {self.__shape} and {other.__shape}, because they can not be broadcast together")
 
-        return res_aux
+        return other
 
-    def __mul__(self, other : int | float | Value | Tensor) -> Tensor:
+    def __mul__(self, other : int | float | Tensor) -> Tensor:
 
         """
             In version 1.0.0, this class only supports mathematically accurate operations. These are:
@@ -176,118 +260,256 @@ class Tensor:
             * Vector dot product
             * Matrix - Vector multiplication (and viceversa)
             * Matrix - Matrix multiplication
+
+            For element-wise multiplication between tensors, refer to the method 'mul'
         """
 
         res : Tensor
 
-        # Scalar - Vector multiplication
-        if self.__dim == 1 and isinstance(other, (int, float, Value)):
-            res = self.__scalar_vect_mul(other)
+        # Scalar - Tensor multiplication
+        if isinstance(other, (int, float)) and not isinstance(other, bool):
+            res = Mul.apply(self, self.__wrapTensor(other))
 
-        # Scalar - Matrix multiplication
-        elif self.__dim == 2 and isinstance(other, (int, float, Value)):
-            res = self.__scalar_matrix_mul(other)
-        
-        
         # Vector dot product
         elif self.__dim == 1 and isinstance(other, Tensor) and other.__dim == 1:
-            res = self.__dot_product(other)
-        
-        # Vector - Matrix multiplication
-        elif self.__dim == 1 and isinstance(other, Tensor) and other.__dim == 2:
 
-            # Check if self.col == other.row
-            if self.__shape[-1] != other.__shape[-2]:
-                raise Exception("Error! Dimensions mismatch, unable to perform multiplication!")
+            # Firstly, check length matching
+            if len(self) != len(other):
+                raise Exception("Error! Dot product can only be performed between vectors (1-dimensional Tensor objects) of the same lenghth")
             else:
-                res = self.__vector_matrix_mul(other)
-        
-        # Matrix - Matrix multiplication (Matrix - Vector multiplication enters in this category because, in that case, the vector needs to be a "column vector", wich is just a matrix in terms of this object)
-        elif self.__dim == 2 and isinstance(other, Tensor) and other.__dim == 2:
-            
+                res = MatMul.apply(self, other)
+
+        # Vector - Matrix multiplication & Matrix - Matrix multiplication (Matrix - Vector multiplication enters in this category because, in that case, the vector needs to be a "column vector", wich is just a matrix in terms of this object)
+        elif self.__dim in (1, 2) and isinstance(other, Tensor) and other.__dim == 2:
+
             # Check if self.col == other.row
             if self.__shape[-1] != other.__shape[-2]:
                 raise Exception("Error! Dimensions mismatch, unable to perform multiplication!")
             else:
-                res = self.__matrix_matrix_mul(other)
+                res = MatMul.apply(self, other)
 
         else:
             raise Exception("Error! Multiplication is not supported dimensions grater than 3")
 
         return res
-    
-    def __vect_add(self, other : Tensor) -> Tensor:
-        return Tensor([val_1 + val_2 for val_1, val_2 in zip(self.__data, other.__data)])
-    
-    def __matrix_add(self, other : Tensor) -> Tensor:
-        res_aux : Tensor = Tensor([[Value(0) for _ in range(self.__shape[1])] for _ in range(self.__shape[0])])
-
-        for row in range(self.__shape[0]):
-            for col in range(self.__shape[1]):
-                res_aux.__data[row][col] = self.__data[row][col] + other.__data[row][col]
-        
-        return res_aux
-
-
-    def __add__(self, other : Tensor) -> Tensor:
-        
-        # Check if the tensors have the same dimentions and that they are, at most, 2-dimensional
-        if self.__shape != other.__shape or self.__dim > 2 or other.__dim > 2:
-            raise Exception("Error! Addition is only defined between tensors of the same dimention, and is not supported (as for v.1.0.0) for tensors that have more than 2 dimensions")
 
-        res : Tensor
+    def __rmul__(self, other : int | float) -> Tensor:
+        return self * other
 
-        # Vector addition
-        if self.__dim == 1:
-            res = self.__vect_add(other)
+    def __matmul__(self, other : Tensor) -> Tensor:
+        return self * other
 
-        # Matrix addition
-        elif self.__dim == 2:
-            res = self.__matrix_add(other)
-        
-        return res
-    
-    def __sub__(self, other : Tensor) -> Tensor:
-        # Check if the tensors have the same dimentions and that they are, at most, 2-dimensional
-        if self.__shape != other.__shape or self.__dim > 2 or other.__dim > 2:
-            raise Exception("Error! Substraction is only defined between tensors of the same dimention, and is not supported (as for v.1.0.0) for tensors that have more than 2 dimensions")
+    def mul(self, other : int | float | Tensor) -> Tensor:
 
-        res : Tensor
+        """
+            Element-wise (Hadamard) multiplication. Shapes are broadcast following NumPy's broadcasting rules.
+        """
 
-        # Vector substraction
-        if self.__dim == 1:
-            res = self.__vect_add(other * (-1))
+        return Mul.apply(self, self.__broadcast(other, "Element-wise multiplication"))
 
-        # Matrix substraction
-        elif self.__dim == 2:
-            res = self.__matrix_add(other * (-1))
-        
-        return res
+    def __add__(self, other : int | float | Tensor) -> Tensor:
+        return Add.apply(self, self.__broadcast(other, "Addition"))
 
-    def __repr__(self):
-        return f"Tensor({self.__data})"
-    
-    def __getitem__(self, index):
-        if self.__dim == 1:
-            return Tensor([self.__data[index],]) 
+    def __sub__(self, other : int | float | Tensor) -> Tensor:
+        return Sub.apply(self, self.__broadcast(other, "Substraction"))
+
+    def __truediv__(self, other : int | float | Tensor) -> Tensor:
+        return Div.apply(self, self.__broadcast(other, "Division"))
+
+    def __pow__(self, other : int | float | Tensor) -> Tensor:
+        return Pow.apply(self, self.__broadcast(other, "Exponentiation"))
+
+    def __neg__(self) -> Tensor:
+        return Neg.apply(self)
+
+    def __radd__(self, other : int | float) -> Tensor:
+        return self + other
+
+    def __rsub__(self, other : int | float) -> Tensor:
+        return self.__wrapTensor(other) - self
+
+    def __rtruediv__(self, other : int | float) -> Tensor:
+        return self.__wrapTensor(other) / self
+
+    def __rpow__(self, other : int | float) -> Tensor:
+        return self.__wrapTensor(other) ** self
+
+    def sum(self, axis : int | Tuple[int] = None, keepdims : bool = False) -> Tensor:
+
+        """
+            Sums the elements of the tensor along the given axis (or axes). If ``axis = None``, all the elements are added up into a one (1) element vector.
+        """
+
+        return Sum.apply(self, axis=axis, keepdims=keepdims)
+
+    def mean(self, axis : int | Tuple[int] = None, keepdims : bool = False) -> Tensor:
+
+        """
+            Computes the mean of the elements of the tensor along the given axis (or axes). If ``axis = None``, the mean of all the elements is computed.
+        """
+
+        return Mean.apply(self, axis=axis, keepdims=keepdims)
+
+    def max(self, axis : int | Tuple[int] = None, keepdims : bool = False) -> Tensor:
+
+        """
+            Computes the maximum of the elements of the tensor along the given axis (or axes). If ``axis = None``, the maximum of all the elements is computed.
+        """
+
+        return Max.apply(self, axis=axis, keepdims=keepdims)
+
+    def relu(self) -> Tensor:
+
+        """
+            Evaluates the ReLU (Rectified Linear Unit) function element-wise.
+        """
+
+        return ReLU.apply(self)
+
+    def sigmoid(self) -> Tensor:
+
+        """
+            Evaluates the sigmoid function element-wise.
+        """
+
+        return Sigmoid.apply(self)
+
+    def log(self) -> Tensor:
+
+        """
+            Compute the natural logarithm (logarithm base *e*) element-wise.
+        """
+
+        return Log.apply(self)
+
+    def __topological_sort(self) -> List[Tensor]:
+
+        """
+            Returns all the tensors of the graph whose root is the current object, sorted so that every tensor comes after all of its children.
+            The graph is traversed with an explicit stack, so its depth is not bounded by Python's recursion limit.
+        """
+
+        topo : List[Tensor] = []
+        visited = set()
+
+        # Each entry of the stack is a tensor and whether its children have already been pushed
+        stack : List[Tuple[Tensor, bool]] = [(self, False)]
+
+        while stack:
+            t, expanded = stack.pop()
+
+            # All the children of the tensor are already in the list, so the tensor can be added too
+            if expanded:
+                topo.append(t)
+
+            elif t not in visited:
+                visited.add(t)
+                stack.append((t, True))
+                if t.grad_fn is not None:
+                    for child in t.grad_fn.inputs:
+                        if child not in visited:
+                            stack.append((child, False))
+
+        return topo
+
+    def backward(self, retain_graph : bool = False, gradient : np.ndarray = None) -> None:
+
+        """
+            Differentiates the **function whose value is the current object** with respect to all of the tensors in the graph whose root is the current object.
+            Differentiation is performed using **reverse automatic differentiation**, one tensor operation at a time.
+
+            If ``gradient`` is given, it's used as the gradient of the current object (instead of ones), so that the backward pass of a larger function can be continued through this graph.
+
+            By default, every node of the graph is **released** as soon as its gradient has been propagated: its references to its inputs and saved arrays are dropped,
+            so the whole graph is freed during the backward pass and can not be differentiated again.
+            If ``retain_graph = True``, the graph is kept, and its topological order is cached in the current object, so that the next calls to this method reuse it instead of traversing the graph again.
+
+            Gradients of the leaves are **accumulated** (added) across calls, so a large batch can be split into micro-batches whose graphs are freed one after another:
+
+            .. code-block:: python
+
+                optim.zero_grad()
+                for x, y in micro_batches:
+                    loss = loss_fn(model(x), y) / len(micro_batches)
+                    loss.backward()     # The graph of this micro-batch is freed here
+                optim.step()
+        """
+
+        if not self.requires_grad:
+            raise Exception("Error! This tensor does not require gradient, so it can not be differentiated")
+
+        if self.grad_fn is not None and self.grad_fn.released:
+            raise Exception("Error! The graph of this tensor was already freed by a previous backward pass. Use backward(retain_graph=True) to differentiate it more than once")
+
+        # Topological sort of the graph is performed in order to iterate non-recursively through all the nodes.
+        topo : List[Tensor] = self.__topo if self.__topo is not None else self.__topological_sort()
+
+        self.__topo = topo if retain_graph else None
+
+        # The gradient of the root node is 1 (partial derivate of the function w.r.t itself is 1)
+        seed : np.ndarray
+        if gradient is None:
+            seed = np.ones_like(self.__data)
         else:
-            return Tensor(self.__data[index])
-    
+            seed = np.array(gradient, dtype=self.__data.dtype).reshape(self.__shape)
+
+        # Gradients of the intermediate tensors only live during this call, so that a retained graph is differentiated from scratch every time.
+        # Each one is dropped as soon as it's propagated to the inputs of its operation. Only the leaves accumulate their gradients in their grad attribute
+        grads : Dict[Tensor, np.ndarray | SparseGrad] = {}
+        if self.grad_fn is None:
+            self.grad = seed
+        else:
+            grads[self] = seed
+
+        # Differentiate the function w.r.t all the other tensors, one operation at a time
+        for i in range(len(topo) - 1, -1, -1):
+            t = topo[i]
+            if t.grad_fn is None or t not in grads:
+                continue
+
+            if t.grad_fn.released:
+                raise Exception("Error! Part of this graph was already freed by a previous backward pass. Use backward(retain_graph=True) to differentiate it more than once")
+
+            # Operations only receive dense gradients
+            grad = grads.pop(t)
+            if isinstance(grad, SparseGrad):
+                grad = grad.to_dense()
+
+            for child, child_grad in zip(t.grad_fn.inputs, t.grad_fn.backward(grad)):
+                if child_grad is None:
+                    continue
+                if child.grad_fn is None:
+                    child.__accumulate_grad(child_grad)
+                else:
+                    grads[child] = child.__sum_grads(grads.get(child), child_grad)
+
+            if not retain_graph:
+                t.grad_fn.release()
+
+    def __repr__(self):
+        return f"Tensor({self.__data.tolist()})"
+
+    def __getitem__(self, index) -> Tensor:
+        """
+            Indexing and slicing return views that share the data of this object (except for lists of indices, which copy it).
+        """
+        return Index.apply(self, index=index)
+
     def __len__(self):
-        return len(self.__data)
-    
+        return self.__shape[0]
+
     def to_list(self) -> List:
         """
             Return the Tensor object as a python list
         """
-        return deepcopy(self.__data)
+        return self.__data.tolist()
 
-    def item(self) -> Value:
+    def item(self) -> float:
         """
-            Only usable for 1-dimensional Tensor objects that have one element: returns a the element of the Tensor object wrapped in a Value object.
+            Only usable for 1-dimensional Tensor objects that have one element: returns the element of the Tensor object as a float.
         """
-        if self.__dim == 1 and len(self.__data) == 1:
-            return self.__data[0]
+        if self.__dim == 1 and self.__shape[0] == 1:
+            return float(self.__data[0])
         else:
             raise Exception("Error! This method is not applicable for Tensor objects that have more than one element or that have a dimension greater than one (1). In this case, refer to the method 'to_list'")
 
@@ -295,9 +517,59 @@ class Tensor:
         """
             Returns the shape of this object. Shape is interpreted as (Batch Size, Number of Channels, Rows, Columns)
         """
-        return deepcopy(self.__shape)
+        return self.__shape
+
+    def dtype(self) -> np.dtype:
+        """
+            Returns the type the elements of this object are stored as.
+        """
+        return self.__data.dtype
+
+    def serial(self) -> int:
+        """
+            Returns the creation order of this object: tensors created later have greater serial numbers (see :func:`next_serial`).
+            Numbers wrapped by an operation (e.g: the ``2`` in ``x * 2``) have serial ``-1``, as if they existed before any other tensor.
+        """
+        return self.__serial
+
+    def to(self, dtype : np.dtype | str) -> Tensor:
+        """
+            Returns a copy of the current object stored as the given type (see :data:`DTYPES`), or the current object itself if it's already stored as it.
+            The gradient flowing back through the copy is converted to the type of the current object.
+        """
+        dtype = check_dtype(dtype)
+
+        if dtype == self.__data.dtype:
+            return self
+
+        return Cast.apply(self, dtype=dtype)
+
+    def set_storage(self, buffer : np.ndarray, copy : bool = True) -> None:
+        """
+            Moves the data of this object into the given buffer (with the same number of elements), which becomes the storage of the tensor from then on.
+            It's used by the optimizers to pack all the parameters of a model into a single contiguous buffer.
+
+            If ``copy = False``, the data of the tensor is not copied: the tensor takes the elements that the buffer already holds (e.g: a memory-mapped file).
+            In that case, the tensor is stored as the type of the buffer from then on (see :data:`DTYPES`).
+        """
+        if not copy:
+            check_dtype(buffer.dtype)
+
+        if buffer.size != self.__data.size:
+            raise Exception(f"Error! A buffer of {buffer.size} elements can not store a tensor of shape {self.__shape}")
+
+        storage = buffer.reshape(self.__shape)
+        if copy:
+            storage[...] = self.__data
+        self.__data = storage
 
-    def transpose(self):
+    def strides(self) -> Tuple[int]:
+        """
+            Returns the strides of this object: how many elements of the buffer have to be skipped in order to move one position along each dimension.
+        """
+        return tuple(stride // self.__data.itemsize for stride in self.__data.strides)
+
+    def transpose(self) -> Tensor:
         """
             Transpose the current object. Only applicable to scalars, vectors or matrices.
         """
@@ -305,6 +577,55 @@ class Tensor:
         if self.__dim > 2:
             raise Exception("Error! Transposition is only defined for scalars, vectors or matrices! (0-dimension, 1-dimension or 2-dimension tensors)")
 
-        new_data = [list(row) for row in zip(*self.__data)]
+        return Transpose.apply(self)
+
+    def reshape(self, *shape : int) -> Tensor:
+        """
+            Returns a tensor with the same elements of the current object and the given shape. One of the dimensions can be -1, in which case it is inferred.
+            The result is a view that shares the data of the current object, unless its layout does not allow it (e.g: a transposed matrix).
+        """
+
+        # The shape can be passed as a tuple or as separate integers
+        if len(shape) == 1 and isinstance(shape[0], (tuple, list)):
+            shape = tuple(shape[0])
+
+        try:
+            return Reshape.apply(self, shape=tuple(shape))
+        except ValueError:
+            raise Exception(f"Error! A tensor of shape {self.__shape} can not be reshaped to {tuple(shape)}")
+
+    def flatten(self) -> Tensor:
+        """
+            Returns a vector (1-dimensional tensor) with all the elements of the current object.
+        """
+        return self.reshape(-1)
+
+    def unsqueeze(self, axis : int) -> Tensor:
+        """
+            Returns a view of the current object with a new dimension of size one (1) inserted at the given position.
+        """
+        # Negative positions are counted from the end, as in Python lists
+        if axis < 0:
+            axis += self.__dim + 1
+
+        if axis < 0 or axis > self.__dim:
+            raise Exception(f"Error! A new dimension can not be inserted at position {axis} of a tensor with {self.__dim} dimensions")
+
+        return self.reshape(self.__shape[:axis] + (1,) + self.__shape[axis:])
+
+    def squeeze(self, axis : int | Tuple[int] = None) -> Tensor:
+        """
+            Returns a view of the current object without the dimensions of size one (1) (or only the given ones). At least one (1) dimension is always kept.
+        """
+        axes : Tuple[int]
+        if axis is None:
+            axes = tuple(i for i, size in enumerate(self.__shape) if size == 1)
+        else:
+            axes = tuple(i % self.__dim for i in ((axis,) if isinstance(axis, int) else axis))
+
+        if any(self.__shape[i] != 1 for i in axes):
+            raise Exception("Error! Only dimensions of size one (1) can be squeezed")
+
+        shape = tuple(size for i, size in enumerate(self.__shape) if i not in axes)
 
-        return Tensor(new_data)
\ No newline at end of file
+        return self.reshape(shape if len(shape) > 0 else (1,))
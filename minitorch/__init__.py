@@ -1,2 +1,7 @@
 from .Tensor import Tensor
-from .Autograd import Value
\ No newline at end of file
+from .SparseTensor import SparseTensor
+from .SparseGrad import SparseGrad
+from .Autograd import Value, no_grad, set_inference_mode, is_grad_enabled
+from .Function import Function
+from .Kernels import set_num_threads, get_num_threads
+from .Serialization import save, load
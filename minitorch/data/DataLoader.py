@@ -0,0 +1,266 @@
+from minitorch.Tensor import Tensor, DTYPES, check_dtype
+from minitorch.data.Dataset import Dataset
+from minitorch.data.IterableDataset import IterableDataset
+from minitorch.data.TensorDataset import TensorDataset
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from typing import Any, Callable, Deque, Iterator, List, Tuple
+import queue
+import threading
+
+import numpy as np
+
+
+def collate(samples : List[Any], dtype : np.dtype | str = None) -> Tensor | Tuple[Tensor]:
+
+    """
+        Default collation function: stacks a list of samples into a batch. Every field of the samples is written directly into a single
+        contiguous buffer of floats (preallocated with the shape of the batch), which is wrapped by a :class:`minitorch.Tensor` without copying it.
+        If the samples are tuples, a tuple with one batch per field is returned.
+
+        The batch is stored as ``dtype`` (see :data:`minitorch.Tensor.DTYPES`). By default, it keeps the type of the first sample if it's a tensor
+        or an array of one of those types, and it's ``float64`` otherwise. Use ``functools.partial(collate, dtype=...)`` as the ``collate_fn`` of a
+        :class:`DataLoader` to convert the samples.
+    """
+
+    first = samples[0]
+    if isinstance(first, tuple):
+        return tuple(collate([sample[i] for sample in samples], dtype) for i in range(len(first)))
+
+    data = first.data if isinstance(first, Tensor) else np.asarray(first)
+    shape = data.shape
+
+    if dtype is not None:
+        dtype = check_dtype(dtype)
+    else:
+        dtype = data.dtype if data.dtype in DTYPES else DTYPES[0]
+
+    # Scalars are batched as a column, so a batch is always at least a matrix
+    batch = np.empty((len(samples),) + (shape if len(shape) > 0 else (1,)), dtype=dtype)
+    try:
+        for i, sample in enumerate(samples):
+            batch[i] = sample.data if isinstance(sample, Tensor) else sample
+    except (TypeError, ValueError):
+        raise Exception(f"Error! All the samples of a batch must have the same shape {shape}")
+
+    return Tensor(batch)
+
+
+class DataLoader:
+
+    """
+    ===========
+    **Summary**
+    ===========
+
+        Iterates over a dataset in **batches**. Every batch is a :class:`minitorch.Tensor` (or a tuple of tensors, if the samples are tuples),
+        whose rows are the samples of the batch.
+
+        * **Map-style datasets** (:class:`Dataset`): samples are read by index. If ``shuffle = True``, the order of the indices is shuffled on every epoch.
+        * **Streaming datasets** (:class:`IterableDataset`): samples are read as they are produced. If ``shuffle = True``, they are shuffled through a **shuffle buffer**:
+          the buffer is filled with the first samples, and every new sample takes the place of a random one of the buffer, which is yielded.
+          Only ``shuffle_buffer`` samples are held in memory at a time.
+
+        If ``num_workers > 0``, batches are loaded by **background threads** while the previous ones are being used, so loading overlaps with computation.
+        Up to ``prefetch`` batches per worker are loaded ahead. Map-style datasets are loaded by ``num_workers`` threads (batches are still yielded in order),
+        and streaming datasets by a single thread, because their samples come one after another.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **dataset:** (:class:`Dataset` | :class:`IterableDataset`) Dataset to load.
+        * **batch_size:** (*int*) Number of samples per batch. Default is 1.
+        * **shuffle:** (*bool*) If ``True``, samples are shuffled. Default is ``False``.
+        * **drop_last:** (*bool*) If ``True``, the last batch is dropped when it has fewer than ``batch_size`` samples. Default is ``False``.
+        * **shuffle_buffer:** (*int*) Size of the shuffle buffer for streaming datasets. Default is 1024.
+        * **num_workers:** (*int*) Number of background threads that load batches. Default is 0 (batches are loaded when they are asked for).
+        * **prefetch:** (*int*) Number of batches loaded ahead per worker. Default is 2.
+        * **collate_fn:** (*callable*) Function that builds a batch from a list of samples. Default is :func:`collate`.
+        * **seed:** (*int*) Seed of the random number generator used for shuffling.
+
+    ======================
+    **Instance Variables**
+    ======================
+
+        * **dataset:** (:class:`Dataset` | :class:`IterableDataset`) Dataset to load.
+        * **batch_size:** (*int*) Number of samples per batch.
+
+    ===========
+    **Example**
+    ===========
+
+        .. code-block:: python
+
+            loader = DataLoader(TensorDataset(inputs, labels), batch_size=32, shuffle=True, num_workers=2)
+
+            for epoch in range(epochs):
+                for batch_inputs, batch_labels in loader:
+                    optim_sgd.zero_grad()
+                    loss = loss_fn(model(batch_inputs), batch_labels)
+                    loss.backward()
+                    optim_sgd.step()
+
+    """
+
+    def __init__(self,
+                 dataset : Dataset | IterableDataset,
+                 batch_size : int = 1,
+                 shuffle : bool = False,
+                 drop_last : bool = False,
+                 shuffle_buffer : int = 1024,
+                 num_workers : int = 0,
+                 prefetch : int = 2,
+                 collate_fn : Callable[[List[Any]], Any] = None,
+                 seed : int = None):
+
+        if batch_size < 1 or shuffle_buffer < 1 or prefetch < 1 or num_workers < 0:
+            raise Exception("Error! The batch size, the shuffle buffer and the prefetch must be at least one (1), and the number of workers can not be negative")
+
+        self.dataset : Dataset | IterableDataset = dataset
+        self.batch_size : int = batch_size
+        self.shuffle : bool = shuffle
+        self.drop_last : bool = drop_last
+        self.shuffle_buffer : int = shuffle_buffer
+        self.num_workers : int = num_workers
+        self.prefetch : int = prefetch
+        self.collate_fn : Callable[[List[Any]], Any] = collate_fn if collate_fn is not None else collate
+
+        self.__rng : np.random.Generator = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        """
+            Returns the number of batches per epoch. It's only known for map-style datasets.
+        """
+        if isinstance(self.dataset, IterableDataset):
+            # NOTE: TypeError is what Python expects from objects without length (e.g: list() relies on it)
+            raise TypeError("Error! The number of batches of a streaming dataset is not known in advance")
+
+        n = len(self.dataset)
+        return n // self.batch_size if self.drop_last else -(-n // self.batch_size)
+
+    def __iter__(self) -> Iterator[Any]:
+        if isinstance(self.dataset, IterableDataset):
+            batches = self.__stream_batches()
+            return batches if self.num_workers == 0 else self.__prefetch_stream(batches)
+
+        return self.__map_batches()
+
+    # **** Map-style datasets **** #
+
+    def __load(self, indices : np.ndarray) -> Any:
+        """
+            Loads and collates the samples with the given indices.
+        """
+        # Rows of a TensorDataset are gathered all at once
+        if isinstance(self.dataset, TensorDataset) and self.collate_fn is collate:
+            batch = tuple(Tensor(rows if rows.ndim > 1 else rows.reshape(-1, 1)) for rows in self.dataset.rows(indices))
+            return batch if len(batch) > 1 else batch[0]
+
+        return self.collate_fn([self.dataset[int(i)] for i in indices])
+
+    def __map_batches(self) -> Iterator[Any]:
+        n = len(self.dataset)
+        order = self.__rng.permutation(n) if self.shuffle else np.arange(n)
+
+        end = n - n % self.batch_size if self.drop_last else n
+        batches = [order[i:i+self.batch_size] for i in range(0, end, self.batch_size)]
+
+        if self.num_workers == 0:
+            for indices in batches:
+                yield self.__load(indices)
+            return
+
+        # Batches are submitted ahead to the workers, and yielded in order as they are completed
+        with ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix="minitorch-loader") as pool:
+            pending : Deque[Future] = deque()
+            next_batch = 0
+            try:
+                while next_batch < len(batches) or pending:
+                    while next_batch < len(batches) and len(pending) < self.num_workers*self.prefetch:
+                        pending.append(pool.submit(self.__load, batches[next_batch]))
+                        next_batch += 1
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    # **** Streaming datasets **** #
+
+    def __stream_samples(self) -> Iterator[Any]:
+        """
+            Yields the samples of the streaming dataset, shuffled through the shuffle buffer if needed.
+        """
+        if not self.shuffle:
+            yield from self.dataset
+            return
+
+        buffer : List[Any] = []
+        for sample in self.dataset:
+            if len(buffer) < self.shuffle_buffer:
+                buffer.append(sample)
+                continue
+
+            # The new sample takes the place of a random sample of the buffer, which is yielded
+            i = int(self.__rng.integers(len(buffer)))
+            buffer[i], sample = sample, buffer[i]
+            yield sample
+
+        # Remaining samples are yielded in random order
+        for i in self.__rng.permutation(len(buffer)):
+            yield buffer[i]
+
+    def __stream_batches(self) -> Iterator[Any]:
+        samples : List[Any] = []
+        for sample in self.__stream_samples():
+            samples.append(sample)
+            if len(samples) == self.batch_size:
+                yield self.collate_fn(samples)
+                samples = []
+
+        if samples and not self.drop_last:
+            yield self.collate_fn(samples)
+
+    def __prefetch_stream(self, batches : Iterator[Any]) -> Iterator[Any]:
+        """
+            Runs the streaming pipeline in a background thread, which keeps up to ``num_workers*prefetch`` batches ready in a queue.
+        """
+        ready : queue.Queue = queue.Queue(maxsize=self.num_workers*self.prefetch)
+        stop = threading.Event()
+
+        # Marks the end of the stream
+        done = object()
+
+        def put(item) -> bool:
+            # Waits for room in the queue, unless the consumer stopped iterating
+            while not stop.is_set():
+                try:
+                    ready.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce() -> None:
+            try:
+                for batch in batches:
+                    if not put((batch, None)):
+                        return
+                put((done, None))
+            except BaseException as e:
+                put((done, e))
+
+        worker = threading.Thread(target=produce, name="minitorch-loader", daemon=True)
+        worker.start()
+
+        try:
+            while True:
+                batch, error = ready.get()
+                if error is not None:
+                    raise error
+                if batch is done:
+                    return
+                yield batch
+        finally:
+            stop.set()
+            worker.join()
@@ -0,0 +1,44 @@
+from typing import Any
+
+
+class Dataset:
+
+    """
+    ===========
+    **Summary**
+    ===========
+
+        Base class for **map-style** datasets: datasets whose samples can be read in any order, by their index.
+
+        Subclasses must override :meth:`__getitem__` and :meth:`__len__`. A sample can be a number, a list, a NumPy array, a :class:`minitorch.Tensor`,
+        or a tuple of any of them (e.g: an input and its label). Samples are batched by :class:`DataLoader`.
+
+    ===========
+    **Example**
+    ===========
+
+        .. code-block:: python
+
+            class ANDGate(Dataset):
+                def __init__(self):
+                    self.samples = [([0,0], [0]), ([0,1], [0]), ([1,0], [0]), ([1,1], [1])]
+
+                def __getitem__(self, index):
+                    return self.samples[index]
+
+                def __len__(self):
+                    return len(self.samples)
+
+    """
+
+    def __getitem__(self, index : int) -> Any:
+        """
+            Returns the sample at the given index.
+        """
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        """
+            Returns the number of samples of the dataset.
+        """
+        raise NotImplementedError
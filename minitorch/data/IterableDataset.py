@@ -0,0 +1,39 @@
+from typing import Any, Iterator
+
+
+class IterableDataset:
+
+    """
+    ===========
+    **Summary**
+    ===========
+
+        Base class for **streaming** datasets: datasets whose samples are produced one after another (e.g: read from a file or generated on the fly),
+        so they never have to be held in memory all at once.
+
+        Subclasses must override :meth:`__iter__`, usually as a generator. Every call must start a new pass over the data (a new epoch).
+        Samples have the same format as the ones of :class:`Dataset`.
+
+    ===========
+    **Example**
+    ===========
+
+        .. code-block:: python
+
+            class CSVLines(IterableDataset):
+                def __init__(self, path):
+                    self.path = path
+
+                def __iter__(self):
+                    with open(self.path) as file:
+                        for line in file:
+                            *features, label = map(float, line.split(","))
+                            yield features, [label]
+
+    """
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+            Returns an iterator over the samples of the dataset.
+        """
+        raise NotImplementedError
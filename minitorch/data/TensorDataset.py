@@ -0,0 +1,55 @@
+from minitorch.Tensor import Tensor, DTYPES
+from minitorch.data.Dataset import Dataset
+from typing import Tuple
+
+import numpy as np
+
+
+class TensorDataset(Dataset):
+
+    """
+    ===========
+    **Summary**
+    ===========
+
+        Dataset whose samples are the rows of one or more tensors (or arrays) with the same number of rows, e.g: the inputs and the labels of a whole training set.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **__arrays:** (*Tuple[np.ndarray]*) Raw data of the tensors. Arrays of ``float32`` or ``float16`` keep their type, and other arrays are stored as ``float64``.
+
+    ===========
+    **Example**
+    ===========
+
+        >>> dataset = TensorDataset(Tensor([[0,0], [0,1], [1,0], [1,1]]), Tensor([[0], [0], [0], [1]]))
+        >>> dataset[3] # (array([1., 1.]), array([1.]))
+
+    """
+
+    def __init__(self, *tensors : Tensor | np.ndarray):
+
+        if len(tensors) == 0:
+            raise Exception("Error! At least one tensor is needed")
+
+        # Arrays keep their type if tensors can be stored as it (e.g: float32), so that batches are not promoted. Anything else (e.g: integers or lists) is stored as float64
+        arrays = (t.data if isinstance(t, Tensor) else np.asarray(t) for t in tensors)
+        self.__arrays : Tuple[np.ndarray] = tuple(a if a.dtype in DTYPES else a.astype(np.float64) for a in arrays)
+
+        if any(len(a) != len(self.__arrays[0]) for a in self.__arrays):
+            raise Exception("Error! All the tensors of a TensorDataset must have the same number of rows")
+
+    def __getitem__(self, index : int) -> Tuple[np.ndarray] | np.ndarray:
+        sample = tuple(a[index] for a in self.__arrays)
+        return sample if len(sample) > 1 else sample[0]
+
+    def __len__(self) -> int:
+        return len(self.__arrays[0])
+
+    def rows(self, indices : np.ndarray) -> Tuple[np.ndarray]:
+        """
+            Returns the given rows of every tensor at once, already stacked in contiguous arrays (it's used by :class:`DataLoader` to build whole batches without collating the samples one by one).
+        """
+        return tuple(a[indices] for a in self.__arrays)
@@ -0,0 +1,9 @@
+"""
+    minitorch.data is a minitorch package that contains the utilities for loading datasets in batches: map-style and streaming datasets,
+    and a DataLoader that shuffles, batches and prefetches them.
+"""
+
+from .Dataset import Dataset
+from .IterableDataset import IterableDataset
+from .TensorDataset import TensorDataset
+from .DataLoader import DataLoader, collate
@@ -0,0 +1,299 @@
+from minitorch.Tensor import Tensor, next_serial
+from minitorch.Function import Function, recording
+from minitorch.SparseGrad import SparseGrad
+from minitorch.nn.Module import Module
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+class Slot:
+    """
+        Stands for one of the tensors of a traced graph inside the nodes that are replayed. Only remembers what the nodes need to know about it.
+    """
+
+    __slots__ = ("shape", "dtype", "requires_grad")
+
+    def __init__(self, shape : Tuple[int], dtype : np.dtype, requires_grad : bool):
+        self.shape : Tuple[int] = shape
+        self.dtype : np.dtype = dtype
+        self.requires_grad : bool = requires_grad
+
+
+class ExecutionPlan:
+
+    """
+    ===========
+    **Summary**
+    ===========
+
+        Flat list of the operations of a traced model, ready to be replayed without any dispatching, graph building or graph sorting.
+
+        Every tensor of the traced graph is given a **slot** (an index). The forward pass is a list of steps that read the raw data of some slots and write the raw data of another one.
+        Intermediate results are released as soon as no other step reads them.
+
+        The backward pass is the same list of steps in reverse order. The gradient of each slot is written into a buffer that is **preallocated** when the plan is built,
+        and buffers are **reused** by slots whose gradients are never alive at the same time.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **tape:** (*List[Tuple]*) Operations recorded while tracing the model (see :func:`Function.recording`).
+        * **example_input:** (:class:`Tensor.Tensor`) Input the model was traced with.
+        * **output:** (:class:`Tensor.Tensor`) Output of the traced model.
+        * **start_serial:** (*int*) Serial number taken right before the model was run (see :func:`Tensor.next_serial`). Leaves created afterwards are rejected.
+
+    ======================
+    **Instance Variables**
+    ======================
+
+        * **slots:** (*List[Slot]*) Shape, type and gradient requirement of every slot.
+        * **leaves:** (*List[Tensor]*) Tensors that are not computed by the model (parameters and constants). They are read again on every replay, so updates to the parameters are seen.
+        * **input_slots:** (*List[int]*) Slots of the input of the model (the first one) and of the leaves, in that order.
+        * **output_slot:** (*int*) Slot of the output of the model.
+        * **steps:** (*List[Tuple]*) Forward steps: (Function subclass, input slots, keyword arguments, output slot, slots to release after the step).
+        * **backward_writes:** (*List[List[Tuple]]*) For every step, in backward order, where to write the gradient of each of its inputs: (gradient buffer, ``True`` if it's the first write into it).
+
+    """
+
+    def __init__(self, tape : List[Tuple], example_input : Tensor, output : Tensor, start_serial : int = -1):
+
+        slot_of : Dict[int, int] = {}
+        self.slots : List[Slot] = []
+        self.leaves : List[Tensor] = []
+
+        def new_slot(t : Tensor, requires_grad : bool) -> int:
+            slot_of[id(t)] = len(self.slots)
+            self.slots.append(Slot(t.shape(), t.dtype(), requires_grad))
+            return slot_of[id(t)]
+
+        new_slot(example_input, example_input.requires_grad)
+
+        # **** Forward steps **** #
+
+        self.steps : List[Tuple] = []
+        for function, inputs, kwargs, out in tape:
+            in_slots : List[int] = []
+            for t in inputs:
+                # Tensors that are not computed by any step are leaves of the graph
+                if id(t) not in slot_of:
+                    # A tensor created while the model was run is not a parameter: it was built from the data of this example (e.g: outside of
+                    # the operations, with NumPy), so replaying it as a constant would silently give wrong results for any other input
+                    if t.serial() > start_serial >= 0:
+                        raise Exception("Error! The traced model creates a tensor that is not computed by an operation (e.g: from the raw data of another tensor), so it would be frozen as a constant. Only parameters and tensors created before tracing can be used as constants")
+                    self.leaves.append(t)
+                    new_slot(t, t.requires_grad)
+                in_slots.append(slot_of[id(t)])
+
+            requires_grad = any(self.slots[i].requires_grad for i in in_slots)
+            self.steps.append((function, tuple(in_slots), kwargs, new_slot(out, requires_grad), []))
+
+        computed = {step[3] for step in self.steps}
+        if not isinstance(output, Tensor) or slot_of.get(id(output)) not in computed:
+            raise Exception("Error! The output of the traced model must be a tensor computed by the model")
+
+        # Slots computed from the input. If the output is not one of them, the input is used outside of the operations, so the plan would ignore it
+        from_input = {0}
+        for _, in_slots, _, out_slot, _ in self.steps:
+            if any(slot in from_input for slot in in_slots):
+                from_input.add(out_slot)
+        if slot_of[id(output)] not in from_input:
+            raise Exception("Error! The output of the traced model does not depend on its input through the recorded operations, so it would be a constant. Make sure the input is only used through tensor operations")
+
+        self.output_slot : int = slot_of[id(output)]
+        self.input_slots : List[int] = [0] + [slot_of[id(t)] for t in self.leaves]
+
+        # Intermediate results are released right after the last step that reads them
+        computed.discard(self.output_slot)
+        last_read : Dict[int, int] = {}
+        for i, (_, in_slots, _, out_slot, _) in enumerate(self.steps):
+            for slot in in_slots:
+                last_read[slot] = i
+            last_read.setdefault(out_slot, i)
+        for slot in computed:
+            self.steps[last_read[slot]][4].append(slot)
+
+        # **** Backward steps **** #
+
+        # Gradient buffers are assigned walking the steps in backward order. The gradient of a computed slot is alive from the first step that writes it
+        # until the step that computed the slot consumes it. The gradients of the input and the leaves are alive until the end
+        free : Dict[Tuple, List[np.ndarray]] = {}
+        buffer_of : Dict[int, np.ndarray] = {}
+
+        # Only the slots the output depends on receive a gradient
+        reached = {self.output_slot}
+
+        self.backward_writes : List[List[Tuple]] = []
+        for _, in_slots, _, out_slot, _ in reversed(self.steps):
+            writes : List[Tuple] = []
+            for slot in in_slots:
+                if not self.slots[slot].requires_grad or out_slot not in reached:
+                    writes.append((None, False))
+                    continue
+                if slot in buffer_of:
+                    writes.append((buffer_of[slot], False))
+                else:
+                    key = (self.slots[slot].shape, self.slots[slot].dtype)
+                    buffer_of[slot] = free[key].pop() if free.get(key) else np.empty(key[0], dtype=key[1])
+                    writes.append((buffer_of[slot], True))
+                reached.add(slot)
+            self.backward_writes.append(writes)
+
+            # The gradient of the output of this step is not needed anymore, so its buffer can be reused
+            if out_slot in buffer_of:
+                free.setdefault((self.slots[out_slot].shape, self.slots[out_slot].dtype), []).append(buffer_of.pop(out_slot))
+
+        self.__grad_buffers : Dict[int, np.ndarray] = buffer_of
+
+    def grad_buffer(self, slot : int) -> np.ndarray:
+        """
+            Returns the buffer the gradient of an input (or leaf) slot is written into, or ``None`` if it does not require gradient.
+        """
+        return self.__grad_buffers.get(slot)
+
+
+class Replay(Function):
+    """
+        Node of the computation graph that stands for a whole traced model. Its forward and backward passes replay an :class:`ExecutionPlan`.
+    """
+
+    def forward(self, *arrays, plan):
+        self.plan = plan
+        self.nodes : List[Function] = []
+
+        buffers : List[np.ndarray] = [None]*len(plan.slots)
+        for slot, array in zip(plan.input_slots, arrays):
+            buffers[slot] = array
+
+        for function, in_slots, kwargs, out_slot, release in plan.steps:
+            node = function(*(plan.slots[i] for i in in_slots))
+            buffers[out_slot] = node.forward(*(buffers[i] for i in in_slots), **kwargs)
+            self.nodes.append(node)
+
+            for slot in release:
+                buffers[slot] = None
+
+        return buffers[plan.output_slot]
+
+    def backward(self, grad):
+        plan = self.plan
+
+        grads : List[np.ndarray] = [None]*len(plan.slots)
+        grads[plan.output_slot] = grad
+
+        for node, step, writes in zip(reversed(self.nodes), reversed(plan.steps), plan.backward_writes):
+            out_slot = step[3]
+            if grads[out_slot] is None:
+                continue
+
+            for slot, res, (buffer, first) in zip(step[1], node.backward(grads[out_slot]), writes):
+                if buffer is None:
+                    continue
+                if res is None:
+                    # Nothing is written (e.g: the gradient was accumulated directly by a checkpointed segment), so later writes must add to zeros
+                    if first:
+                        buffer.fill(0)
+                    continue
+                if isinstance(res, SparseGrad):
+                    # Row-sparse gradients are scattered into the dense buffer
+                    if first:
+                        res.to_dense(out=buffer)
+                    else:
+                        res.add_to(buffer)
+                elif first:
+                    np.copyto(buffer, res)
+                else:
+                    buffer += res
+                grads[slot] = buffer
+
+            grads[out_slot] = None
+
+        return tuple(grads[slot] for slot in plan.input_slots)
+
+    def release(self) -> None:
+        super().release()
+        self.nodes = None
+
+
+class TracedModule(Module):
+
+    """
+    ===========
+    **Summary**
+    ===========
+
+        A model compiled into a static graph by :func:`trace`.
+
+        Calling it replays the recorded :class:`ExecutionPlan` over the raw data of the tensors: there is no per-operation dispatching nor graph building,
+        and the whole model is a single node of the computation graph, so it can be used together with any loss function or optimizer.
+
+        .. warning::
+            The plan is fixed: the input must always have the shape, type and ``requires_grad`` of the example input, parameters can not be converted, frozen or unfrozen,
+            and Python control flow that depends on the data is frozen as it was while tracing.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **__plan:** (:class:`ExecutionPlan`) Execution plan of the traced model.
+
+    ===========
+    **Example**
+    ===========
+
+        .. code-block:: python
+
+            model = Sequential(Linear(2,3), ReLU(), Linear(3,1), Sigmoid())
+            traced = minitorch.jit.trace(model, Tensor([[0,0], [0,1], [1,0], [1,1]]))
+
+            optim_sgd = SGD(traced.parameters())
+            output = traced(data)
+
+    """
+
+    def __init__(self, plan : ExecutionPlan):
+        self.__plan : ExecutionPlan = plan
+
+    def __call__(self, input_tensor : Tensor) -> Tensor:
+
+        if input_tensor.shape() != self.__plan.slots[0].shape:
+            raise Exception(f"Error! This model was traced for inputs of shape {self.__plan.slots[0].shape}, so it can not be called with an input of shape {input_tensor.shape()}. Please trace it again")
+
+        # The plan only computes the gradients (and allocates the buffers) that were required while tracing, for the types seen while tracing
+        slots = self.__plan.slots
+        if input_tensor.dtype() != slots[0].dtype or input_tensor.requires_grad != slots[0].requires_grad:
+            raise Exception(f"Error! This model was traced for {slots[0].dtype} inputs with requires_grad = {slots[0].requires_grad}, so it can not be called with a {input_tensor.dtype()} input with requires_grad = {input_tensor.requires_grad}. Please trace it again")
+
+        for t, slot in zip(self.__plan.leaves, self.__plan.input_slots[1:]):
+            if t.dtype() != slots[slot].dtype or t.requires_grad != slots[slot].requires_grad:
+                raise Exception("Error! A parameter of this model was converted, frozen or unfrozen after it was traced. Please trace it again")
+
+        return Replay.apply(input_tensor, *self.__plan.leaves, plan=self.__plan)
+
+    def forward(self, input_tensor : Tensor) -> Tensor:
+        return self(input_tensor)
+
+    def discover_parameters(self) -> List[Tuple[str, Tensor]]:
+        """
+            Returns the parameters used by the traced model (the leaves of its graph that require gradient), named after their position (the names of the original model are not known to the plan).
+        """
+        return [(str(i), param) for i, param in enumerate(t for t in self.__plan.leaves if t.requires_grad)]
+
+
+def trace(model : callable, example_input : Tensor) -> TracedModule:
+
+    """
+        Runs the model once with the example input, records all of its operations and compiles them into a :class:`TracedModule`.
+        The model can be any callable that takes a tensor (or an object with a ``forward`` method, such as a custom :class:`minitorch.nn.Module`).
+        It raises an exception if the output does not depend on the input through the recorded operations, or if the model creates tensors
+        out of the raw data (e.g: layers that compute with NumPy, such as :class:`minitorch.nn.QuantizedLinear`), since the plan would replay them as constants.
+    """
+
+    forward = model if callable(model) else model.forward
+
+    start_serial = next_serial()
+    with recording() as tape:
+        output = forward(example_input)
+
+    return TracedModule(ExecutionPlan(tape, example_input, output, start_serial))
@@ -0,0 +1,5 @@
+"""
+    Compilation of models into static graphs that are replayed without rebuilding the computation graph on every call.
+"""
+
+from .TracedModule import TracedModule, ExecutionPlan, trace
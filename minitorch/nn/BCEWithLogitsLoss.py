@@ -0,0 +1,65 @@
+from minitorch import *
+from minitorch.Function import BinaryCrossEntropyWithLogits
+
+class BCEWithLogitsLoss:
+    """
+    ===========
+    **Summary**
+    ===========
+
+        Creates a criterion that combines a Sigmoid layer and the Binary Cross Entropy between the target and the sigmoid of the input logits, in a single operation.
+
+        It is computed as:
+
+        .. math::
+            BCE(y, x) = -[y \\cdot log(\\sigma(x)) + (1-y) \\cdot log(1-\\sigma(x))] = max(x, 0) - x \\cdot y + log(1 + e^{-|x|})
+
+        Where :math:`y` is the true label and :math:`x` is the raw output (logit) of the model, **before** the sigmoid function.
+
+        The right side of the equation (the log-sum-exp trick) is numerically stable: unlike :class:`minitorch.nn.BinaryCrossEntropyLoss`, it does not fail when the sigmoid saturates.
+        Its gradient with respect to the logits is simply :math:`\\sigma(x) - y`.
+
+        Logits and labels can be whole batches (tensors of the same shape). In that case, the loss is the **mean** of the loss of every element.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **__out:** (:class:`Tensor.Tensor`) Output of the loss function. It's only kept until :meth:`backward` is called.
+
+    ===========
+    **Example**
+    ===========
+
+        >>> loss = BCEWithLogitsLoss()
+        >>> logits = Tensor([[-2.5], [40.0]])
+        >>> label = Tensor([[0], [1]])
+        >>> loss(logits, label) # Mean over the batch
+
+    """
+    def __init__(self):
+        self.__out : Tensor = None
+
+    def __call__(self, logits : Tensor, label : Tensor) -> Tensor:
+        # Dimensionality check
+        if logits.shape() != label.shape():
+            raise Exception("Error! Binary Cross Entropy Loss can only be calculated between logits and a label of the same shape")
+
+        # The loss of the whole batch is calculated in a single operation
+        self.__out = BinaryCrossEntropyWithLogits.apply(logits, label)
+
+        return self.__out
+
+    def backward(self) -> None:
+        """
+            Computes the gradient of the Binary Cross Entropy With Logits Loss function.
+        """
+
+        # Error handling
+        if self.__out == None:
+            raise Exception("Error! Please compute the function first")
+
+        self.__out.backward()
+
+        # The graph was freed by the backward pass, so the output is not kept alive either
+        self.__out = None
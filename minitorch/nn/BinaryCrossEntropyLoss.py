@@ -1,4 +1,5 @@
 from minitorch import *
+from minitorch.Function import BinaryCrossEntropy
 
 class BinaryCrossEntropyLoss:
     """
@@ -15,11 +16,13 @@ class BinaryCrossEntropyLoss:
         
         Where :math:`y` is the true label and :math:`\\hat{y}` is the prediction of the model.
 
+        Predictions and labels can be whole batches (tensors of the same shape). In that case, the loss is the **mean** of the loss of every element.
+
     ==============
     **Parameters**
     ==============
 
-        * **__out:** (:class:`Autograd`) Output of the loss function.
+        * **__out:** (:class:`Tensor.Tensor`) Output of the loss function. It's only kept until :meth:`backward` is called.
 
     ======================
     **Instance Variables**
@@ -33,29 +36,21 @@ class BinaryCrossEntropyLoss:
         >>> pred = Tensor([0.5,])
         >>> label = Tensor([1,])
         >>> loss(pred, label)
+        >>> batch_pred = Tensor([[0.2], [0.9]])
+        >>> batch_label = Tensor([[0], [1]])
+        >>> loss(batch_pred, batch_label) # Mean over the batch
 
     """
     def __init__(self):
-        self.__out : Value = None
+        self.__out : Tensor = None
 
-    def __call__(self, pred : Tensor, label : Tensor) -> Value:
+    def __call__(self, pred : Tensor, label : Tensor) -> Tensor:
         # Dimensionality check
-        pred_dims = len(pred.shape())
-        label_dims = len(label.shape())
-
-        pred_list = pred.to_list()
-        label_list = label.to_list()
+        if pred.shape() != label.shape():
+            raise Exception("Error! Binary Cross Entropy Loss can only be calculated between a prediction and a label of the same shape")
 
-        # "...if the output and label tensor are not 1-dimensional OR they are not single value tensors..."
-        if (pred_dims != 1 or label_dims != 1) or (len(pred_list) != 1 or len(label_list) != 1):
-            raise Exception("Error! Binary Cross Entropy Loss can only be calculated (as for this Minitorch version) for one single predicted value and a single label")
-        
-        # Firstly, we extract the raw Value object
-        pred_val = pred.item()
-        label_val = label.item()
-
-        # Now, we calculate the BCE loss function
-        self.__out = -(label_val * pred_val.log() + (1 - label_val)*((1-pred_val).log()))
+        # The loss of the whole batch is calculated in a single operation
+        self.__out = BinaryCrossEntropy.apply(pred, label)
 
         return self.__out
 
@@ -68,4 +63,7 @@ class BinaryCrossEntropyLoss:
         if self.__out == None:
             raise Exception("Error! Please compute the function first")
     
-        self.__out.backward()
\ No newline at end of file
+        self.__out.backward()
+
+        # The graph was freed by the backward pass, so the output is not kept alive either
+        self.__out = None
\ No newline at end of file
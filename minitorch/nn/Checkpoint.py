@@ -0,0 +1,58 @@
+from minitorch.Tensor import Tensor
+from minitorch.Function import Recompute
+from minitorch.nn.Module import Module
+from typing import List, Tuple
+
+
+class Checkpoint(Module):
+
+    """
+    ===========
+    **Summary**
+    ===========
+
+        Wraps a segment of a model (a layer, a :class:`minitorch.nn.Sequential` or any callable that takes a tensor) so that its intermediate
+        activations are **not kept** during the forward pass. Only the input of the segment is saved, and the segment is run again when the
+        backward pass reaches it, in order to compute its gradients.
+
+        This trades some extra computation (one more forward pass of the segment) for memory: the activations of only one segment are alive at a time during the backward pass.
+
+        .. note::
+            The segment must compute the same result when it is run again (it must not depend on randomness or on a state that changes between calls).
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **__segment:** (*callable*) Segment of the model that is checkpointed.
+
+    ===========
+    **Example**
+    ===========
+
+        >>> block = checkpoint(Sequential(Linear(64,64), ReLU(), Linear(64,64), ReLU()))
+        >>> output = block(batch) # The activations inside the block are recomputed during the backward pass
+
+    """
+
+    def __init__(self, segment : callable):
+        self.__segment : callable = segment
+
+    def __call__(self, input_tensor : Tensor) -> Tensor:
+        return Recompute.apply(input_tensor, *self.parameters(), segment=self.__segment)
+
+    def forward(self, input_tensor : Tensor) -> Tensor:
+        return self(input_tensor)
+
+    def discover_parameters(self) -> List[Tuple[str, Tensor]]:
+        # The wrapper is transparent: parameters keep the names they have in the segment
+        return self.__segment.named_parameters() if isinstance(self.__segment, Module) else []
+
+
+def checkpoint(segment : callable) -> Checkpoint:
+
+    """
+        Wraps a segment of a model so that its activations are recomputed during the backward pass instead of being kept (see :class:`Checkpoint`).
+    """
+
+    return Checkpoint(segment)
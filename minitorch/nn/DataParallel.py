@@ -0,0 +1,278 @@
+from minitorch.Tensor import Tensor
+from minitorch.SparseGrad import SparseGrad
+from minitorch.nn.Module import Module
+from multiprocessing import shared_memory
+from typing import List, Tuple
+import multiprocessing
+import traceback
+
+import numpy as np
+
+
+def _bind_buffers(params : List[Tensor], flat_data : np.ndarray, flat_grad : np.ndarray) -> List[np.ndarray]:
+    """
+        Moves the data of the parameters into slices of a flat buffer and returns the slices of the flat gradient buffer that match each parameter.
+    """
+    grad_views : List[np.ndarray] = []
+
+    offset = 0
+    for param in params:
+        n = param.data.size
+        param.set_storage(flat_data[offset:offset+n])
+        grad_views.append(flat_grad[offset:offset+n].reshape(param.shape()))
+        offset += n
+
+    return grad_views
+
+
+def _worker(conn, model : callable, loss_fn : callable, params_name : str, grads_name : str, rank : int, size : int, dtype : np.dtype) -> None:
+    """
+        Main loop of a worker process. It holds a replica of the model whose parameters are stored in the shared parameter buffer,
+        and writes the gradients of every shard it receives into its own row of the shared gradient buffer.
+    """
+    params_shm = shared_memory.SharedMemory(name=params_name)
+    grads_shm = shared_memory.SharedMemory(name=grads_name)
+
+    try:
+        flat_data = np.ndarray((size,), dtype=dtype, buffer=params_shm.buf)
+        flat_grad = np.ndarray((size,), dtype=dtype, buffer=grads_shm.buf, offset=rank*size*dtype.itemsize)
+
+        params : List[Tensor] = list({id(param): param for param in model.parameters()}.values())
+        grad_views = _bind_buffers(params, flat_data, flat_grad)
+
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+
+            inputs, labels, weight = message
+            try:
+                flat_grad.fill(0)
+                for param, grad_view in zip(params, grad_views):
+                    param.grad = grad_view
+
+                # Inputs keep their type, since layers convert them when needed and some must not be rounded (e.g: the indices of an Embedding layer)
+                # Every shard is weighted by its share of the batch, so that the sum of the gradients of all the shards is the gradient of the whole batch
+                loss = loss_fn(model(Tensor(inputs)), Tensor(labels, dtype=dtype)) * weight
+                loss.backward()
+
+                # Gradients are accumulated in place, unless something replaced them
+                for param, grad_view in zip(params, grad_views):
+                    if isinstance(param.grad, SparseGrad):
+                        param.grad.to_dense(out=grad_view)
+                    elif param.grad is not grad_view and param.grad is not None:
+                        grad_view[...] = param.grad
+
+                conn.send(("ok", loss.item()))
+            except Exception:
+                conn.send(("error", traceback.format_exc()))
+    finally:
+        params_shm.close()
+        grads_shm.close()
+        conn.close()
+
+
+class DataParallel(Module):
+
+    """
+    ===========
+    **Summary**
+    ===========
+
+        Trains a model on several CPU cores at once, with one **worker process** per core holding a replica of the model.
+
+        On every call to :meth:`forward_backward`, the mini-batch is split into one shard per worker (along its first dimension) and every worker
+        runs the forward and backward passes of its shard in parallel. The gradients are then **all-reduced through shared memory**: every worker writes
+        them into its own row of a shared buffer, and the rows are added up into the gradients of the parameters of the wrapped model,
+        so that the optimizer can update them as usual. The shared buffers (and the labels of the shards) are stored as the type of the parameters, which must be the same for all of them.
+
+        The parameters of the replicas are stored in a shared buffer too. The wrapped model is the one that is optimized: its parameters are copied into
+        the shared buffer before every step, so the replicas always see the latest parameters.
+
+        .. warning::
+            Processes must be stopped with :meth:`close` (or by using the object as a context manager). When the ``spawn`` start method is used,
+            the training script must be guarded by ``if __name__ == "__main__":``, and the model and the loss function must be picklable.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **module:** (:class:`Module`) Model to be trained.
+        * **loss_fn:** (*callable*) Loss function that receives the output of the model and the labels, and returns a one (1) element tensor.
+          It must be a mean over the samples (as :class:`minitorch.nn.BinaryCrossEntropyLoss`).
+        * **num_workers:** (*int*) Number of worker processes. Default is the number of CPU cores.
+        * **start_method:** (*str*) How the worker processes are started: ``fork``, ``spawn`` or ``forkserver`` (see :mod:`multiprocessing`). Default is the default method of the platform.
+        * **__params:** (*List[Tensor]*) Parameters of the wrapped model.
+        * **__dtype:** (*np.dtype*) Type the parameters are stored as.
+        * **__params_shm:** (*SharedMemory*) Shared buffer with the parameters of the replicas.
+        * **__grads_shm:** (*SharedMemory*) Shared buffer with one row of gradients per worker.
+        * **__workers:** (*List[Tuple]*) Process and connection of every worker.
+
+    ======================
+    **Instance Variables**
+    ======================
+
+        * **module:** (:class:`Module`) Model to be trained.
+        * **num_workers:** (*int*) Number of worker processes.
+        * **start_method:** (*str*) How the worker processes are started.
+
+    ===========
+    **Example**
+    ===========
+
+        .. code-block:: python
+
+            if __name__ == "__main__":
+                model = Sequential(Linear(2,3), ReLU(), Linear(3,1), Sigmoid())
+                optim_sgd = SGD(model.parameters(), lr=0.1)
+
+                with DataParallel(model, BinaryCrossEntropyLoss(), num_workers=4) as parallel_model:
+                    for i in range(epochs):
+                        optim_sgd.zero_grad()
+                        loss = parallel_model.forward_backward(data, labels)
+                        optim_sgd.step()
+
+    """
+
+    def __init__(self, module : Module, loss_fn : callable, num_workers : int = None, start_method : str = None):
+
+        self.module : Module = module
+        self.num_workers : int = num_workers if num_workers is not None else multiprocessing.cpu_count()
+        self.start_method : str = start_method
+
+        if self.num_workers < 1:
+            raise Exception("Error! At least one (1) worker is needed")
+
+        self.__params : List[Tensor] = list({id(param): param for param in module.parameters()}.values())
+        self.__size : int = sum(param.data.size for param in self.__params)
+
+        dtypes = {param.dtype() for param in self.__params}
+        if len(dtypes) > 1:
+            raise Exception(f"Error! All the parameters of the model must be stored as the same type, but they are stored as {sorted(str(d) for d in dtypes)}")
+        self.__dtype : np.dtype = dtypes.pop() if dtypes else np.dtype(np.float64)
+
+        # Shared memory blocks can not be empty
+        nbytes = max(self.__size, 1) * self.__dtype.itemsize
+        self.__params_shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self.__grads_shm = shared_memory.SharedMemory(create=True, size=nbytes*self.num_workers)
+
+        self.__flat_data : np.ndarray = np.ndarray((self.__size,), dtype=self.__dtype, buffer=self.__params_shm.buf)
+        self.__flat_grads : np.ndarray = np.ndarray((self.num_workers, self.__size), dtype=self.__dtype, buffer=self.__grads_shm.buf)
+        self.__copy_params()
+
+        context = multiprocessing.get_context(start_method)
+
+        self.__workers : List[Tuple] = []
+        for rank in range(self.num_workers):
+            conn, child_conn = context.Pipe()
+            process = context.Process(target=_worker, args=(child_conn, module, loss_fn, self.__params_shm.name, self.__grads_shm.name, rank, self.__size, self.__dtype), daemon=True)
+            process.start()
+            child_conn.close()
+            self.__workers.append((process, conn))
+
+    def __copy_params(self) -> None:
+        """
+            Copies the current parameters of the wrapped model into the shared buffer read by the replicas.
+        """
+        offset = 0
+        for param in self.__params:
+            n = param.data.size
+            self.__flat_data[offset:offset+n] = param.data.ravel()
+            offset += n
+
+    def forward_backward(self, inputs : Tensor, labels : Tensor) -> float:
+
+        """
+            Computes the loss of the mini-batch and its gradient with respect to the parameters of the wrapped model, splitting the work between the workers.
+            The gradients are **accumulated** (added) into the gradients of the parameters, as a backward pass would do. Returns the loss of the whole mini-batch.
+        """
+
+        if self.__workers is None:
+            raise Exception("Error! The workers of this object were already closed")
+
+        if inputs.shape()[0] != labels.shape()[0]:
+            raise Exception("Error! Inputs and labels must have the same number of samples")
+
+        self.__copy_params()
+
+        batch_size = inputs.shape()[0]
+        shards = np.array_split(np.arange(batch_size), min(self.num_workers, batch_size))
+
+        for (_, conn), shard in zip(self.__workers, shards):
+            conn.send((inputs.data[shard], labels.data[shard], len(shard) / batch_size))
+
+        loss = 0.0
+        errors : List[str] = []
+        for (_, conn), _ in zip(self.__workers, shards):
+            status, result = conn.recv()
+            if status == "ok":
+                loss += result
+            else:
+                errors.append(result)
+
+        if errors:
+            raise Exception("Error! A worker failed while computing its shard:\n" + errors[0])
+
+        # All-reduce: the gradients of the shards are added up in a single vectorized operation
+        reduced = self.__flat_grads[:len(shards)].sum(axis=0)
+
+        offset = 0
+        for param in self.__params:
+            n = param.data.size
+            if param.requires_grad:
+                grad = reduced[offset:offset+n].reshape(param.shape())
+                if param.grad is None:
+                    param.grad = grad.copy()
+                else:
+                    param.grad += grad
+            offset += n
+
+        return loss
+
+    def __call__(self, input_tensor : Tensor) -> Tensor:
+        return self.module(input_tensor)
+
+    def forward(self, input_tensor : Tensor) -> Tensor:
+        return self(input_tensor)
+
+    def discover_parameters(self) -> List[Tuple[str, Tensor]]:
+        return self.module.named_parameters()
+
+    def close(self) -> None:
+
+        """
+            Stops the worker processes and frees the shared memory.
+        """
+
+        if self.__workers is None:
+            return
+
+        for process, conn in self.__workers:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process, conn in self.__workers:
+            process.join()
+            conn.close()
+        self.__workers = None
+
+        # Views of the shared memory must be dropped before it is closed
+        self.__flat_data = None
+        self.__flat_grads = None
+        self.__params_shm.close()
+        self.__params_shm.unlink()
+        self.__grads_shm.close()
+        self.__grads_shm.unlink()
+
+    def __enter__(self) -> 'DataParallel':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -0,0 +1,91 @@
+from minitorch.Tensor import Tensor
+from minitorch.Function import Gather
+from minitorch.nn.Module import Module
+from typing import List, Tuple
+
+import numpy as np
+
+
+class Embedding(Module):
+
+    """
+    ===========
+    **Summary**
+    ===========
+
+        A lookup table that stores one learnable vector (an **embedding**) per category of a categorical feature (e.g: one per word of a vocabulary).
+
+        The input is a tensor (or a list, or a NumPy array) of integer indices, and the output has the embedding of every index, so its shape is the shape
+        of the input plus :math:`(embedding_dim,)`. Looking up a category costs as much as copying its row, instead of a matrix multiplication with
+        a one-hot vector as long as the vocabulary.
+
+        Only the rows that were looked up get a gradient, which is kept as a row-sparse gradient (see :class:`minitorch.SparseGrad.SparseGrad`),
+        and the optimizers only update those rows (see :attr:`minitorch.Tensor.Tensor.sparse_grad`). This way, neither the backward pass nor
+        the optimization step depend on the number of categories.
+
+        The indices are an input of the lookup (as a tensor of whole numbers), so a traced model (see :func:`minitorch.jit.trace`) looks up the indices it's called with.
+        Tensors of indices must be stored as a type that represents ``num_embeddings - 1`` exactly: ``float16`` holds every index up to 2048, ``float32`` up to :math:`2^{24}`,
+        and ``float64`` (the type of lists and NumPy arrays of integers) up to :math:`2^{53}`. Other tensors are rejected, since their indices may have been rounded.
+
+        Elements of the embeddings are sampled initially from :math:`\\mathcal{N}(0, 1)`
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **__weights:** (:class:`Tensor.Tensor`) Learnable embeddings. Matrix of shape :math:`(num_embeddings, embedding_dim)`.
+
+    ======================
+    **Instance Variables**
+    ======================
+
+        * **num_embeddings:** (*int*) Number of categories (rows of the table).
+        * **embedding_dim:** (*int*) Length of every embedding.
+        * **seed:** (*int*) Seed of the random number generator
+
+    ===========
+    **Example**
+    ===========
+
+        >>> e = Embedding(50000, 16)
+        >>> e(Tensor([3, 17, 3])) # This returns a tensor of shape [3,16]!
+        >>> e([[3, 17], [42, 0]]) # This returns a tensor of shape [2,2,16]!
+
+    """
+
+    def __init__(self, num_embeddings : int, embedding_dim : int, seed : int = 4):
+
+        self.num_embeddings : int = num_embeddings
+        self.embedding_dim : int = embedding_dim
+        self.seed : int = seed
+
+        rng = np.random.default_rng(seed)
+
+        self.__weights : Tensor = Tensor(rng.standard_normal((num_embeddings, embedding_dim)), requires_grad=True)
+        self.__weights.sparse_grad = True
+
+    def __call__(self, indices : Tensor | np.ndarray | List) -> Tensor:
+
+        """
+            Returns the embeddings of the given indices.
+        """
+
+        if np.ndim(indices.data if isinstance(indices, Tensor) else indices) > 3:
+            raise Exception("Error! Embedding layer expects one (1) to three (3) dimensions of indices, since tensors with more than four (4) dimensions are not supported")
+
+        # Indices are given to the lookup as a tensor, so that a traced model reads them on every call. They are checked by the lookup itself
+        if not isinstance(indices, Tensor):
+            indices = Tensor(np.asarray(indices))
+
+        return Gather.apply(self.__weights, indices)
+
+    def forward(self, indices : Tensor | np.ndarray | List) -> Tensor:
+        return self(indices)
+
+    def discover_parameters(self) -> List[Tuple[str, Tensor]]:
+
+        """
+            Returns parameters of the model with their names (``weight``).
+        """
+
+        return [("weight", self.__weights)]
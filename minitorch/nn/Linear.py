@@ -1,7 +1,9 @@
-from minitorch.Autograd import Value
 from minitorch.Tensor import Tensor
+from minitorch.Function import Affine, AffineReLU, AffineSigmoid
 from minitorch.nn.Module import Module
-from typing import List
+from minitorch.nn.ReLU import ReLU
+from minitorch.nn.Sigmoid import Sigmoid
+from typing import List, Tuple
 import random
 import math
 
@@ -24,6 +26,9 @@ class Linear(Module):
         Where the data :math:`\\bar{x}` is a **row** vector. This meaning that its shape is :math:`(1,in_features)`,
         :math:`W` is a weight matrix of shape :math:`(out_features, in_features)` and :math:`\\bar{b}` is the bias vector of shape :math:`(1, out_features)`.
 
+        The data can also be a **batch** of row vectors, this is, a matrix of shape :math:`(batch, in_features)`. The whole batch is transformed with a single matrix multiplication,
+        and the result is a matrix of shape :math:`(batch, out_features)`.
+
         Both :math:`W` and :math:`\\bar{b}` are **learnable parameters**. The bias :math:`\\bar{b}` is **optional** (if ``bias = False``, then it is initialized as a zero vector).
 
         Elements of the weight matrix :math:`W` are sampled initially from :math:`\\mathcal{U}(-\\sqrt{\\frac{1}{in_features}}, \\sqrt{\\frac{1}{in_features}})` 
@@ -50,41 +55,68 @@ class Linear(Module):
         >>> l = Linear(2,3)
         >>> x = Tensor([5, 6])
         >>> l(x) # This returns a tensor of shape [1,3]!
+        >>> batch = Tensor([[5, 6], [7, 8], [9, 10]])
+        >>> l(batch) # This returns a tensor of shape [3,3]!
 
     """
 
     def __init__(self, in_features : int, out_features : int, bias : bool = True, seed : int = 4):
-        
+
+        self.in_features : int = in_features
+        self.out_features : int = out_features
+        self.seed : int = seed
+
         # Firstly, we set up the seed of the random number generator
         random.seed(seed)
 
         # Then generate the initial weights and biases (if bias = True)
         k : float = 1/in_features
-        self.__weights : Tensor = Tensor([[random.uniform(-math.sqrt(k), math.sqrt(k)) for _ in range(in_features)] for _ in range(out_features)])
+        self.__weights : Tensor = Tensor([[random.uniform(-math.sqrt(k), math.sqrt(k)) for _ in range(in_features)] for _ in range(out_features)], requires_grad=True)
 
         self.__bias : Tensor
         if bias:
-            self.__bias = Tensor([random.uniform(-math.sqrt(k), math.sqrt(k)) for _ in range(out_features)])
+            self.__bias = Tensor([random.uniform(-math.sqrt(k), math.sqrt(k)) for _ in range(out_features)], requires_grad=True)
         else:
             self.__bias = Tensor([0 for _ in range(out_features)])
 
-    def __call__(self, activation : Tensor):
-        
-        # TODO: PONER COMPROBACIONES DE TAMANO AQUI!!!
+    # Operations that compute the linear transformation and an activation function in a single fused pass
+    __FUSED = {ReLU: AffineReLU, Sigmoid: AffineSigmoid}
+
+    def __call__(self, activation : Tensor, fuse_with : ReLU | Sigmoid = None) -> Tensor:
+
+        """
+            Applies the linear transformation to the activation. If ``fuse_with`` is a :class:`ReLU` or a :class:`Sigmoid` layer,
+            that activation function is applied too, in the same operation (this is done automatically by :class:`minitorch.nn.Sequential`).
+        """
+
+        # Size check: a row vector or a batch of row vectors, with in_features elements each
+        shape = activation.shape()
+        if len(shape) > 2 or shape[-1] != self.in_features:
+            raise Exception(f"Error! Linear layer expects a vector of {self.in_features} elements or a batch (matrix) of shape (batch, {self.in_features})")
+
+        # The input is converted to the type of the weights (e.g: a float64 batch fed to a float32 model), so that the output does not promote the next layers
+        activation = activation.to(self.__weights.dtype())
 
-        return (activation * self.__weights.transpose()) + self.__bias
+        function = Affine if fuse_with is None else self.__FUSED[type(fuse_with)]
+
+        return function.apply(activation, self.__weights, self.__bias)
     
-    def parameters(self) -> List[Value]:
+    def parameters(self) -> List[Tensor]:
+
+        """
+            Returns parameters of the model (weights and bias) as a list of Tensors!
+        """
+
+        # The bias is not a parameter if it is fixed to a zero vector
+        if self.__bias.requires_grad:
+            return [self.__weights, self.__bias]
+        else:
+            return [self.__weights]
+
+    def discover_parameters(self) -> List[Tuple[str, Tensor]]:
 
         """
-            Returns parameters of the model (weights and bias) as a list of Values!
+            Returns parameters of the model with their names (``weight`` and ``bias``).
         """
-        
-        # TODO: PONER UN METODO FLATTEN EN LA CLASE TENSOR
-        params_weights : List[Value] = []
-        for row in self.__weights:
-            for w in row:
-                params_weights.append(w)
-
-        param_bias : List[Value] = [b for b in self.__bias]
-        return params_weights + param_bias
\ No newline at end of file
+
+        return list(zip(("weight", "bias"), self.parameters()))
\ No newline at end of file
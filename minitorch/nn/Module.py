@@ -1,5 +1,8 @@
-from typing import List
-from minitorch.Autograd import Value
+from typing import Any, Dict, Iterator, List, Tuple
+from minitorch.Tensor import Tensor, check_dtype
+import weakref
+
+import numpy as np
 
 class Module:
 
@@ -9,13 +12,113 @@ class Module:
     ===========
 
         Base class for all neural network modules.
-        
+
         Your models should also subclass this class.
 
         Allows basic functionalities, like resetting the gradient ("zeroing out") of the parameters of each layer and getting said parameters.
         This last functionality is intended for custom models classes. Classes relative to the package overwrite this method.
+
+        Parameters are **discovered** by walking the attributes of the model: submodules (also inside lists, tuples and dictionaries) and tensors that require gradient.
+        Every parameter gets a **name**, the path of attribute names (or positions and keys) that leads to it, separated by dots (e.g: ``layers.0.weight``).
+
+        The discovered parameters are kept in a **cached registry**, so that :meth:`parameters` and :meth:`named_parameters` do not walk the model on every call.
+        The registry is only invalidated when a submodule (or a tensor, list, tuple or dictionary) is assigned to, or deleted from, an attribute of the module
+        or of one of its submodules: every module remembers the modules that hold it, and drops their registries together with its own.
+
+        .. warning::
+            Lists and dictionaries of submodules modified in place (e.g: ``self.layers.append(layer)``) are not noticed. Assign them again after modifying them.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **__registry:** (*List[Tuple[str, Tensor]]*) Named parameters discovered so far. It's dropped when the parameters may have changed.
+
+        * **__parents:** (*weakref.WeakSet*) Modules that hold this one in an attribute, whose registries must be dropped too when this one is dropped.
+
+    ===========
+    **Example**
+    ===========
+
+        .. code-block:: python
+
+            class MLP(Module):
+                def __init__(self):
+                    self.layers = Sequential(Linear(2,3), ReLU(), Linear(3,1), Sigmoid())
+                    self.heads = [Linear(1,1), Linear(1,1)]
+
+            MLP().state_dict().keys() # layers.0.weight, layers.0.bias, layers.2.weight, layers.2.bias, heads.0.weight, ...
+
     """
 
+    # Attribute values that may hold parameters
+    __CONTAINERS = (Tensor, list, tuple, dict)
+
+    # Attributes that are kept by this class, and not by the model
+    __INTERNAL = ("_Module__registry", "_Module__parents")
+
+    def __setattr__(self, name : str, value : Any) -> None:
+        if isinstance(value, (Module,) + Module.__CONTAINERS) or isinstance(self.__dict__.get(name), (Module,) + Module.__CONTAINERS):
+            self.__adopt(value)
+            self.__invalidate()
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name : str) -> None:
+        self.__invalidate()
+        object.__delattr__(self, name)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The registry and the holders are only valid in the process (and for the object) that built them
+        state = dict(self.__dict__)
+        for name in Module.__INTERNAL:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state : Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        for value in state.values():
+            self.__adopt(value)
+
+    def __adopt(self, value : Any) -> None:
+        """
+            Remembers that this module holds the submodules found in an attribute value, so that changes inside them drop its registry.
+        """
+        for module in Module.__submodules(value):
+            parents = module.__dict__.get("_Module__parents")
+            if parents is None:
+                parents = weakref.WeakSet()
+                object.__setattr__(module, "_Module__parents", parents)
+            parents.add(self)
+
+    def __invalidate(self) -> None:
+        """
+            Drops the registry of this module and of every module that holds it, directly or through other modules.
+        """
+        pending : List[Module] = [self]
+        seen = set()
+        while pending:
+            module = pending.pop()
+            if id(module) in seen:
+                continue
+            seen.add(id(module))
+
+            module.__dict__.pop("_Module__registry", None)
+            pending.extend(module.__dict__.get("_Module__parents", ()))
+
+    @staticmethod
+    def __submodules(value : Any) -> Iterator['Module']:
+        """
+            Yields the modules held by an attribute value (also inside lists, tuples and dictionaries), without going into them.
+        """
+        if isinstance(value, Module):
+            yield value
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                yield from Module.__submodules(item)
+        elif isinstance(value, dict):
+            for item in value.values():
+                yield from Module.__submodules(item)
+
     def zero_grad(self) -> None:
 
         """
@@ -24,26 +127,152 @@ class Module:
         """
 
         for p in self.parameters():
-            p.grad = 0
+            p.grad = None
 
-    def parameters(self) -> List[Value]:
+    def parameters(self) -> List[Tensor]:
 
         """
-            Returns the parameters of the model as a list of Value objects.
-            
+            Returns the parameters of the model as a list of Tensor objects.
+
             .. warning::
                 This method should **NOT** be overwriten by custom model classes.
         """
 
-        # List of parameters (Value objects) to be returned
-        params : List[Value] = []
-        
-        # Iterate through all the attributes of the object,
-        # if the attribute is a Module subclass, the call the
-        # parameters() method and concatenate it to the result list
-        for attr in self.__dict__.values():
-            if isinstance(attr, Module):
-                params += attr.parameters()
+        return [param for _, param in self.named_parameters()]
+
+    def named_parameters(self) -> List[Tuple[str, Tensor]]:
+
+        """
+            Returns the parameters of the model as a list of (name, Tensor) pairs. They are only discovered again (see :meth:`discover_parameters`) if a submodule changed.
+        """
+
+        registry = self.__dict__.get("_Module__registry")
+
+        if registry is None:
+            registry = self.discover_parameters()
+            object.__setattr__(self, "_Module__registry", registry)
+
+        return list(registry)
+
+    def discover_parameters(self) -> List[Tuple[str, Tensor]]:
+
+        """
+            Walks the attributes of the model and returns its named parameters. Modules that keep their parameters in a special way override this method.
+        """
+
+        named : List[Tuple[str, Tensor]] = []
+
+        for attr_name, attr in self.__dict__.items():
+            if attr_name in Module.__INTERNAL:
+                continue
+
+            # Private attributes are named without the prefix added by name mangling (e.g: _MLP__layers is named layers)
+            if attr_name.startswith("_") and "__" in attr_name[1:]:
+                attr_name = attr_name[1:].split("__", 1)[1]
+
+            named += Module.__collect(attr_name, attr)
+
+        return named
+
+    @staticmethod
+    def __collect(name : str, value : Any) -> List[Tuple[str, Tensor]]:
+
+        """
+            Returns the named parameters held by an attribute value.
+        """
+
+        if isinstance(value, Module):
+            return [(f"{name}.{param_name}", param) for param_name, param in value.named_parameters()]
+
+        if isinstance(value, Tensor):
+            return [(name, value)] if value.requires_grad else []
+
+        named : List[Tuple[str, Tensor]] = []
+        if isinstance(value, (list, tuple)):
+            for i, item in enumerate(value):
+                named += Module.__collect(f"{name}.{i}", item)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                named += Module.__collect(f"{name}.{key}", item)
+
+        return named
+
+    def to(self, dtype : np.dtype | str) -> 'Module':
+
+        """
+            Converts every parameter of the model, in place, to the given floating point type (``float64``, ``float32`` or ``float16``) and returns the model.
+            Tensors held by the attributes of the model that are not parameters (e.g: a fixed zero bias) are converted too, so that they do not promote the outputs.
+            Gradients are reset, since they are stored as the type of their parameter. It must be called before creating the optimizer,
+            which packs the parameters in buffers of their type.
+
+            >>> model = Sequential(Linear(2,3), ReLU(), Linear(3,1), Sigmoid()).to("float32")
+        """
+
+        dtype = check_dtype(dtype)
+
+        tensors : Dict[int, Tensor] = {id(param): param for param in self.parameters()}
+        Module.__find_tensors(self, tensors, set())
+
+        # Storages are replaced in place, so no attribute is assigned and the registries stay valid
+        for tensor in tensors.values():
+            if tensor.dtype() != dtype:
+                tensor.set_storage(tensor.data.astype(dtype), copy=False)
+                tensor.grad = None
+
+        return self
+
+    @staticmethod
+    def __find_tensors(value : Any, found : Dict[int, Tensor], seen : set) -> None:
+
+        """
+            Adds every tensor held by an attribute value (also inside submodules, lists, tuples and dictionaries) to ``found``, by id.
+        """
+
+        if isinstance(value, Tensor):
+            found[id(value)] = value
+        elif isinstance(value, Module):
+            if id(value) in seen:
+                return
+            seen.add(id(value))
+            for name, attr in value.__dict__.items():
+                if name not in Module.__INTERNAL:
+                    Module.__find_tensors(attr, found, seen)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                Module.__find_tensors(item, found, seen)
+        elif isinstance(value, dict):
+            for item in value.values():
+                Module.__find_tensors(item, found, seen)
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+
+        """
+            Returns the raw data of every parameter of the model, by name. The arrays share their memory with the parameters, so they must be copied to keep a snapshot.
+        """
+
+        return {name: param.data for name, param in self.named_parameters()}
+
+    def load_state_dict(self, state_dict : Dict[str, np.ndarray | Tensor], strict : bool = True) -> None:
+
+        """
+            Copies the values of a state dictionary (see :meth:`state_dict`) into the parameters of the model, in place.
+            If ``strict = True``, the names of the dictionary must match the names of the parameters exactly. Otherwise, only the matching names are loaded.
+        """
+
+        params : Dict[str, Tensor] = dict(self.named_parameters())
+
+        if strict:
+            missing = params.keys() - state_dict.keys()
+            unexpected = state_dict.keys() - params.keys()
+            if missing or unexpected:
+                raise Exception(f"Error! The state dictionary does not match the parameters of the model. Missing: {sorted(missing)}. Unexpected: {sorted(unexpected)}")
+
+        for name, value in state_dict.items():
+            if name not in params:
+                continue
+
+            array = value.data if isinstance(value, Tensor) else np.asarray(value)
+            if array.shape != params[name].shape():
+                raise Exception(f"Error! Parameter {name} has shape {array.shape} in the state dictionary, but {params[name].shape()} in the model")
 
-        return params
-                
+            params[name].data = array
@@ -0,0 +1,167 @@
+from minitorch.Tensor import Tensor, check_dtype
+from minitorch.nn.Module import Module
+from minitorch.nn.Linear import Linear
+from minitorch.nn.ReLU import ReLU
+from minitorch.nn.Sigmoid import Sigmoid
+from minitorch import Kernels
+from typing import List, Tuple
+import copy
+
+import numpy as np
+
+
+class QuantizedLinear(Module):
+
+    """
+    ===========
+    **Summary**
+    ===========
+
+        Inference-only version of a trained :class:`minitorch.nn.Linear` layer, whose weights are stored as **8-bit integers** (``int8``),
+        which takes eight (8) times less memory than ``float64`` weights (four (4) times less than ``float32`` ones).
+
+        Weights are quantized symmetrically **per output channel** (per row of the weight matrix): every row gets its own scale, the largest absolute
+        value of the row divided by 127, so that a row of small weights does not lose its precision because of another row of large weights.
+
+        .. math::
+            \\begin{align*}
+                W_{q} =& round(W / \\bar{s}) \\in [-127, 127] \\\\
+                l(\\bar{x}) =& (\\bar{x} \\cdot W_{q}^{T}) \\odot \\bar{s} + \\bar{b}
+            \\end{align*}
+
+        Since every output channel has a single scale, the scales are applied to the output of the matrix multiplication instead of to the weights.
+        The integer weights are converted to the compute type (``dtype``) on every call, so the layer runs on any CPU with the usual floating point kernels,
+        but only a **block** of output channels at a time (about :attr:`BLOCK_ELEMENTS` weights), so a full floating point copy of the weights never exists.
+
+        The layer has no learnable parameters: its output never requires gradient. Use :func:`quantize` to quantize every linear layer of a trained model.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **linear:** (:class:`minitorch.nn.Linear`) Trained layer to be quantized.
+        * **dtype:** (*np.dtype | str*) Type of the inputs, scales, bias and outputs of the layer. Default is the type of the weights of the linear layer.
+        * **__weights:** (*np.ndarray*) Quantized weights. Matrix of ``int8`` of shape :math:`(out_features, in_features)`.
+        * **__scales:** (*np.ndarray*) Scale of every output channel. Vector of shape :math:`(out_features,)`.
+        * **__bias:** (*np.ndarray*) Bias vector of shape :math:`(out_features,)`. It's not quantized.
+
+    ======================
+    **Instance Variables**
+    ======================
+
+        * **in_features:** (*int*) Number of input features.
+        * **out_features:** (*int*) Number of output features.
+        * **dtype:** (*np.dtype*) Type of the inputs, scales, bias and outputs of the layer.
+
+    ===========
+    **Example**
+    ===========
+
+        >>> l = QuantizedLinear(trained_linear, dtype="float32")
+        >>> l(batch) # This returns a float32 tensor of shape [batch, out_features]!
+
+    """
+
+    # Activation functions that can be applied in place over the output of the layer
+    __FUSED = {ReLU: Kernels.relu, Sigmoid: Kernels.sigmoid}
+
+    # Number of weights that are converted to the compute type at a time
+    BLOCK_ELEMENTS : int = 1 << 18
+
+    def __init__(self, linear : Linear, dtype : np.dtype | str = None):
+
+        params = dict(linear.named_parameters())
+        weights : np.ndarray = params["weight"].data
+
+        self.in_features : int = linear.in_features
+        self.out_features : int = linear.out_features
+        self.dtype : np.dtype = check_dtype(dtype if dtype is not None else weights.dtype)
+
+        # Rows of zeros get a scale of one (1), so that they are not divided by zero
+        max_abs = np.abs(weights).max(axis=1)
+        scales = np.where(max_abs > 0, max_abs / 127, 1.0)
+
+        self.__weights : np.ndarray = np.clip(np.rint(weights / scales[:, None]), -127, 127).astype(np.int8)
+        self.__scales : np.ndarray = scales.astype(self.dtype)
+        self.__bias : np.ndarray = params["bias"].data.astype(self.dtype) if "bias" in params else np.zeros(self.out_features, dtype=self.dtype)
+
+    def __call__(self, activation : Tensor, fuse_with : ReLU | Sigmoid = None) -> Tensor:
+
+        """
+            Applies the quantized linear transformation to the activation. If ``fuse_with`` is a :class:`ReLU` or a :class:`Sigmoid` layer,
+            that activation function is applied too, in place (this is done automatically by :class:`minitorch.nn.Sequential`).
+        """
+
+        shape = activation.shape()
+        if len(shape) > 2 or shape[-1] != self.in_features:
+            raise Exception(f"Error! Linear layer expects a vector of {self.in_features} elements or a batch (matrix) of shape (batch, {self.in_features})")
+
+        x = activation.data.reshape(-1, self.in_features).astype(self.dtype, copy=False)
+
+        # Weights are converted by blocks of output channels, each one written into its own columns of the result
+        block_rows = max(1, self.BLOCK_ELEMENTS // self.in_features)
+        res = np.empty((x.shape[0], self.out_features), dtype=self.dtype)
+        for start in range(0, self.out_features, block_rows):
+            end = min(start + block_rows, self.out_features)
+            res[:, start:end] = Kernels.matmul(x, self.__weights[start:end].T.astype(self.dtype))
+
+        res *= self.__scales
+        res += self.__bias
+
+        if fuse_with is not None:
+            Kernels.elementwise(self.__FUSED[type(fuse_with)], res, out=res)
+
+        return Tensor(res.reshape(shape[:-1] + (self.out_features,)))
+
+    def forward(self, activation : Tensor) -> Tensor:
+        return self(activation)
+
+    def dequantized_weights(self) -> np.ndarray:
+
+        """
+            Returns the weights the layer actually computes with (the quantized weights times their scales), as a matrix of the compute type.
+        """
+
+        return self.__weights.astype(self.dtype) * self.__scales[:, None]
+
+    def discover_parameters(self) -> List[Tuple[str, Tensor]]:
+        return []
+
+
+def quantize(model, dtype : np.dtype | str = None):
+
+    """
+        Returns a copy of a trained model, for inference only, where every :class:`minitorch.nn.Linear` layer is replaced by a :class:`QuantizedLinear` one.
+        Linear layers are found inside :class:`minitorch.nn.Sequential` containers and in the attributes of any module (also inside lists, tuples and dictionaries).
+        The original model is not modified.
+
+        >>> model = Sequential(Linear(2,3), ReLU(), Linear(3,1), Sigmoid())
+        >>> quantized = quantize(model, dtype="float32")
+        >>> quantized(batch)
+    """
+
+    # NOTE: Imported here because Sequential fuses quantized layers too, so it's built on top of this module
+    from minitorch.nn.Sequential import Sequential
+
+    if isinstance(model, Linear):
+        return QuantizedLinear(model, dtype)
+
+    if isinstance(model, Sequential):
+        return Sequential(*(quantize(layer, dtype) for layer in model.layers), fuse=model.fuse)
+
+    if isinstance(model, (list, tuple)):
+        return type(model)(quantize(item, dtype) for item in model)
+
+    if isinstance(model, dict):
+        return {key: quantize(item, dtype) for key, item in model.items()}
+
+    if not isinstance(model, Module):
+        return model
+
+    # Other modules are copied (without their cached registry, see Module), and their attributes are quantized one by one
+    res = copy.copy(model)
+    for name, value in list(res.__dict__.items()):
+        if isinstance(value, (Module, list, tuple, dict)):
+            setattr(res, name, quantize(value, dtype))
+
+    return res
@@ -1,6 +1,11 @@
-from minitorch.Autograd import Value
 from minitorch.Tensor import Tensor
 from minitorch.nn.Module import Module
+from minitorch.nn.Linear import Linear
+from minitorch.nn.QuantizedLinear import QuantizedLinear
+from minitorch.nn.ReLU import ReLU
+from minitorch.nn.Sigmoid import Sigmoid
+from minitorch.nn.Checkpoint import Checkpoint
+from functools import partial
 from typing import Tuple, List
 
 
@@ -19,18 +24,28 @@ class Sequential(Module):
 
        Layers in a Sequential are connected in a cascading way.
 
+       The input can be a single sample or a **batch** of samples (one sample per row). A batch flows through every layer at once.
+
+       When a :class:`minitorch.nn.Linear` (or :class:`minitorch.nn.QuantizedLinear`) layer is followed by a :class:`minitorch.nn.ReLU` or a :class:`minitorch.nn.Sigmoid` layer, both are run as a
+       single fused operation, which saves one intermediate tensor and one pass over the data. This can be disabled with ``fuse = False``.
+
+       If ``checkpoint_every = k``, the layers are split into segments of ``k`` steps that are **checkpointed** (see :class:`minitorch.nn.Checkpoint`):
+       their intermediate activations are not kept during the forward pass, and they are recomputed segment by segment during the backward pass.
+       The last segment is not checkpointed, because it would be recomputed right away.
+
     ==============
     **Parameters**
     ==============
     
         * **__layers:** (*Tuple[callable]*) Tuple of all the callable objects passed to the Sequential.
-        * **__trainable:** (*List[callable]*) List of all the callable objects passed to the Sequential that are *trainable* (this meaning, that subclass :class:`minitorch.nn.Module`).
+        * **__steps:** (*List[callable]*) Steps that are run, in order, on every call. Fused layers are run as a single step, and checkpointed segments too.
 
     ======================
     **Instance Variables**
     ======================
 
         * **layers:** (*Tuple[callable]*) Tuple of all the callable objects that comprise a Sequential instance.
+        * **fuse:** (*bool*) Whether linear layers are fused with the activation function that follows them.
 
     ===========
     **Example**
@@ -57,25 +72,59 @@ class Sequential(Module):
 
     """
 
-    def __init__(self, *layers):
+    def __init__(self, *layers, fuse : bool = True, checkpoint_every : int = None):
 
         self.__layers : Tuple[callable] = layers
+        self.fuse : bool = fuse
+
+        if checkpoint_every is not None and checkpoint_every < 1:
+            raise Exception("Error! Segments of a Sequential must have at least one (1) step")
+
+        # Layers run by each step
+        groups : List[Tuple[callable]] = []
+
+        self.__steps : List[callable] = []
+        i = 0
+        while i < len(self.__layers):
+            layer = self.__layers[i]
+            next_layer = self.__layers[i+1] if i+1 < len(self.__layers) else None
+
+            # A Linear layer followed by an activation function is run as one fused step
+            if fuse and isinstance(layer, (Linear, QuantizedLinear)) and type(next_layer) in (ReLU, Sigmoid):
+                self.__steps.append(partial(layer, fuse_with=next_layer))
+                groups.append((layer, next_layer))
+                i += 2
+            else:
+                self.__steps.append(layer)
+                groups.append((layer,))
+                i += 1
+
+        # Every segment but the last one is replaced by a single checkpointed step
+        if checkpoint_every is not None and len(groups) > checkpoint_every:
+            steps : List[callable] = []
+            for start in range(0, len(groups) - checkpoint_every, checkpoint_every):
+                segment = [layer for group in groups[start:start+checkpoint_every] for layer in group]
+                steps.append(Checkpoint(Sequential(*segment, fuse=fuse)))
+
+            last = len(steps)*checkpoint_every
+            self.__steps = steps + self.__steps[last:]
+
+    @property
+    def layers(self) -> Tuple[callable]:
+        return self.__layers
 
-        self.__trainable : List[callable] = []
-        for layer in self.__layers:
-            if isinstance(layer, Module):
-                self.__trainable.append(layer)
-        
     def __call__(self, input_vect : Tensor):
 
-        activation = (self.__layers[0])(input_vect)
-        for i in range(1, len(self.__layers)):
-            activation = (self.__layers[i])(activation)
+        activation = input_vect
+        for step in self.__steps:
+            activation = step(activation)
         return activation
 
-    def parameters(self) -> List[Value]:
-        parameters : List[Value] = []
-        for layer in self.__trainable:
-            parameters += layer.parameters()
+    def discover_parameters(self) -> List[Tuple[str, Tensor]]:
+        # Layers are named after their position in the Sequential
+        named : List[Tuple[str, Tensor]] = []
+        for i, layer in enumerate(self.__layers):
+            if isinstance(layer, Module):
+                named += [(f"{i}.{name}", param) for name, param in layer.named_parameters()]
 
-        return parameters 
\ No newline at end of file
+        return named 
\ No newline at end of file
@@ -1,8 +1,6 @@
 from minitorch.Autograd import Value
 from minitorch.Tensor import Tensor
 
-from typing import List
-
 class Sigmoid:
 
     """
@@ -27,11 +25,9 @@ class Sigmoid:
         .. note::
             This class is compatible with containers such as :class:`minitorch.nn.Sequential`
     
-    ==============
-    **Parameters**
-    ==============
-    
-        * **res:** (:class:`Tensor.Tensor` | :class:`Autograd.Value`) Result of the operation. Serves for caching.
+        .. note::
+            The layer does not keep its input nor its output. Only what the backward pass needs is saved in the computation graph
+            (see :class:`Function.Sigmoid`), and it's released as soon as the backward pass is done.
 
     ===========
     **Example**
@@ -39,41 +35,25 @@ class Sigmoid:
 
         >>> s = Sigmoid()
         >>> x = Tensor([1,-2,3])
-        >>> s(x) # >>> Tensor([Value(data=0.7310585786300049, grad=0), Value(data=0.8807970779778823, grad=0), Value(data=0.9525741268224334, grad=0)])
+        >>> s(x) # >>> Tensor([0.7310585786300049, 0.11920292202211755, 0.9525741268224334])
 
     """    
 
-    def __init__(self):
-        self.res : Tensor | Value = None
-    
     def __call__(self, activation : Tensor | Value | int | float) -> Tensor | Value:
 
         # If the input is a Tensor
         if isinstance(activation, Tensor):
             
-            # This auxiliar function takes the activation Tensor (as a list), and iterates through it.
-            # It builds a list of Value objects where each element is the Sigmoid evaluated at the element in the original Tensor.
-            def calculate_sigmoid_element_wise(act : List) -> List[Value] | List[List[Value]] | List[List[List[Value]]]:
-                if isinstance(act, list):
-                    return [calculate_sigmoid_element_wise(item) for item in act]
-                elif isinstance(act, Value):
-                    return act.sigmoid()
-                
-                # NOTE: No error handling here because Tensor class assures integrity
-                #       over the structure we are iterating through
-            
-            self.res = Tensor(calculate_sigmoid_element_wise(list(activation)))
+            # The Sigmoid is evaluated over the whole tensor in a single operation
+            return activation.sigmoid()
         
         # If the input is a single Value object
         elif isinstance(activation, Value):
-            self.res = activation.sigmoid()
+            return activation.sigmoid()
         
         # If the input is an integer or a float
         elif isinstance(activation, (int,float)):
             wrapped : Value = Value(activation)
-            self.res = wrapped.sigmoid()
+            return wrapped.sigmoid()
         
-        else:
-            raise Exception("Sigmoid can ONLY be applied to Tensor objects, Value objects, integers or floats")
-
-        return self.res
\ No newline at end of file
+        raise Exception("Sigmoid can ONLY be applied to Tensor objects, Value objects, integers or floats")
\ No newline at end of file
@@ -0,0 +1,111 @@
+from minitorch.Tensor import Tensor
+from minitorch.SparseTensor import SparseTensor
+from minitorch.Function import SparseAffine
+from minitorch.nn.Module import Module
+from typing import List, Tuple
+import math
+
+import numpy as np
+
+
+class SparseLinear(Module):
+
+    """
+    ===========
+    **Summary**
+    ===========
+
+        Applies a linear transformation to incoming data that is mostly zeros (e.g: one-hot or bag-of-words features), given as a :class:`minitorch.SparseTensor.SparseTensor`
+
+        .. math::
+            \\begin{align*}
+                l :=& SparseLinear \\\\
+                l(\\bar{x}) =& \\bar{x} \\cdot W + \\bar{b}
+            \\end{align*}
+
+        Unlike :class:`minitorch.nn.Linear`, the weight matrix :math:`W` has shape :math:`(in_features, out_features)`: every input feature owns a **row** of weights.
+        The forward pass only reads the rows of the features that are stored in the input, and the backward pass only computes the gradient of those rows,
+        which is kept as a row-sparse gradient (see :class:`minitorch.SparseGrad.SparseGrad`). Both cost as much as the number of stored elements of the input,
+        no matter how many input features there are. The optimizers only update the rows that received gradient too (see :attr:`minitorch.Tensor.Tensor.sparse_grad`).
+
+        Dense tensors are accepted too, but they are converted to sparse ones on every call.
+
+        Elements of :math:`W` and :math:`\\bar{b}` are sampled initially from :math:`\\mathcal{U}(-\\sqrt{\\frac{1}{in_features}}, \\sqrt{\\frac{1}{in_features}})`
+
+        .. warning::
+            Models with sparse layers can not be traced (see :func:`minitorch.jit.trace`): the sparse input is not a tensor, so it would be recorded as a constant.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **__weights:** (:class:`Tensor.Tensor`) Learnable weights. Matrix of shape :math:`(in_features, out_features)`.
+        * **__bias:** (:class:`Tensor.Tensor`) Learnable bias vector of shape :math:`(out_features,)`. If ``bias = False``, it's a fixed zero vector.
+
+    ======================
+    **Instance Variables**
+    ======================
+
+        * **in_features:** (*int*) Number of input features.
+        * **out_features:** (*int*) Number of output features.
+        * **seed:** (*int*) Seed of the random number generator
+
+    ===========
+    **Example**
+    ===========
+
+        >>> l = SparseLinear(100000, 16)
+        >>> batch = SparseTensor.from_coo(rows=[0, 0, 1], cols=[17, 4242, 99999], values=[1, 1, 1], shape=(2, 100000))
+        >>> l(batch) # This returns a tensor of shape [2,16]!
+
+    """
+
+    def __init__(self, in_features : int, out_features : int, bias : bool = True, seed : int = 4):
+
+        self.in_features : int = in_features
+        self.out_features : int = out_features
+        self.seed : int = seed
+
+        # Sparse layers are usually very wide, so the weights are sampled all at once
+        rng = np.random.default_rng(seed)
+        bound : float = math.sqrt(1/in_features)
+
+        self.__weights : Tensor = Tensor(rng.uniform(-bound, bound, (in_features, out_features)), requires_grad=True)
+        self.__weights.sparse_grad = True
+
+        self.__bias : Tensor
+        if bias:
+            self.__bias = Tensor(rng.uniform(-bound, bound, out_features), requires_grad=True)
+        else:
+            self.__bias = Tensor(np.zeros(out_features))
+
+    def __call__(self, activation : SparseTensor | Tensor) -> Tensor:
+
+        """
+            Applies the linear transformation to a sparse vector or a sparse batch of row vectors.
+        """
+
+        if isinstance(activation, Tensor):
+            activation = SparseTensor.from_dense(activation)
+
+        if not isinstance(activation, SparseTensor):
+            raise Exception("Error! SparseLinear layer can ONLY be applied to SparseTensor or Tensor objects")
+
+        if activation.shape()[-1] != self.in_features:
+            raise Exception(f"Error! SparseLinear layer expects a vector of {self.in_features} elements or a batch (matrix) of shape (batch, {self.in_features})")
+
+        return SparseAffine.apply(self.__weights, self.__bias, x=activation)
+
+    def forward(self, activation : SparseTensor | Tensor) -> Tensor:
+        return self(activation)
+
+    def discover_parameters(self) -> List[Tuple[str, Tensor]]:
+
+        """
+            Returns parameters of the model with their names (``weight`` and ``bias``).
+        """
+
+        if self.__bias.requires_grad:
+            return [("weight", self.__weights), ("bias", self.__bias)]
+        else:
+            return [("weight", self.__weights)]
@@ -7,4 +7,10 @@ from .Module import Module
 from .ReLU import ReLU
 from .Sequential import Sequential
 from .Sigmoid import Sigmoid
-from .BinaryCrossEntropyLoss import BinaryCrossEntropyLoss
\ No newline at end of file
+from .BinaryCrossEntropyLoss import BinaryCrossEntropyLoss
+from .BCEWithLogitsLoss import BCEWithLogitsLoss
+from .Checkpoint import Checkpoint, checkpoint
+from .DataParallel import DataParallel
+from .QuantizedLinear import QuantizedLinear, quantize
+from .SparseLinear import SparseLinear
+from .Embedding import Embedding
\ No newline at end of file
@@ -0,0 +1,153 @@
+from minitorch.optim.Optimizer import Optimizer
+from minitorch.Tensor import Tensor
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+class Adam (Optimizer):
+    """
+    ===========
+    **Summary**
+    ===========
+
+        Class that implements the Adam algorithm, which adapts the step of every parameter with running estimates of the first and second moments of its gradient.
+
+        The moment estimates are two flat buffers (as long as :attr:`Optimizer.flat_data`), so the update of all the parameters is computed at once.
+
+        Parameters with row-sparse gradients (see :attr:`Optimizer.sparse_params`) only have the rows that received gradient updated, together with their moment estimates.
+        The update is **lazy**: the moments of a row only decay, and a row only shrinks by weight decay, on the steps where the row is used.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **params:** (*Iterable[Tensor]*) An iterable of Tensor objects that are subject to be optimized by the optimizer algorithm (Optimizer subclass).
+        * **lr:** (*float*) Learning rate. Default is :math:`1 \\cdot 10^{-3}`.
+        * **betas:** (*Tuple[float, float]*) Decay rates of the running estimates of the first and second moments of the gradient. Default is (0.9, 0.999).
+        * **eps:** (*float*) Term added to the denominator to improve numerical stability. Default is :math:`1 \\cdot 10^{-8}`.
+        * **weight_decay:** (*float*) Weight decay (L2 penalty) factor. Default is 0.
+        * **__m:** (*np.ndarray*) Flat buffer with the running estimate of the first moment (mean) of the gradient.
+        * **__v:** (*np.ndarray*) Flat buffer with the running estimate of the second moment (uncentered variance) of the gradient.
+        * **__denom:** (*np.ndarray*) Flat buffer where the denominator of the update (and then the update itself) is computed, so that no memory is allocated on each step.
+        * **__sparse_m:** (*List[np.ndarray]*) Estimate of the first moment of every parameter with row-sparse gradients.
+        * **__sparse_v:** (*List[np.ndarray]*) Estimate of the second moment of every parameter with row-sparse gradients.
+
+    ======================
+    **Instance Variables**
+    ======================
+
+        * **params:** (*List[Tensor]*) Parameters of the model that must be optimized.
+        * **lr:** (*float*) Learning rate hyperparameter for the optimization algorithm.
+        * **betas:** (*Tuple[float, float]*) Decay rates of the moment estimates.
+        * **eps:** (*float*) Numerical stability term.
+        * **weight_decay:** (*float*) Weight decay factor.
+        * **steps:** (*int*) Number of optimization steps performed so far.
+
+    ===========
+    **Example**
+    ===========
+
+        .. code-block:: python
+
+            optim_adam = Adam(model.parameters(), lr=1e-2)
+
+            for i in range(epochs):
+                optim_adam.zero_grad()
+                loss = loss_fn(model(data), labels)
+                loss.backward()
+                optim_adam.step()
+
+    """
+
+    # If True, the weight decay shrinks the parameters directly instead of being added to the gradient (see AdamW)
+    decoupled_weight_decay : bool = False
+
+    def __init__(self, params : Iterable[Tensor], lr : float = 1e-3, betas : Tuple[float, float] = (0.9, 0.999), eps : float = 1e-8, weight_decay : float = 0):
+        super().__init__(params)
+
+        if lr < 0 or eps < 0 or weight_decay < 0:
+            raise Exception("Error! The learning rate, epsilon and the weight decay can not be negative")
+
+        if not all(0 <= beta < 1 for beta in betas):
+            raise Exception("Error! Both betas must be in the interval [0, 1)")
+
+        self.lr = lr
+        self.betas = betas
+        self.eps = eps
+        self.weight_decay = weight_decay
+        self.steps : int = 0
+
+        self.__m : np.ndarray = np.zeros_like(self.flat_data)
+        self.__v : np.ndarray = np.zeros_like(self.flat_data)
+        self.__denom : np.ndarray = np.empty_like(self.flat_data)
+
+        self.__sparse_m : List[np.ndarray] = [np.zeros_like(param.data) for param in self.sparse_params]
+        self.__sparse_v : List[np.ndarray] = [np.zeros_like(param.data) for param in self.sparse_params]
+
+    def step(self) -> None:
+        """
+            Performs a single optimization step.
+
+            Optimization step for Adam is defined as:
+
+            .. math::
+                \\text{for } t = 1 \\text{ to ... do} \\\\
+                \\begin{align*}
+                    &g_t \\leftarrow \\nabla_{\\theta} f_t(\\theta_{t-1}) + \\lambda \\cdot \\theta_{t-1} \\\\
+                    &m_t \\leftarrow \\beta_1 \\cdot m_{t-1} + (1 - \\beta_1) \\cdot g_t \\\\
+                    &v_t \\leftarrow \\beta_2 \\cdot v_{t-1} + (1 - \\beta_2) \\cdot g_t^2 \\\\
+                    &\\theta_t \\leftarrow \\theta_{t-1} - \\gamma \\cdot \\frac{m_t / (1 - \\beta_1^t)}{\\sqrt{v_t / (1 - \\beta_2^t)} + \\epsilon}
+                \\end{align*}
+
+            Where :math:`\\gamma` is the learning rate, :math:`\\lambda` the weight decay and :math:`t` the number of the step.
+        """
+        grad = self.gather_grads()
+        beta1, beta2 = self.betas
+
+        self.steps += 1
+
+        if self.weight_decay != 0:
+            if self.decoupled_weight_decay:
+                self.flat_data *= 1 - self.lr * self.weight_decay
+            else:
+                grad = grad + self.weight_decay * self.flat_data
+
+        # Running estimates of the moments. The denominator buffer holds the scaled gradient in the meantime
+        self.__m *= beta1
+        np.multiply(grad, 1 - beta1, out=self.__denom)
+        self.__m += self.__denom
+        self.__v *= beta2
+        np.square(grad, out=self.__denom)
+        self.__denom *= 1 - beta2
+        self.__v += self.__denom
+
+        # The second bias correction divides the square root of the second moment before epsilon is added, and the first one is folded into the step size.
+        # The update is computed in place in the denominator buffer, so the moments are never copied
+        bias_correction1 = 1 - beta1**self.steps
+        bias_correction2 = 1 - beta2**self.steps
+
+        np.sqrt(self.__v, out=self.__denom)
+        self.__denom /= np.sqrt(bias_correction2)
+        self.__denom += self.eps
+
+        np.divide(self.__m, self.__denom, out=self.__denom)
+        self.__denom *= self.lr / bias_correction1
+        self.flat_data -= self.__denom
+
+        # Sparse update: only the rows that received gradient (and their moments) are read and written
+        for i, param, sparse_grad in self.sparse_grads():
+            rows, grad = sparse_grad.indices, sparse_grad.rows
+            data = param.data
+
+            if self.weight_decay != 0:
+                if self.decoupled_weight_decay:
+                    data[rows] *= 1 - self.lr * self.weight_decay
+                else:
+                    grad = grad + self.weight_decay * data[rows]
+
+            m_rows = beta1 * self.__sparse_m[i][rows] + (1 - beta1) * grad
+            v_rows = beta2 * self.__sparse_v[i][rows] + (1 - beta2) * np.square(grad)
+            self.__sparse_m[i][rows] = m_rows
+            self.__sparse_v[i][rows] = v_rows
+
+            data[rows] -= (self.lr / bias_correction1) * (m_rows / (np.sqrt(v_rows) / np.sqrt(bias_correction2) + self.eps))
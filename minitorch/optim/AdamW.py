@@ -0,0 +1,37 @@
+from minitorch.optim.Adam import Adam
+from minitorch.Tensor import Tensor
+from typing import Iterable, Tuple
+
+class AdamW (Adam):
+    """
+    ===========
+    **Summary**
+    ===========
+
+        Class that implements the AdamW algorithm: :class:`Adam` with **decoupled weight decay**.
+
+        The weight decay shrinks the parameters directly (:math:`\\theta \\leftarrow \\theta \\cdot (1 - \\gamma \\lambda)`) instead of being added to the gradient,
+        so it is not scaled by the moment estimates.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **params:** (*Iterable[Tensor]*) An iterable of Tensor objects that are subject to be optimized by the optimizer algorithm (Optimizer subclass).
+        * **lr:** (*float*) Learning rate. Default is :math:`1 \\cdot 10^{-3}`.
+        * **betas:** (*Tuple[float, float]*) Decay rates of the running estimates of the first and second moments of the gradient. Default is (0.9, 0.999).
+        * **eps:** (*float*) Term added to the denominator to improve numerical stability. Default is :math:`1 \\cdot 10^{-8}`.
+        * **weight_decay:** (*float*) Decoupled weight decay factor. Default is :math:`1 \\cdot 10^{-2}`.
+
+    ===========
+    **Example**
+    ===========
+
+        >>> optim_adamw = AdamW(model.parameters(), lr=1e-2, weight_decay=1e-2)
+
+    """
+
+    decoupled_weight_decay : bool = True
+
+    def __init__(self, params : Iterable[Tensor], lr : float = 1e-3, betas : Tuple[float, float] = (0.9, 0.999), eps : float = 1e-8, weight_decay : float = 1e-2):
+        super().__init__(params, lr=lr, betas=betas, eps=eps, weight_decay=weight_decay)
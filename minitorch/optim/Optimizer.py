@@ -1,5 +1,8 @@
-from minitorch.Autograd import Value
-from typing import Iterable
+from minitorch.Tensor import Tensor
+from minitorch.SparseGrad import SparseGrad
+from typing import Iterable, List, Tuple
+
+import numpy as np
 
 class Optimizer:
     """
@@ -9,22 +12,122 @@ class Optimizer:
 
         Base class that all optimizers must import. Functions as an interface and provides high abstraction methods.
 
+        The parameters are **packed into one contiguous flat buffer**: the data of every parameter becomes a view of a slice of :attr:`flat_data`,
+        and its gradient a view of the same slice of :attr:`flat_grad`. This way, subclasses update all the parameters of the model with
+        a few vectorized operations over the flat buffers, instead of one operation per parameter.
+
+        Parameters with row-sparse gradients (see :attr:`minitorch.Tensor.Tensor.sparse_grad`, e.g: the weights of :class:`minitorch.nn.Embedding`) are
+        **not** packed, since a vectorized update over them would cost as much as their number of rows. Subclasses update them apart, with a **sparse update**
+        that only touches the rows that received some gradient (see :meth:`sparse_grads`).
+
+        The flat buffers (and the state of the subclasses) are stored as the type of the parameters, so all of them must be stored as the same type
+        (see :meth:`minitorch.nn.Module.to`).
+
+        .. note::
+            ``float16`` only represents magnitudes down to about :math:`6 \\cdot 10^{-8}`, so smaller hyperparameters (e.g: the default epsilon of :class:`Adam`) round to zero.
+            Use values of at least :math:`10^{-4}` when training in half precision.
+
+        .. warning::
+            A parameter can only be packed by one optimizer at a time. Creating a new optimizer over the same parameters makes the previous one invalid.
+
     ==============
     **Parameters**
     ==============
-    
-        * **params:** (*Iterable[Value]*) An iterable of Value objects that are subject to be optimized by the optimizer algorithm (Optimizer subclass).
+
+        * **params:** (*Iterable[Tensor]*) An iterable of Tensor objects that are subject to be optimized by the optimizer algorithm (Optimizer subclass).
+
+        * **__dense_params:** (*List[Tensor]*) Parameters packed into the flat buffers.
+
+        * **__data_views:** (*List[np.ndarray]*) Slice of :attr:`flat_data` that stores each packed parameter.
+
+        * **__grad_views:** (*List[np.ndarray]*) Slice of :attr:`flat_grad` bound as the gradient of each packed parameter.
 
     ======================
     **Instance Variables**
     ======================
 
-        * **params:** (*Iterable[Value]*) Parameters of the model that must be optimized.
+        * **params:** (*List[Tensor]*) Parameters of the model that must be optimized.
+
+        * **sparse_params:** (*List[Tensor]*) Parameters with row-sparse gradients, which are not packed.
+
+        * **flat_data:** (*np.ndarray*) Contiguous buffer that stores the data of all the packed parameters.
+
+        * **flat_grad:** (*np.ndarray*) Contiguous buffer that stores the gradients of all the packed parameters.
 
     """
-    
-    def __init__(self, params : Iterable[Value]):
-        self.params = params
+
+    def __init__(self, params : Iterable[Tensor]):
+        # A parameter that is shared between layers is only packed (and updated) once
+        self.params : List[Tensor] = list({id(param): param for param in params}.values())
+
+        self.__dense_params : List[Tensor] = [param for param in self.params if not param.sparse_grad]
+        self.sparse_params : List[Tensor] = [param for param in self.params if param.sparse_grad]
+
+        size = sum(param.data.size for param in self.__dense_params)
+
+        dtypes = {param.dtype() for param in self.params}
+        if len(dtypes) > 1:
+            raise Exception(f"Error! All the parameters of an optimizer must be stored as the same type, but they are stored as {sorted(str(d) for d in dtypes)}")
+        dtype = dtypes.pop() if dtypes else np.float64
+
+        self.flat_data : np.ndarray = np.empty(size, dtype=dtype)
+        self.flat_grad : np.ndarray = np.zeros(size, dtype=dtype)
+
+        self.__data_views : List[np.ndarray] = []
+        self.__grad_views : List[np.ndarray] = []
+
+        offset = 0
+        for param in self.__dense_params:
+            n = param.data.size
+            param.set_storage(self.flat_data[offset:offset+n])
+            self.__data_views.append(param.data)
+            self.__grad_views.append(self.flat_grad[offset:offset+n].reshape(param.shape()))
+            offset += n
+
+    def gather_grads(self) -> np.ndarray:
+        """
+            Returns :attr:`flat_grad` with the current gradients of all the packed parameters. Parameters without gradient count as having a zero gradient.
+
+            Gradients that were accumulated while bound to the flat buffer are already in place. Only the ones that were replaced
+            (e.g: by :meth:`minitorch.nn.Module.zero_grad`, or by a row-sparse gradient) are copied into it, and bound again.
+        """
+        for param, data_view, grad_view in zip(self.__dense_params, self.__data_views, self.__grad_views):
+            if param.data is not data_view:
+                raise Exception("Error! The parameters of this optimizer were packed by another optimizer. Please use only the last one created")
+
+            if param.grad is grad_view:
+                continue
+
+            if param.grad is None:
+                grad_view.fill(0)
+            elif isinstance(param.grad, SparseGrad):
+                param.grad.to_dense(out=grad_view)
+            else:
+                grad_view[...] = param.grad
+            param.grad = grad_view
+
+        return self.flat_grad
+
+    def sparse_grads(self) -> List[Tuple[int, Tensor, SparseGrad]]:
+        """
+            Returns the (position in :attr:`sparse_params`, parameter, gradient) of every parameter with a row-sparse gradient that received some gradient.
+            Gradients are coalesced, so every row appears once. A dense gradient (e.g: accumulated from a dense operation) counts as a gradient of all the rows.
+        """
+        grads : List[Tuple[int, Tensor, SparseGrad]] = []
+
+        for i, param in enumerate(self.sparse_params):
+            if param.grad is None:
+                continue
+
+            if isinstance(param.grad, SparseGrad):
+                grad = param.grad.coalesce()
+            else:
+                grad = SparseGrad(np.arange(param.shape()[0]), param.grad, param.shape())
+
+            if len(grad.indices) > 0:
+                grads.append((i, param, grad))
+
+        return grads
 
     def step(self) -> None:
         """
@@ -34,7 +137,12 @@ class Optimizer:
 
     def zero_grad(self) -> None:
         """
-            Resets the gradients of all optimized parameters.
+            Resets the gradients of all optimized parameters to zero **in place**, with a single operation over the flat gradient buffer.
+            The gradients of parameters with row-sparse gradients are dropped instead, so that resetting them does not depend on their number of rows.
         """
-        for param in self.params:
-            param.grad = 0
\ No newline at end of file
+        self.flat_grad.fill(0)
+        for param, grad_view in zip(self.__dense_params, self.__grad_views):
+            param.grad = grad_view
+
+        for param in self.sparse_params:
+            param.grad = None
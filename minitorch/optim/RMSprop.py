@@ -0,0 +1,129 @@
+from minitorch.optim.Optimizer import Optimizer
+from minitorch.Tensor import Tensor
+from typing import Iterable, List
+
+import numpy as np
+
+class RMSprop (Optimizer):
+    """
+    ===========
+    **Summary**
+    ===========
+
+        Class that implements the RMSprop algorithm, which divides the gradient of every parameter by a running average of its magnitude.
+
+        The running average (and the momentum, if used) are flat buffers as long as :attr:`Optimizer.flat_data`, so the update of all the parameters is computed at once.
+
+        Parameters with row-sparse gradients (see :attr:`Optimizer.sparse_params`) only have the rows that received gradient updated, together with their running average and momentum.
+        The update is **lazy**: the running average and the momentum of a row only decay on the steps where the row is used.
+
+    ==============
+    **Parameters**
+    ==============
+
+        * **params:** (*Iterable[Tensor]*) An iterable of Tensor objects that are subject to be optimized by the optimizer algorithm (Optimizer subclass).
+        * **lr:** (*float*) Learning rate. Default is :math:`1 \\cdot 10^{-2}`.
+        * **alpha:** (*float*) Smoothing constant of the running average of the squared gradient. Default is 0.99.
+        * **eps:** (*float*) Term added to the denominator to improve numerical stability. Default is :math:`1 \\cdot 10^{-8}`.
+        * **weight_decay:** (*float*) Weight decay (L2 penalty) factor. Default is 0.
+        * **momentum:** (*float*) Momentum factor. Default is 0 (no momentum).
+        * **__square_avg:** (*np.ndarray*) Flat buffer with the running average of the squared gradient.
+        * **__velocity:** (*np.ndarray*) Flat buffer with the momentum of every parameter. It's only allocated if momentum is used.
+        * **__denom:** (*np.ndarray*) Flat buffer where the denominator of the update is computed, so that no memory is allocated on each step.
+        * **__sparse_square_avg:** (*List[np.ndarray]*) Running average of the squared gradient of every parameter with row-sparse gradients.
+        * **__sparse_velocity:** (*List[np.ndarray]*) Momentum of every parameter with row-sparse gradients. It's only allocated if momentum is used.
+
+    ======================
+    **Instance Variables**
+    ======================
+
+        * **params:** (*List[Tensor]*) Parameters of the model that must be optimized.
+        * **lr:** (*float*) Learning rate hyperparameter for the optimization algorithm.
+        * **alpha:** (*float*) Smoothing constant.
+        * **eps:** (*float*) Numerical stability term.
+        * **weight_decay:** (*float*) Weight decay factor.
+        * **momentum:** (*float*) Momentum factor.
+
+    ===========
+    **Example**
+    ===========
+
+        >>> optim_rmsprop = RMSprop(model.parameters(), lr=1e-2, momentum=0.9)
+
+    """
+
+    def __init__(self, params : Iterable[Tensor], lr : float = 1e-2, alpha : float = 0.99, eps : float = 1e-8, weight_decay : float = 0, momentum : float = 0):
+        super().__init__(params)
+
+        if lr < 0 or eps < 0 or weight_decay < 0 or momentum < 0:
+            raise Exception("Error! The learning rate, epsilon, the weight decay and the momentum can not be negative")
+
+        if not 0 <= alpha < 1:
+            raise Exception("Error! Alpha must be in the interval [0, 1)")
+
+        self.lr = lr
+        self.alpha = alpha
+        self.eps = eps
+        self.weight_decay = weight_decay
+        self.momentum = momentum
+
+        self.__square_avg : np.ndarray = np.zeros_like(self.flat_data)
+        self.__velocity : np.ndarray = np.zeros_like(self.flat_data) if momentum != 0 else None
+        self.__denom : np.ndarray = np.empty_like(self.flat_data)
+
+        self.__sparse_square_avg : List[np.ndarray] = [np.zeros_like(param.data) for param in self.sparse_params]
+        self.__sparse_velocity : List[np.ndarray] = [np.zeros_like(param.data) for param in self.sparse_params] if momentum != 0 else None
+
+    def step(self) -> None:
+        """
+            Performs a single optimization step.
+
+            Optimization step for RMSprop is defined as:
+
+            .. math::
+                \\text{for } t = 1 \\text{ to ... do} \\\\
+                \\begin{align*}
+                    &g_t \\leftarrow \\nabla_{\\theta} f_t(\\theta_{t-1}) + \\lambda \\cdot \\theta_{t-1} \\\\
+                    &v_t \\leftarrow \\alpha \\cdot v_{t-1} + (1 - \\alpha) \\cdot g_t^2 \\\\
+                    &b_t \\leftarrow \\mu \\cdot b_{t-1} + \\frac{g_t}{\\sqrt{v_t} + \\epsilon} \\\\
+                    &\\theta_t \\leftarrow \\theta_{t-1} - \\gamma \\cdot b_t
+                \\end{align*}
+
+            Where :math:`\\gamma` is the learning rate, :math:`\\mu` the momentum and :math:`\\lambda` the weight decay.
+        """
+        grad = self.gather_grads()
+
+        if self.weight_decay != 0:
+            grad = grad + self.weight_decay * self.flat_data
+
+        self.__square_avg *= self.alpha
+        self.__square_avg += (1 - self.alpha) * np.square(grad)
+
+        np.sqrt(self.__square_avg, out=self.__denom)
+        self.__denom += self.eps
+
+        if self.__velocity is not None:
+            self.__velocity *= self.momentum
+            self.__velocity += grad / self.__denom
+            self.flat_data -= self.lr * self.__velocity
+        else:
+            self.flat_data -= self.lr * (grad / self.__denom)
+
+        # Sparse update: only the rows that received gradient (and their running averages) are read and written
+        for i, param, sparse_grad in self.sparse_grads():
+            rows, grad = sparse_grad.indices, sparse_grad.rows
+            data = param.data
+
+            if self.weight_decay != 0:
+                grad = grad + self.weight_decay * data[rows]
+
+            square_avg_rows = self.alpha * self.__sparse_square_avg[i][rows] + (1 - self.alpha) * np.square(grad)
+            self.__sparse_square_avg[i][rows] = square_avg_rows
+
+            step = grad / (np.sqrt(square_avg_rows) + self.eps)
+            if self.__sparse_velocity is not None:
+                velocity = self.__sparse_velocity[i]
+                velocity[rows] = self.momentum * velocity[rows] + step
+                step = velocity[rows]
+
+            data[rows] -= self.lr * step
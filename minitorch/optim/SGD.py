@@ -1,6 +1,8 @@
 from minitorch.optim.Optimizer import Optimizer
-from minitorch.Autograd import Value
-from typing import Iterable
+from minitorch.Tensor import Tensor
+from typing import Iterable, List
+
+import numpy as np
 
 class SGD (Optimizer):
     """
@@ -8,21 +10,34 @@ class SGD (Optimizer):
     **Summary**
     ===========
 
-        Class that implements stochastic gradient descent (SGD).
+        Class that implements stochastic gradient descent (SGD), optionally with momentum and weight decay (L2 penalty).
+
+        The update of all the parameters is computed at once over the flat buffers of :class:`Optimizer`.
+
+        Parameters with row-sparse gradients (see :attr:`Optimizer.sparse_params`) only have the rows that received gradient updated.
+        Their momentum and weight decay are **lazy**: the momentum of a row only decays, and a row only shrinks, on the steps where the row is used.
     
     ==============
     **Parameters**
     ==============
     
-        * **params:** (*Iterable[Value]*) An iterable of Value objects that are subject to be optimized by the optimizer algorithm (Optimizer subclass).
+        * **params:** (*Iterable[Tensor]*) An iterable of Tensor objects that are subject to be optimized by the optimizer algorithm (Optimizer subclass).
         * **lr:** (*float*) Learning rate to be used during the stochastic gradient descent. Default is :math:`1 \\cdot 10^{-3}`. 
+        * **momentum:** (*float*) Momentum factor. Default is 0 (no momentum).
+        * **weight_decay:** (*float*) Weight decay (L2 penalty) factor. Default is 0.
+        * **nesterov:** (*bool*) If ``True``, Nesterov momentum is used. Default is ``False``.
+        * **__velocity:** (*np.ndarray*) Flat buffer with the momentum of every parameter. It's only allocated if momentum is used.
+        * **__sparse_velocity:** (*List[np.ndarray]*) Momentum of every parameter with row-sparse gradients. It's only allocated if momentum is used.
 
     ======================
     **Instance Variables**
     ======================
 
-        * **params:** (*Iterable[Value]*) Parameters of the model that must be optimized.
+        * **params:** (*Iterable[Tensor]*) Parameters of the model that must be optimized.
         * **lr:** (*float*) Learning rate hyperparameter for the optimization algorithm.
+        * **momentum:** (*float*) Momentum factor.
+        * **weight_decay:** (*float*) Weight decay factor.
+        * **nesterov:** (*bool*) If Nesterov momentum is used.
 
     ===========
     **Example**
@@ -44,9 +59,22 @@ class SGD (Optimizer):
                     optim_sgd.step()
 
     """
-    def __init__(self, params : Iterable[Value], lr : float = 1e-3):
+    def __init__(self, params : Iterable[Tensor], lr : float = 1e-3, momentum : float = 0, weight_decay : float = 0, nesterov : bool = False):
         super().__init__(params)
+
+        if lr < 0 or momentum < 0 or weight_decay < 0:
+            raise Exception("Error! The learning rate, the momentum and the weight decay can not be negative")
+
+        if nesterov and momentum == 0:
+            raise Exception("Error! Nesterov momentum requires a momentum greater than zero (0)")
+
         self.lr = lr
+        self.momentum = momentum
+        self.weight_decay = weight_decay
+        self.nesterov = nesterov
+
+        self.__velocity : np.ndarray = np.zeros_like(self.flat_data) if momentum != 0 else None
+        self.__sparse_velocity : List[np.ndarray] = [np.zeros_like(param.data) for param in self.sparse_params] if momentum != 0 else None
     
     def step(self) -> None:
         """
@@ -57,14 +85,40 @@ class SGD (Optimizer):
             .. math::
                 \\text{for } t = 1 \\text{ to ... do} \\\\
                 \\begin{align*}
-                    &g_t \\leftarrow \\nabla_{\\theta} f_t(\\theta_{t-1}) \\\\
-                    &\\theta_t \\leftarrow \\theta_{t-1} - \\gamma \\cdot g_t
+                    &g_t \\leftarrow \\nabla_{\\theta} f_t(\\theta_{t-1}) + \\lambda \\cdot \\theta_{t-1} \\\\
+                    &b_t \\leftarrow \\mu \\cdot b_{t-1} + g_t \\\\
+                    &\\theta_t \\leftarrow \\theta_{t-1} - \\gamma \\cdot b_t
                 \\end{align*}
 
-            Where :math:`\\gamma` is the learning rate and :math:`t` goes from 1 to the parameters of the model.
+            Where :math:`\\gamma` is the learning rate, :math:`\\mu` the momentum, :math:`\\lambda` the weight decay and :math:`t` goes from 1 to the parameters of the model.
+            With Nesterov momentum, the parameters are moved by :math:`\\gamma \\cdot (g_t + \\mu \\cdot b_t)` instead.
                 
         """
-        # Iterate through all the parameters and update them "in the direction of their gradient with a step as big as {learning rate}"
-        for param in self.params:
-            param.data = param.data - (self.lr * param.grad)
-    
\ No newline at end of file
+        grad = self.gather_grads()
+
+        # The weight decay is added to a new buffer, so the gradients of the parameters are left untouched
+        if self.weight_decay != 0:
+            grad = grad + self.weight_decay * self.flat_data
+
+        if self.__velocity is not None:
+            self.__velocity *= self.momentum
+            self.__velocity += grad
+            grad = grad + self.momentum * self.__velocity if self.nesterov else self.__velocity
+
+        # All the parameters are updated "in the direction of their gradient with a step as big as {learning rate}" at once
+        self.flat_data -= self.lr * grad
+
+        # Sparse update: only the rows that received gradient are read and written
+        for i, param, sparse_grad in self.sparse_grads():
+            rows, grad = sparse_grad.indices, sparse_grad.rows
+            data = param.data
+
+            if self.weight_decay != 0:
+                grad = grad + self.weight_decay * data[rows]
+
+            if self.__sparse_velocity is not None:
+                velocity = self.__sparse_velocity[i]
+                velocity[rows] = self.momentum * velocity[rows] + grad
+                grad = grad + self.momentum * velocity[rows] if self.nesterov else velocity[rows]
+
+            data[rows] -= self.lr * grad
@@ -6,4 +6,7 @@
     All optimizers implement a step() method, that updates the parameters.
 """
 from .Optimizer import Optimizer
-from .SGD import SGD
\ No newline at end of file
+from .SGD import SGD
+from .Adam import Adam
+from .AdamW import AdamW
+from .RMSprop import RMSprop
\ No newline at end of file
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+from minitorch import Tensor, Value
+
+
+def test_retained_graph_is_differentiated_from_scratch():
+    x = Tensor([1.0, 2.0], requires_grad=True)
+    y = ((x * 3) * 2).sum()
+
+    y.backward(retain_graph=True)
+    assert np.allclose(x.grad, [6, 6])
+
+    x.grad = None
+    y.backward(retain_graph=True)
+    assert np.allclose(x.grad, [6, 6])
+
+
+def test_leaf_gradients_accumulate_across_calls():
+    x = Tensor([1.0, 2.0], requires_grad=True)
+    y = ((x * 3) * 2).sum()
+
+    y.backward(retain_graph=True)
+    y.backward()
+    assert np.allclose(x.grad, [12, 12])
+
+
+def test_shared_trunk():
+    w = Tensor([1.0], requires_grad=True)
+    h = w * 3
+    l1 = h * 1
+    l2 = h * 10
+
+    l1.backward(retain_graph=True)
+    l2.backward()
+    assert np.allclose(w.grad, [33])
+
+
+def test_shared_trunk_freed_by_first_backward():
+    w = Tensor([1.0], requires_grad=True)
+    h = w * 3
+    l1 = h * 1
+    l2 = h * 10
+
+    l1.backward()
+    with pytest.raises(Exception):
+        l2.backward()
+
+
+def test_intermediate_gradients_are_not_kept():
+    x = Tensor([1.0, 2.0], requires_grad=True)
+    h = x * 3
+    h.sum().backward()
+    assert h.grad is None
+    assert np.allclose(x.grad, [3, 3])
+
+
+def test_value_retained_tree_is_differentiated_from_scratch():
+    a = Value(1.0)
+    y = (a * 3) * 2
+
+    y.backward(retain_graph=True)
+    assert a.grad == 6
+
+    a.grad = 0
+    y.backward()
+    assert a.grad == 6
+
+
+def test_value_shared_trunk():
+    w = Value(1.0)
+    h = w * 3
+    l1 = h * 1
+    l2 = h * 10
+
+    l1.backward(retain_graph=True)
+    l2.backward()
+    assert w.grad == 33
+
+
+def test_intermediate_gradients_are_freed_while_propagating():
+    import tracemalloc
+
+    x = Tensor(np.ones(250_000), requires_grad=True)
+    h = x
+    for _ in range(20):
+        h = h * 1.0001
+    y = h.sum()
+
+    tracemalloc.start()
+    y.backward()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Only a few gradients of the chain are alive at the same time, instead of one per operation
+    assert peak < 6 * x.data.nbytes
+    assert np.allclose(x.grad, 1.0001 ** 20)
+
+
+def test_relu_masks_are_not_packed_without_grad(monkeypatch):
+    import sys
+    from minitorch import no_grad
+    from minitorch.nn import Linear, ReLU, Sequential
+
+    def fail(mask):
+        raise AssertionError("pack_mask called without grad")
+
+    monkeypatch.setattr(sys.modules["minitorch.Function"], "pack_mask", fail)
+
+    x = Tensor([[1.0, -2.0], [3.0, 4.0]], requires_grad=True)
+    for fuse in (True, False):
+        model = Sequential(Linear(2, 3, seed=1), ReLU(), fuse=fuse)
+        with no_grad():
+            output = model(x)
+        assert not output.requires_grad
+        assert np.all(output.data >= 0)
+
+
+def test_activations_are_not_saved_without_grad(monkeypatch):
+    from minitorch import no_grad
+    from minitorch.Function import AffineSigmoid, Max, Sigmoid
+    from minitorch.nn import Linear, Sequential
+    from minitorch.nn import Sigmoid as SigmoidLayer
+
+    def fail(self, *arrays):
+        raise AssertionError("save_for_backward called without grad")
+
+    for function in (Sigmoid, AffineSigmoid, Max):
+        monkeypatch.setattr(function, "save_for_backward", fail)
+
+    x = Tensor([[1.0, -2.0], [3.0, 4.0]], requires_grad=True)
+    for fuse in (True, False):
+        model = Sequential(Linear(2, 3, seed=1), SigmoidLayer(), fuse=fuse)
+        with no_grad():
+            output = model(x).max()
+        assert not output.requires_grad
@@ -0,0 +1,48 @@
+from functools import partial
+
+import numpy as np
+
+from minitorch import Tensor
+from minitorch.data import DataLoader, Dataset, collate
+
+
+def test_collate_keeps_the_type_of_the_samples():
+    samples = [Tensor([1.0, 2.0], dtype="float32"), Tensor([3.0, 4.0], dtype="float32")]
+    batch = collate(samples)
+    assert batch.dtype() == np.float32
+    assert np.allclose(batch.data, [[1, 2], [3, 4]])
+
+
+def test_collate_defaults_to_float64():
+    assert collate([[1, 2], [3, 4]]).dtype() == np.float64
+    assert collate([1, 2]).shape() == (2, 1)
+
+
+def test_collate_converts_to_the_given_type():
+    samples = [(np.array([1.0, 2.0]), 0), (np.array([3.0, 4.0]), 1)]
+    inputs, labels = collate(samples, dtype="float16")
+    assert inputs.dtype() == np.float16 and labels.dtype() == np.float16
+
+
+class Squares(Dataset):
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, i):
+        return np.array([i, i * i], dtype=np.float32), float(i)
+
+
+def test_data_loader_with_typed_collate():
+    loader = DataLoader(Squares(), batch_size=2, collate_fn=partial(collate, dtype="float32"))
+    for inputs, labels in loader:
+        assert inputs.dtype() == np.float32 and labels.dtype() == np.float32
+
+
+def test_tensor_dataset_keeps_the_type_of_its_arrays():
+    from minitorch.data import TensorDataset
+
+    x = np.arange(8, dtype=np.float32).reshape(4, 2)
+    y = [0, 1, 1, 0]
+    for inputs, labels in DataLoader(TensorDataset(x, y), batch_size=2):
+        assert inputs.dtype() == np.float32
+        assert labels.dtype() == np.float64 and labels.shape() == (2, 1)
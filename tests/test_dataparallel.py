@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from minitorch import Tensor, SparseGrad
+from minitorch.nn import Linear, ReLU, Sigmoid, Sequential, BinaryCrossEntropyLoss, DataParallel
+from minitorch.optim import SGD
+
+
+def make_model():
+    return Sequential(Linear(6, 8, seed=1), ReLU(), Linear(8, 1, seed=2), Sigmoid())
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_all_reduce_matches_single_process(start_method):
+    rng = np.random.default_rng(0)
+    # An odd batch size gives shards of different sizes
+    x = Tensor(rng.standard_normal((23, 6)))
+    y = Tensor((rng.random((23, 1)) > 0.5).astype(float))
+
+    reference, model = make_model(), make_model()
+    reference_optim = SGD(reference.parameters(), lr=0.1, momentum=0.9)
+    optim = SGD(model.parameters(), lr=0.1, momentum=0.9)
+
+    with DataParallel(model, BinaryCrossEntropyLoss(), num_workers=3, start_method=start_method) as parallel_model:
+        for _ in range(3):
+            reference_optim.zero_grad()
+            expected_loss = BinaryCrossEntropyLoss()(reference(x), y)
+            expected_loss.backward()
+
+            optim.zero_grad()
+            loss = parallel_model.forward_backward(x, y)
+
+            assert np.isclose(loss, expected_loss.item())
+            for a, b in zip(reference.parameters(), model.parameters()):
+                assert np.allclose(a.grad, b.grad)
+
+            reference_optim.step()
+            optim.step()
+
+    for a, b in zip(reference.parameters(), model.parameters()):
+        assert np.allclose(a.data, b.data)
+
+
+def test_float16_embedding_indices_are_not_rounded():
+    from minitorch.nn import Embedding
+
+    # Indices above 2048 can not be stored exactly as float16
+    indices = Tensor([3001, 4093, 2049, 5])
+    y = Tensor([[1.0], [0.0], [1.0], [0.0]])
+
+    def make():
+        return Sequential(Embedding(4096, 4, seed=1), Linear(4, 1, seed=2), Sigmoid()).to("float16")
+
+    reference, model = make(), make()
+    BinaryCrossEntropyLoss()(reference(indices), y).backward()
+
+    with DataParallel(model, BinaryCrossEntropyLoss(), num_workers=2, start_method="fork") as parallel_model:
+        parallel_model.forward_backward(indices, y)
+
+    embedding_grad = model.parameters()[0].grad
+    assert np.flatnonzero(np.abs(embedding_grad).sum(axis=1)).tolist() == [5, 2049, 3001, 4093]
+    for a, b in zip(reference.parameters(), model.parameters()):
+        expected = a.grad.to_dense() if isinstance(a.grad, SparseGrad) else a.grad
+        assert np.allclose(expected, b.grad, atol=1e-3)
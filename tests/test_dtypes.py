@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from minitorch import Tensor
+from minitorch.nn import Embedding, Linear, ReLU, Sigmoid, Sequential, QuantizedLinear, quantize
+
+
+@pytest.mark.parametrize("block_elements", [1, 7, 1 << 18])
+def test_quantized_linear_converts_weights_by_blocks(monkeypatch, block_elements):
+    monkeypatch.setattr(QuantizedLinear, "BLOCK_ELEMENTS", block_elements)
+    rng = np.random.default_rng(0)
+
+    linear = Linear(5, 9, seed=1)
+    quantized = QuantizedLinear(linear)
+    x = Tensor(rng.standard_normal((4, 5)))
+
+    params = dict(linear.named_parameters())
+    expected = x.data @ quantized.dequantized_weights().T + params["bias"].data
+    assert np.allclose(quantized(x).data, expected)
+    assert np.allclose(quantized(x).data, linear(x).data, atol=0.05)
+
+
+def test_quantized_model_matches_float_model():
+    rng = np.random.default_rng(1)
+    model = Sequential(Linear(4, 6, seed=1), ReLU(), Linear(6, 1, seed=2), Sigmoid())
+    x = Tensor(rng.standard_normal((8, 4)))
+
+    output = quantize(model, dtype="float32")(x)
+    assert output.dtype() == np.float32
+    assert np.allclose(output.data, model(x).data, atol=0.02)
+
+
+@pytest.mark.parametrize("fuse", [True, False])
+def test_linear_casts_its_input_to_the_weight_type(fuse):
+    model = Sequential(Linear(2, 3, seed=1), ReLU(), Linear(3, 1, seed=2), fuse=fuse).to("float32")
+    x = Tensor([[0.5, -1.0], [1.0, 2.0]], requires_grad=True)
+
+    output = model(x)
+    assert output.dtype() == np.float32
+
+    output.sum().backward()
+    assert x.grad.dtype == np.float64
+    assert all(p.grad.dtype == np.float32 for p in model.parameters())
+
+
+def test_embedding_rejects_indices_that_may_have_been_rounded():
+    small, large = Embedding(2049, 2, seed=1), Embedding(4096, 2, seed=1)
+    assert small(Tensor([2048], dtype="float16")).shape() == (1, 2)
+    assert np.allclose(large([3001]).data, large.parameters()[0].data[[3001]])
+
+    with pytest.raises(Exception, match="float16"):
+        large(Tensor([3001], dtype="float16"))
@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from minitorch import Tensor
+from minitorch.jit import trace
+from minitorch.nn import Linear, ReLU, Sigmoid, Sequential, BinaryCrossEntropyLoss, quantize
+
+
+def deep_model(fuse):
+    return Sequential(Linear(3, 8, seed=1), ReLU(), Linear(8, 8, seed=2), ReLU(), Linear(8, 8, seed=3), ReLU(),
+                      Linear(8, 4, seed=4), ReLU(), Linear(4, 1, seed=5), Sigmoid(), fuse=fuse)
+
+
+def loss_and_grads(model, x, y):
+    for p in model.parameters():
+        p.grad = None
+    output = model(x)
+    BinaryCrossEntropyLoss()(output, y).backward()
+    return output.data.copy(), [p.grad.copy() for p in model.parameters()]
+
+
+@pytest.mark.parametrize("fuse", [True, False])
+def test_traced_model_matches_eager_on_another_input(fuse):
+    rng = np.random.default_rng(0)
+    model = deep_model(fuse)
+    traced = trace(model, Tensor(rng.standard_normal((5, 3))))
+
+    x, y = Tensor(rng.standard_normal((5, 3))), Tensor(rng.integers(0, 2, (5, 1)))
+    eager_output, eager_grads = loss_and_grads(model, x, y)
+
+    # The second replay reuses the gradient buffers of the first one
+    for _ in range(2):
+        traced_output, traced_grads = loss_and_grads(traced, x, y)
+        assert np.allclose(eager_output, traced_output)
+        assert len(eager_grads) == len(traced_grads)
+        assert all(np.allclose(a, b) for a, b in zip(eager_grads, traced_grads))
+
+
+def test_traced_model_differentiates_its_input():
+    rng = np.random.default_rng(1)
+
+    def f(a):
+        h = a.mul(a) + a
+        return (h.mul(h) * 0.5 + h).sum()
+
+    traced = trace(f, Tensor(rng.standard_normal((2, 3)), requires_grad=True))
+
+    x = Tensor(rng.standard_normal((2, 3)), requires_grad=True)
+    f(x).backward()
+    expected = x.grad.copy()
+
+    x.grad = None
+    traced(x).backward()
+    assert np.allclose(x.grad, expected)
+
+
+def test_trace_rejects_output_that_does_not_depend_on_input():
+    w = Tensor([1.0, 2.0], requires_grad=True)
+    with pytest.raises(Exception, match="does not depend on its input"):
+        trace(lambda a: (w * 2).sum(), Tensor([3.0, 4.0]))
+
+
+def test_trace_rejects_tensors_created_from_data():
+    with pytest.raises(Exception, match="not computed by an operation"):
+        trace(lambda a: a + Tensor([a.data.mean()]), Tensor([3.0, 4.0]))
+
+
+def test_trace_rejects_quantized_layers():
+    quantized = quantize(Sequential(Linear(2, 3, seed=1), ReLU()))
+    head = Linear(3, 1, seed=2)
+    with pytest.raises(Exception, match="not computed by an operation"):
+        trace(lambda a: head(quantized(a)), Tensor([[0, 1], [1, 0]]))
+
+
+def test_traced_embedding_reads_the_indices_of_every_call():
+    from minitorch.nn import Embedding
+
+    embedding = Embedding(10, 3, seed=1)
+    head = Linear(3, 1, seed=2)
+    model = lambda indices: head(embedding(indices))
+    traced = trace(model, Tensor([1, 2, 3]))
+
+    indices = Tensor([7, 0, 7])
+    (weight,) = embedding.parameters()
+
+    model(indices).sum().backward()
+    expected_output, expected_grad = model(indices).data, weight.grad.to_dense()
+    for p in embedding.parameters() + head.parameters():
+        p.grad = None
+
+    output = traced(indices)
+    output.sum().backward()
+    assert np.allclose(output.data, expected_output)
+    # The replay scatters the row-sparse gradient into a dense buffer
+    assert np.allclose(weight.grad, expected_grad)
+
+    with pytest.raises(Exception, match="range"):
+        traced(Tensor([1, 2, 10]))
+
+
+def test_traced_model_rejects_changes_to_requires_grad():
+    model = Sequential(Linear(2, 3, seed=1), ReLU(), Linear(3, 1, seed=2))
+    traced = trace(model, Tensor([[0.0, 1.0]]))
+
+    with pytest.raises(Exception, match="requires_grad"):
+        traced(Tensor([[1.0, 2.0]], requires_grad=True))
+
+    with pytest.raises(Exception, match="float32"):
+        traced(Tensor([[1.0, 2.0]], dtype="float32"))
+
+    weight = model.parameters()[0]
+    weight.requires_grad = False
+    with pytest.raises(Exception, match="frozen"):
+        traced(Tensor([[1.0, 2.0]]))
+
+    weight.requires_grad = True
+    assert traced(Tensor([[1.0, 2.0]])).shape() == (1, 1)
@@ -0,0 +1,15 @@
+import importlib
+import os
+import sys
+
+import numpy as np
+
+
+def test_kernels_import_without_register_at_fork(monkeypatch):
+    monkeypatch.delattr(os, "register_at_fork")
+    kernels = importlib.reload(sys.modules["minitorch.Kernels"])
+    monkeypatch.undo()
+    importlib.reload(kernels)
+
+    a = np.arange(6.0).reshape(2, 3)
+    assert np.allclose(kernels.matmul(a, a.T), a @ a.T)
@@ -0,0 +1,57 @@
+import copy
+import pickle
+
+import numpy as np
+
+from minitorch import Tensor
+from minitorch.nn import Linear, Module, ReLU, Sequential, SparseLinear
+
+
+class Counting(Module):
+    def __init__(self, child):
+        self.child = child
+        self.discoveries = 0
+
+    def discover_parameters(self):
+        self.discoveries += 1
+        return super().discover_parameters()
+
+
+def test_registry_is_kept_when_unrelated_models_change():
+    model = Counting(Linear(2, 3, seed=1))
+    other = Counting(Linear(2, 3, seed=1))
+    model.parameters()
+
+    other.child = Linear(3, 3, seed=2)
+    model.child(Tensor([[1.0, 2.0]]))
+    model.parameters()
+
+    assert model.discoveries == 1
+
+
+def test_registry_is_dropped_when_a_submodule_changes():
+    inner = Counting(Linear(2, 3, seed=1))
+    model = Counting(Sequential(ReLU(), inner))
+    assert len(model.parameters()) == 2
+
+    inner.child = Linear(2, 3, bias=False, seed=1)
+    assert len(model.parameters()) == 1
+    assert model.discoveries == 2
+
+
+def test_copies_and_pickles_keep_dropping_their_parents_registry():
+    for clone in (copy.copy, lambda m: pickle.loads(pickle.dumps(m))):
+        inner = Counting(Linear(2, 3, seed=1))
+        model = clone(Counting(inner))
+        assert len(model.parameters()) == 2
+
+        model.child.child = Linear(2, 3, bias=False, seed=1)
+        assert len(model.parameters()) == 1
+
+
+def test_to_converts_tensors_that_are_not_parameters():
+    model = Sequential(Linear(2, 3, bias=False, seed=1), ReLU(), Linear(3, 1, bias=False, seed=2)).to("float32")
+    assert model(Tensor([[1.0, 2.0]])).dtype() == np.float32
+
+    sparse = SparseLinear(5, 2, bias=False).to("float16")
+    assert sparse(Tensor([[0.0, 1.0, 0.0, 0.0, 2.0]])).dtype() == np.float16
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from minitorch import Tensor
+from minitorch.optim import Adam, AdamW
+
+
+def reference_adam(data, grads, lr, betas, eps, weight_decay, decoupled):
+    m, v = np.zeros_like(data), np.zeros_like(data)
+    for t, grad in enumerate(grads, start=1):
+        if decoupled:
+            data = data * (1 - lr * weight_decay)
+        else:
+            grad = grad + weight_decay * data
+        m = betas[0] * m + (1 - betas[0]) * grad
+        v = betas[1] * v + (1 - betas[1]) * grad**2
+        data = data - lr * (m / (1 - betas[0]**t)) / (np.sqrt(v / (1 - betas[1]**t)) + eps)
+    return data
+
+
+@pytest.mark.parametrize("optimizer, decoupled", [(Adam, False), (AdamW, True)])
+def test_adam_matches_the_reference_update(optimizer, decoupled):
+    rng = np.random.default_rng(0)
+    start = rng.standard_normal((3, 4))
+    grads = [rng.standard_normal((3, 4)) for _ in range(5)]
+
+    param = Tensor(start.copy(), requires_grad=True)
+    optim = optimizer([param], lr=0.1, betas=(0.8, 0.9), eps=1e-3, weight_decay=0.05)
+    for grad in grads:
+        optim.zero_grad()
+        param.grad = grad.copy()
+        optim.step()
+
+    expected = reference_adam(start, grads, 0.1, (0.8, 0.9), 1e-3, 0.05, decoupled)
+    assert np.allclose(param.data, expected)
@@ -0,0 +1,64 @@
+import threading
+
+from minitorch import Tensor
+from minitorch.Autograd import is_grad_enabled, no_grad, set_inference_mode
+from minitorch.Function import recording
+
+
+def run_in_thread(target):
+    errors = []
+
+    def wrapper():
+        try:
+            target()
+        except BaseException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=wrapper)
+    thread.start()
+    thread.join()
+    if errors:
+        raise errors[0]
+
+
+def test_no_grad_only_applies_to_its_thread():
+    inside = threading.Event()
+    checked = threading.Event()
+    seen = {}
+
+    def worker():
+        with no_grad():
+            inside.set()
+            checked.wait(5)
+        seen["after"] = is_grad_enabled()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    inside.wait(5)
+
+    x = Tensor([1.0, 2.0], requires_grad=True)
+    assert is_grad_enabled()
+    assert (x * 2).requires_grad
+
+    checked.set()
+    thread.join()
+    assert seen["after"]
+
+
+def test_inference_mode_only_applies_to_its_thread():
+    def worker():
+        set_inference_mode(True)
+        assert not is_grad_enabled()
+
+    run_in_thread(worker)
+    assert is_grad_enabled()
+
+
+def test_recording_only_sees_its_thread():
+    x = Tensor([1.0, 2.0], requires_grad=True)
+
+    with recording() as tape:
+        run_in_thread(lambda: (x * 3).sum())
+        x * 2
+
+    assert len(tape) == 1